@@ -3,7 +3,8 @@ import asyncio
 import logging
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import jwt
 
@@ -20,10 +21,14 @@ from .providers import auth_provider_from_config, AuthProvider, LoginFlow
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of verified access tokens that are remembered
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 _LOGGER = logging.getLogger(__name__)
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
+_CachedAccessToken = Tuple[models.RefreshToken, float]
 
 
 async def auth_manager_from_config(
@@ -82,6 +87,10 @@ class AuthManager:
         self._store = store
         self._providers = providers
         self._mfa_modules = mfa_modules
+        # Verified access tokens mapped to their refresh token and expiry
+        self._access_token_cache: "OrderedDict[str, _CachedAccessToken]" = (
+            OrderedDict()
+        )
         self.login_flow = data_entry_flow.FlowManager(
             hass, self._async_create_login_flow, self._async_finish_login_flow
         )
@@ -216,6 +225,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(lambda token: token.user is user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -242,6 +252,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactive the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(lambda token: token.user is user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -368,6 +379,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(lambda token: token.id == refresh_token.id)
 
     @callback
     def async_create_access_token(
@@ -391,6 +403,14 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+
+        if cached is not None:
+            cached_token, expire = cached
+            if time.time() < expire and cached_token.user.is_active:
+                return cached_token
+            self._access_token_cache.pop(token, None)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -408,15 +428,31 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._access_token_cache[token] = (refresh_token, claims["exp"])
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matches: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget verified access tokens of matching refresh tokens."""
+        for token, (refresh_token, _) in list(self._access_token_cache.items()):
+            if matches(refresh_token):
+                del self._access_token_cache[token]
+
     async def _async_create_login_flow(
         self, handler: _ProviderKey, *, context: Optional[Dict], data: Optional[Any]
     ) -> data_entry_flow.FlowHandler:
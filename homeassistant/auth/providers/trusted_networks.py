@@ -11,6 +11,7 @@ import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.network import NetworkSet
 from . import AuthProvider, AUTH_PROVIDER_SCHEMA, AUTH_PROVIDERS, LoginFlow
 from ..models import Credentials, UserMeta
 
@@ -62,6 +63,11 @@ class TrustedNetworksAuthProvider(AuthProvider):
 
     DEFAULT_TITLE = "Trusted Networks"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the trusted networks auth provider."""
+        super().__init__(*args, **kwargs)
+        self._trusted_network_set = NetworkSet(self.trusted_networks)
+
     @property
     def trusted_networks(self) -> List[IPNetwork]:
         """Return trusted networks."""
@@ -157,9 +163,7 @@ class TrustedNetworksAuthProvider(AuthProvider):
         if not self.trusted_networks:
             raise InvalidAuthError("trusted_networks is not configured")
 
-        if not any(
-            ip_addr in trusted_network for trusted_network in self.trusted_networks
-        ):
+        if ip_addr not in self._trusted_network_set:
             raise InvalidAuthError("Not in trusted_networks")
 
 
@@ -5,14 +5,16 @@ import logging.handlers
 import os
 import sys
 from time import time
+from timeit import default_timer as timer
 from collections import OrderedDict
 from typing import Any, Optional, Dict, Set
 
 import voluptuous as vol
 
 from homeassistant import core, config as conf_util, config_entries, loader
-from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
-from homeassistant.setup import async_setup_component
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_START
+from homeassistant.setup import async_get_setup_timings, async_setup_component
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.util.logging import AsyncHandler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -55,6 +57,7 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = time()
+    timings = async_get_setup_timings(hass)
 
     if enable_log:
         async_enable_logging(hass, verbose, log_rotate_days, log_file, log_no_color)
@@ -92,6 +95,19 @@ async def async_from_config_dict(
 
     await _async_set_up_integrations(hass, config)
 
+    async def async_save_setup_timings(event: core.Event) -> None:
+        """Store the setup timings once everything is started."""
+        _LOGGER.info(
+            "Slowest imports: %s",
+            ", ".join(
+                f"{module} ({duration:.2f}s)"
+                for module, duration in loader.slowest_imports(hass)
+            ),
+        )
+        await timings.async_save()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_save_setup_timings)
+
     stop = time()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
@@ -136,7 +152,9 @@ async def async_from_config_file(
 
     try:
         config_dict = await hass.async_add_executor_job(
-            conf_util.load_yaml_config_file, config_path
+            conf_util.load_yaml_config_file,
+            config_path,
+            hass.config.path(STORAGE_DIR, conf_util.YAML_CACHE_DIR),
         )
     except HomeAssistantError as err:
         _LOGGER.error("Error loading %s: %s", config_path, err)
@@ -354,6 +372,8 @@ async def _async_set_up_integrations(
         if isinstance(int_or_exc, loader.Integration) and int_or_exc.after_dependencies:
             after_dependencies[int_or_exc.domain] = set(int_or_exc.after_dependencies)
 
+    timings = async_get_setup_timings(hass)
+    stage_2_start = timer()
     last_load = None
     while stage_2_domains:
         domains_to_load = set()
@@ -370,6 +390,9 @@ async def _async_set_up_integrations(
 
         _LOGGER.debug("Setting up %s", domains_to_load)
 
+        for domain in domains_to_load & after_dependencies.keys():
+            timings.async_record(domain, "after_dependencies", stage_2_start, timer())
+
         await asyncio.gather(
             *(async_setup_component(hass, domain, config) for domain in domains_to_load)
         )
@@ -1 +1,58 @@
 """The filter component."""
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
+
+DOMAIN = "filter"
+DATA_FILTER_SENSORS = "filter_sensors"
+
+EVENT_FILTER_BACKFILL = "filter_backfill"
+SERVICE_BACKFILL = "backfill"
+
+ATTR_END_TIME = "end_time"
+ATTR_START_TIME = "start_time"
+ATTR_STATES = "states"
+
+# Bounds of a backfill, so its result fits in a single event
+MAX_BACKFILL_PERIOD = timedelta(days=1)
+MAX_BACKFILL_STATES = 1000
+
+BACKFILL_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_START_TIME): cv.datetime,
+        vol.Optional(ATTR_END_TIME): cv.datetime,
+    }
+)
+
+
+async def async_setup(hass, config):
+    """Set up the backfill service of the filter sensors."""
+    hass.data[DATA_FILTER_SENSORS] = []
+
+    async def async_handle_backfill(call):
+        """Recompute the filtered states of a past period."""
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        start_time = dt_util.as_utc(call.data[ATTR_START_TIME])
+        end_time = dt_util.as_utc(call.data.get(ATTR_END_TIME, dt_util.utcnow()))
+
+        if end_time - start_time > MAX_BACKFILL_PERIOD:
+            raise HomeAssistantError(
+                f"Backfill period is longer than {MAX_BACKFILL_PERIOD}, "
+                "use a shorter period"
+            )
+
+        for filter_sensor in list(hass.data[DATA_FILTER_SENSORS]):
+            if entity_ids is None or filter_sensor.entity_id in entity_ids:
+                await filter_sensor.async_backfill(start_time, end_time)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BACKFILL, async_handle_backfill, schema=BACKFILL_SERVICE_SCHEMA
+    )
+
+    return True
@@ -4,8 +4,7 @@ import statistics
 from collections import deque, Counter
 from numbers import Number
 from functools import partial
-from copy import copy
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional
 
 import voluptuous as vol
@@ -28,6 +27,21 @@ from homeassistant.helpers.event import async_track_state_change
 from homeassistant.components import history
 import homeassistant.util.dt as dt_util
 
+from . import (
+    ATTR_END_TIME,
+    ATTR_START_TIME,
+    ATTR_STATES,
+    DATA_FILTER_SENSORS,
+    EVENT_FILTER_BACKFILL,
+    MAX_BACKFILL_STATES,
+)
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import as_strided
+except ImportError:  # pragma: no cover
+    np = None
+
 _LOGGER = logging.getLogger(__name__)
 
 FILTER_NAME_RANGE = "range"
@@ -61,6 +75,12 @@ DEFAULT_FILTER_TIME_CONSTANT = 10
 NAME_TEMPLATE = "{} filter"
 ICON = "mdi:chart-line-variant"
 
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Maximum number of window values the outlier filter sorts at once
+OUTLIER_CHUNK_SIZE = 1000000
+
 FILTER_SCHEMA = vol.Schema(
     {vol.Optional(CONF_FILTER_PRECISION, default=DEFAULT_PRECISION): vol.Coerce(int)}
 )
@@ -153,24 +173,73 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     name = config.get(CONF_NAME)
     entity_id = config.get(CONF_ENTITY_ID)
 
-    filters = [
-        FILTERS[_filter.pop(CONF_FILTER_NAME)](entity=entity_id, **_filter)
-        for _filter in config[CONF_FILTERS]
+    async_add_entities([SensorFilter(name, entity_id, config[CONF_FILTERS])])
+
+
+def create_filters(entity_id, filter_configs):
+    """Create a new chain of filters from their configuration."""
+    return [
+        FILTERS[_filter[CONF_FILTER_NAME]](
+            entity=entity_id,
+            **{key: value for key, value in _filter.items() if key != CONF_FILTER_NAME},
+        )
+        for _filter in filter_configs
     ]
 
-    async_add_entities([SensorFilter(name, entity_id, filters)])
+
+def filter_values(filters, values, timestamps):
+    """Run lists of values through a chain of filters one value at a time.
+
+    Timestamps are in microseconds since the epoch. Returns the values and
+    timestamps that pass all filters.
+    """
+    result_values = []
+    result_timestamps = []
+
+    for value, timestamp in zip(values, timestamps):
+        for filt in filters:
+            filtered = filt.filter_value(value, timestamp)
+            if filt.skip_processing:
+                break
+            value = filtered
+        else:
+            result_values.append(value)
+            result_timestamps.append(timestamp)
+
+    return result_values, result_timestamps
+
+
+def filter_arrays(filters, values, timestamps):
+    """Run NumPy arrays of values through a chain of filters.
+
+    Timestamps are in microseconds since the epoch. Returns the values and
+    timestamps that pass all filters. The filters end up in the same state
+    as if the values were filtered one by one.
+    """
+    for filt in filters:
+        if not values.size:
+            break
+
+        values, passed = filt.filter_array(values, timestamps)
+
+        if passed is not None:
+            values = values[passed]
+            timestamps = timestamps[passed]
+
+    return values, timestamps
 
 
 class SensorFilter(Entity):
     """Representation of a Filter Sensor."""
 
-    def __init__(self, name, entity_id, filters):
+    def __init__(self, name, entity_id, filter_configs):
         """Initialize the sensor."""
         self._name = name
         self._entity = entity_id
         self._unit_of_measurement = None
         self._state = None
-        self._filters = filters
+        self._filter_configs = filter_configs
+        self._filters = create_filters(entity_id, filter_configs)
         self._icon = None
 
     async def async_added_to_hass(self):
@@ -182,34 +251,28 @@ class SensorFilter(Entity):
             if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
                 return
 
-            temp_state = new_state
+            value = _state_value(new_state.state)
+            timestamp = _timestamp(new_state.last_updated)
 
             try:
                 for filt in self._filters:
-                    filtered_state = filt.filter_state(copy(temp_state))
+                    filtered = filt.filter_value(value, timestamp)
                     _LOGGER.debug(
                         "%s(%s=%s) -> %s",
                         filt.name,
                         self._entity,
-                        temp_state.state,
-                        "skip" if filt.skip_processing else filtered_state.state,
+                        value,
+                        "skip" if filt.skip_processing else filtered,
                     )
                     if filt.skip_processing:
                         return
-                    temp_state = filtered_state
-            except ValueError:
-                _LOGGER.error("Could not convert state: %s to number", self._state)
+                    value = filtered
+            except (TypeError, ValueError):
+                _LOGGER.error("Could not convert state: %s to number", new_state.state)
                 return
 
-            self._state = temp_state.state
-
-            if self._icon is None:
-                self._icon = new_state.attributes.get(ATTR_ICON, ICON)
-
-            if self._unit_of_measurement is None:
-                self._unit_of_measurement = new_state.attributes.get(
-                    ATTR_UNIT_OF_MEASUREMENT
-                )
+            self._state = value
+            self._update_attributes(new_state)
 
             if update_ha:
                 self.async_schedule_update_ha_state()
@@ -271,12 +334,75 @@ class SensorFilter(Entity):
             )
 
             # Replay history through the filter chain
-            prev_state = None
-            for state in history_list:
-                filter_sensor_state_listener(self._entity, prev_state, state, False)
-                prev_state = state
+            values, _ = _filter_history(self._filters, history_list)
+
+            if values:
+                self._state = values[-1]
+                self._update_attributes(history_list[-1])
 
         async_track_state_change(self.hass, self._entity, filter_sensor_state_listener)
+        self.hass.data[DATA_FILTER_SENSORS].append(self)
+
+    async def async_will_remove_from_hass(self):
+        """Stop offering the sensor for backfills."""
+        self.hass.data[DATA_FILTER_SENSORS].remove(self)
+
+    @callback
+    def _update_attributes(self, new_state):
+        """Take the icon and unit from the first filtered source state."""
+        if self._icon is None:
+            self._icon = new_state.attributes.get(ATTR_ICON, ICON)
+
+        if self._unit_of_measurement is None:
+            self._unit_of_measurement = new_state.attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            )
+
+    async def async_backfill(self, start_time, end_time=None):
+        """Filter the recorded source states of a past period.
+
+        A new chain of filters starts at start_time, so the live filters
+        are left alone. The filtered states are fired in an event.
+        """
+        filter_history = await self.hass.async_add_job(
+            partial(
+                history.state_changes_during_period,
+                self.hass,
+                start_time,
+                end_time,
+                entity_id=self._entity,
+            )
+        )
+        values, timestamps = _filter_history(
+            create_filters(self._entity, self._filter_configs),
+            filter_history.get(self._entity, []),
+        )
+
+        if len(values) > MAX_BACKFILL_STATES:
+            _LOGGER.error(
+                "Could not backfill %s: %d states, more than %d. "
+                "Use a shorter period",
+                self.entity_id,
+                len(values),
+                MAX_BACKFILL_STATES,
+            )
+            return
+
+        self.hass.bus.async_fire(
+            EVENT_FILTER_BACKFILL,
+            {
+                ATTR_ENTITY_ID: self.entity_id,
+                ATTR_START_TIME: start_time,
+                ATTR_END_TIME: end_time,
+                ATTR_STATES: [
+                    {
+                        "state": value,
+                        "last_updated": EPOCH + timestamp * ONE_MICROSECOND,
+                    }
+                    for value, timestamp in zip(values, timestamps)
+                ],
+            },
+        )
 
     @property
     def name(self):
@@ -310,33 +436,62 @@ class SensorFilter(Entity):
         return state_attr
 
 
-class FilterState:
-    """State abstraction for filter usage."""
+def _state_value(state):
+    """Return a state as a number if possible."""
+    try:
+        return float(state)
+    except ValueError:
+        return state
+
+
+def _timestamp(last_updated):
+    """Return a datetime in microseconds since the epoch."""
+    return (last_updated - EPOCH) // ONE_MICROSECOND
+
+
+def _round(value, precision):
+    """Round number based values to precision."""
+    if isinstance(value, Number):
+        return round(float(value), precision)
+    return value
 
-    def __init__(self, state):
-        """Initialize with HA State object."""
-        self.timestamp = state.last_updated
+
+def _filter_history(filters, states):
+    """Run recorded states through a chain of filters.
+
+    States that are not numbers are left out, like the live filters do.
+    The values are filtered as arrays if NumPy is available. Returns lists
+    of the values and timestamps that pass all filters.
+    """
+    values = []
+    timestamps = []
+
+    for state in states:
         try:
-            self.state = float(state.state)
+            value = float(state.state)
         except ValueError:
-            self.state = state.state
+            continue
+        values.append(value)
+        timestamps.append(_timestamp(state.last_updated))
 
-    def set_precision(self, precision):
-        """Set precision of Number based states."""
-        if isinstance(self.state, Number):
-            self.state = round(float(self.state), precision)
+    if np is None:
+        return filter_values(filters, values, timestamps)
 
-    def __str__(self):
-        """Return state as the string representation of FilterState."""
-        return str(self.state)
-
-    def __repr__(self):
-        """Return timestamp and state as the representation of FilterState."""
-        return f"{self.timestamp} : {self.state}"
+    values, timestamps = filter_arrays(
+        filters,
+        np.array(values, dtype=np.float64),
+        np.array(timestamps, dtype=np.int64),
+    )
+    return values.tolist(), timestamps.tolist()
 
 
 class Filter:
-    """Filter skeleton."""
+    """Filter skeleton.
+
+    Filters keep the state they need between values. filter_value filters
+    a single value, filter_array runs a whole array through the filter and
+    leaves it in the same state.
+    """
 
     def __init__(
         self,
@@ -352,17 +507,14 @@ class Filter:
         :param entity: used for debugging only
         """
         if isinstance(window_size, int):
-            self.states = deque(maxlen=window_size)
             self.window_unit = WINDOW_SIZE_UNIT_NUMBER_EVENTS
         else:
-            self.states = deque(maxlen=0)
             self.window_unit = WINDOW_SIZE_UNIT_TIME
         self.precision = precision
         self._name = name
         self._entity = entity
         self._skip_processing = False
         self._window_size = window_size
-        self._store_raw = False
 
     @property
     def window_size(self):
@@ -379,19 +531,35 @@ class Filter:
         """Return wether the current filter_state should be skipped."""
         return self._skip_processing
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement filter."""
         raise NotImplementedError()
 
+    def _filter_array(self, values, timestamps):
+        """Implement filter for arrays.
+
+        Returns the filtered values and a mask of the values that are not
+        skipped, or None if no value is skipped.
+        """
+        raise NotImplementedError()
+
+    def filter_value(self, value, timestamp):
+        """Filter a value, the timestamp is in microseconds since the epoch."""
+        return _round(self._filter_value(value, timestamp), self.precision)
+
+    def filter_array(self, values, timestamps):
+        """Filter arrays of values and timestamps."""
+        values, passed = self._filter_array(values, timestamps)
+        # np.round scales the values before rounding them half to even, so
+        # a value that is close to half way can round to the other side
+        # than round() does, in the last digit of the precision
+        return np.round(values, self.precision or 0), passed
+
     def filter_state(self, new_state):
-        """Implement a common interface for filters."""
-        filtered = self._filter_state(FilterState(new_state))
-        filtered.set_precision(self.precision)
-        if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
-        else:
-            self.states.append(copy(filtered))
-        new_state.state = filtered.state
+        """Filter the state of a State object."""
+        new_state.state = self.filter_value(
+            _state_value(new_state.state), _timestamp(new_state.last_updated)
+        )
         return new_state
 
 
@@ -420,9 +588,9 @@ class RangeFilter(Filter):
         self._upper_bound = upper_bound
         self._stats_internal = Counter()
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the range filter."""
-        if self._upper_bound is not None and new_state.state > self._upper_bound:
+        if self._upper_bound is not None and value > self._upper_bound:
 
             self._stats_internal["erasures_up"] += 1
 
@@ -430,11 +598,11 @@ class RangeFilter(Filter):
                 "Upper outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_up"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = self._upper_bound
+            value = self._upper_bound
 
-        elif self._lower_bound is not None and new_state.state < self._lower_bound:
+        elif self._lower_bound is not None and value < self._lower_bound:
 
             self._stats_internal["erasures_low"] += 1
 
@@ -442,11 +610,27 @@ class RangeFilter(Filter):
                 "Lower outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_low"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = self._lower_bound
+            value = self._lower_bound
 
-        return new_state
+        return value
+
+    def _filter_array(self, values, timestamps):
+        """Implement the range filter for arrays."""
+        upper = np.zeros(values.shape, dtype=bool)
+
+        if self._upper_bound is not None:
+            upper = values > self._upper_bound
+            self._stats_internal["erasures_up"] += np.count_nonzero(upper)
+            values = np.where(upper, self._upper_bound, values)
+
+        if self._lower_bound is not None:
+            lower = ~upper & (values < self._lower_bound)
+            self._stats_internal["erasures_low"] += np.count_nonzero(lower)
+            values = np.where(lower, self._lower_bound, values)
+
+        return values, None
 
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
@@ -464,15 +648,16 @@ class OutlierFilter(Filter):
         super().__init__(FILTER_NAME_OUTLIER, window_size, precision, entity)
         self._radius = radius
         self._stats_internal = Counter()
-        self._store_raw = True
+        self._window = deque(maxlen=window_size)
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the outlier filter."""
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
-        if (
-            len(self.states) == self.states.maxlen
-            and abs(new_state.state - median) > self._radius
-        ):
+        window = self._window
+        median = statistics.median(window) if window else 0
+        full = len(window) == window.maxlen
+        window.append(value)
+
+        if full and abs(value - median) > self._radius:
 
             self._stats_internal["erasures"] += 1
 
@@ -480,10 +665,46 @@ class OutlierFilter(Filter):
                 "Outlier nr. %s in %s: %s",
                 self._stats_internal["erasures"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = median
-        return new_state
+            return median
+        return value
+
+    def _filter_array(self, values, timestamps):
+        """Implement the outlier filter for arrays.
+
+        The median of the window before each value is computed on a strided
+        view of the previous and new values, without copying the windows.
+        """
+        size = self._window.maxlen
+        previous = len(self._window)
+        data = np.concatenate((np.array(self._window, dtype=np.float64), values))
+        self._window.extend(values[-size:].tolist())
+
+        # The window is full from the value at index size of data onwards
+        first = max(size, previous)
+
+        if first >= data.size:
+            return values, None
+
+        windows = as_strided(
+            data,
+            shape=(data.size - size, size),
+            strides=(data.strides[0], data.strides[0]),
+        )
+        rows = max(1, OUTLIER_CHUNK_SIZE // size)
+        medians = np.concatenate(
+            [
+                np.median(windows[start : start + rows], axis=1)
+                for start in range(first - size, data.size - size, rows)
+            ]
+        )
+        checked = values[first - previous :]
+        outliers = np.abs(checked - medians) > self._radius
+        self._stats_internal["erasures"] += np.count_nonzero(outliers)
+        values = values.copy()
+        values[first - previous :] = np.where(outliers, medians, checked)
+        return values, None
 
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
@@ -494,26 +715,50 @@ class LowPassFilter(Filter):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_LOWPASS, window_size, precision, entity)
         self._time_constant = time_constant
+        self._last = None
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the low pass filter."""
-        if not self.states:
-            return new_state
+        if self._last is None:
+            return value
 
         new_weight = 1.0 / self._time_constant
         prev_weight = 1.0 - new_weight
-        new_state.state = (
-            prev_weight * self.states[-1].state + new_weight * new_state.state
-        )
+        return prev_weight * self._last + new_weight * value
 
-        return new_state
+    def filter_value(self, value, timestamp):
+        """Filter a value and remember the rounded result."""
+        self._last = super().filter_value(value, timestamp)
+        return self._last
+
+    def _filter_array(self, values, timestamps):
+        """Implement the low pass filter for arrays.
+
+        Every value depends on the rounded previous result, so this is the
+        one filter that loops over the values.
+        """
+        new_weight = 1.0 / self._time_constant
+        prev_weight = 1.0 - new_weight
+        last = self._last
+        filtered = []
+
+        for value in values.tolist():
+            if last is not None:
+                value = prev_weight * last + new_weight * value
+            last = round(value, self.precision)
+            filtered.append(last)
+
+        self._last = last
+        return np.array(filtered, dtype=np.float64), None
 
 
 @FILTERS.register(FILTER_NAME_TIME_SMA)
 class TimeSMAFilter(Filter):
     """Simple Moving Average (SMA) Filter.
 
-    The window_size is determined by time, and SMA is time weighted.
+    The window_size is determined by time, and SMA is time weighted. The
+    area under the values between the oldest and the newest value in the
+    queue is kept up to date as values come and go.
     """
 
     def __init__(
@@ -524,34 +769,78 @@ class TimeSMAFilter(Filter):
         :param type: type of algorithm used to connect discrete values
         """
         super().__init__(FILTER_NAME_TIME_SMA, window_size, precision, entity)
-        self._time_window = window_size
+        self._time_window = window_size // ONE_MICROSECOND
         self.last_leak = None
         self.queue = deque()
+        self._area = 0.0
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
-        while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
+        queue = self.queue
+
+        while queue and queue[0][0] + self._time_window <= left_boundary:
+            self.last_leak = queue.popleft()
+
+            if queue:
+                self._area -= (queue[0][0] - self.last_leak[0]) * self.last_leak[1]
             else:
-                return
+                self._area = 0.0
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the Simple Moving Average filter."""
-        self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
+        self._leak(timestamp)
 
-        moving_sum = 0
-        start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        if self.queue:
+            last_timestamp, last_value = self.queue[-1]
+            self._area += (timestamp - last_timestamp) * last_value
 
-        new_state.state = moving_sum / self._time_window.total_seconds()
+        self.queue.append((timestamp, value))
 
-        return new_state
+        start = timestamp - self._time_window
+        first_timestamp = self.queue[0][0]
+        prev_value = (self.last_leak or self.queue[0])[1]
+        moving_sum = (first_timestamp - start) * prev_value + self._area
+
+        return moving_sum / self._time_window
+
+    def _filter_array(self, values, timestamps):
+        """Implement the Simple Moving Average filter for arrays.
+
+        The area under the values is a cumulative sum, the first value
+        in the window of every value is found by a binary search.
+        """
+        known = ([self.last_leak] if self.last_leak else []) + list(self.queue)
+        all_timestamps = np.concatenate(
+            (np.array([item[0] for item in known], dtype=np.int64), timestamps)
+        )
+        all_values = np.concatenate(
+            (np.array([item[1] for item in known], dtype=np.float64), values)
+        )
+        area = np.concatenate(
+            ([0.0], np.cumsum(np.diff(all_timestamps) * all_values[:-1]))
+        )
+
+        current = np.arange(len(known), all_values.size)
+        starts = all_timestamps[current] - self._time_window
+        firsts = np.searchsorted(all_timestamps, starts, side="right")
+        prev_values = all_values[np.maximum(firsts - 1, 0)]
+        moving_sums = (all_timestamps[firsts] - starts) * prev_values + (
+            area[current] - area[firsts]
+        )
+
+        # Continue from the window of the last value
+        first = firsts[-1]
+        if first:
+            self.last_leak = (
+                all_timestamps[first - 1].item(),
+                all_values[first - 1].item(),
+            )
+        self.queue = deque(
+            zip(all_timestamps[first:].tolist(), all_values[first:].tolist())
+        )
+        self._area = area[-1].item() - area[first].item()
+
+        return moving_sums / self._time_window, None
 
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
@@ -564,16 +853,27 @@ class ThrottleFilter(Filter):
     def __init__(self, window_size, precision, entity):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_THROTTLE, window_size, precision, entity)
+        self._count = 0
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the throttle filter."""
-        if not self.states or len(self.states) == self.states.maxlen:
-            self.states.clear()
+        if self._count in (0, self._window_size):
+            self._count = 0
             self._skip_processing = False
         else:
             self._skip_processing = True
 
-        return new_state
+        self._count += 1
+        return value
+
+    def _filter_array(self, values, timestamps):
+        """Implement the throttle filter for arrays."""
+        count = self._count or self._window_size
+        positions = np.arange(count, count + values.size)
+        passed = positions % self._window_size == 0
+        self._count = positions[-1].item() % self._window_size + 1
+        self._skip_processing = not passed[-1]
+        return values, passed
 
 
 @FILTERS.register(FILTER_NAME_TIME_THROTTLE)
@@ -586,16 +886,36 @@ class TimeThrottleFilter(Filter):
     def __init__(self, window_size, precision, entity):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_TIME_THROTTLE, window_size, precision, entity)
-        self._time_window = window_size
+        self._time_window = window_size // ONE_MICROSECOND
         self._last_emitted_at = None
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, value, timestamp):
         """Implement the filter."""
-        window_start = new_state.timestamp - self._time_window
-        if not self._last_emitted_at or self._last_emitted_at <= window_start:
-            self._last_emitted_at = new_state.timestamp
+        window_start = timestamp - self._time_window
+        if self._last_emitted_at is None or self._last_emitted_at <= window_start:
+            self._last_emitted_at = timestamp
             self._skip_processing = False
         else:
             self._skip_processing = True
 
-        return new_state
+        return value
+
+    def _filter_array(self, values, timestamps):
+        """Implement the filter for arrays, jumping from sample to sample."""
+        passed = np.zeros(values.shape, dtype=bool)
+        index = 0
+
+        if self._last_emitted_at is not None:
+            index = np.searchsorted(
+                timestamps, self._last_emitted_at + self._time_window
+            )
+
+        while index < values.size:
+            passed[index] = True
+            self._last_emitted_at = timestamps[index].item()
+            index = np.searchsorted(
+                timestamps, self._last_emitted_at + self._time_window
+            )
+
+        self._skip_processing = not passed[-1]
+        return values, passed
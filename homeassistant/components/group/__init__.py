@@ -1,7 +1,7 @@
 """Provide the functionality to group entities."""
 import asyncio
 import logging
-from typing import Any, Iterable, List, Optional, cast
+from typing import Any, Iterable, List, Optional, Set, cast
 
 import voluptuous as vol
 
@@ -152,6 +152,7 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
     Async friendly.
     """
     found_ids: List[str] = []
+    seen_ids: Set[str] = set()
     for entity_id in entity_ids:
         if not isinstance(entity_id, str):
             continue
@@ -167,14 +168,14 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
                 if entity_id in child_entities:
                     child_entities = list(child_entities)
                     child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+                for ent_id in expand_entity_ids(hass, child_entities):
+                    if ent_id not in seen_ids:
+                        seen_ids.add(ent_id)
+                        found_ids.append(ent_id)
 
             else:
-                if entity_id not in found_ids:
+                if entity_id not in seen_ids:
+                    seen_ids.add(entity_id)
                     found_ids.append(entity_id)
 
         except AttributeError:
@@ -41,6 +41,11 @@ CONFIG_SCHEMA = vol.Schema(
 SIGNIFICANT_DOMAINS = ("thermostat", "climate", "water_heater")
 IGNORE_DOMAINS = ("zone", "scene")
 
+FORMAT_COLUMNAR = "columnar"
+
+# Number of rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 1000
+
 
 def get_significant_states(
     hass,
@@ -61,27 +66,12 @@ def get_significant_states(
     from homeassistant.components.recorder.models import States
 
     with session_scope(hass=hass) as session:
-        query = session.query(States).filter(
-            (
-                States.domain.in_(SIGNIFICANT_DOMAINS)
-                | (States.last_changed == States.last_updated)
-            )
-            & (States.last_updated > start_time)
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters
         )
-
-        if filters:
-            query = filters.apply(query, entity_ids)
-
-        if end_time is not None:
-            query = query.filter(States.last_updated < end_time)
-
         query = query.order_by(States.last_updated)
 
-        states = (
-            state
-            for state in execute(query)
-            if (_is_significant(state) and not state.attributes.get(ATTR_HIDDEN, False))
-        )
+        states = (state for state in execute(query) if _is_shown(state))
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
@@ -92,6 +82,83 @@ def get_significant_states(
     )
 
 
+def stream_significant_states(
+    hass,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+):
+    """Yield the significant states during a period, one list per entity.
+
+    Unlike get_significant_states, rows are fetched in batches and only the
+    states of one entity are kept in memory at a time. Entities are yielded
+    in entity_id order, followed by the entities that only have a state at
+    start_time.
+    """
+    from homeassistant.components.recorder.models import States
+
+    start_states = {}
+    if include_start_time_state:
+        for state in get_states(hass, start_time, entity_ids, filters=filters):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_states[state.entity_id] = state
+
+    with session_scope(hass=hass) as session:
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters
+        )
+        query = query.order_by(States.entity_id, States.last_updated).yield_per(
+            STREAM_BATCH_SIZE
+        )
+
+        states = (
+            state
+            for state in (row.to_native() for row in query)
+            if state is not None and _is_shown(state)
+        )
+
+        for ent_id, group in groupby(states, lambda state: state.entity_id):
+            entity_states = list(group)
+            start_state = start_states.pop(ent_id, None)
+            if start_state is not None:
+                entity_states.insert(0, start_state)
+            yield entity_states
+
+    for state in start_states.values():
+        yield [state]
+
+
+def states_to_columns(states):
+    """Convert the states of one entity into a compact columnar format.
+
+    Returns the timestamps and states as parallel lists. Attributes are only
+    included when they differ from the previous state, otherwise None.
+    """
+    timestamps = []
+    values = []
+    attributes = []
+    last_attributes = None
+
+    for state in states:
+        timestamps.append(state.last_updated.timestamp())
+        values.append(state.state)
+        if state.attributes == last_attributes:
+            attributes.append(None)
+        else:
+            last_attributes = state.attributes
+            attributes.append(dict(last_attributes))
+
+    return {
+        "entity_id": states[0].entity_id,
+        "timestamps": timestamps,
+        "states": values,
+        "attributes": attributes,
+    }
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     from homeassistant.components.recorder.models import States
@@ -332,9 +399,23 @@ class HistoryPeriodView(HomeAssistantView):
         if entity_ids:
             entity_ids = entity_ids.lower().split(",")
         include_start_time_state = "skip_initial_state" not in request.query
+        columnar = request.query.get("format") == FORMAT_COLUMNAR
 
         hass = request.app["hass"]
 
+        if "stream" in request.query:
+            return await self.json_stream(
+                request,
+                _stream_history,
+                columnar,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+            )
+
         result = await hass.async_add_job(
             get_significant_states,
             hass,
@@ -362,6 +443,9 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result.extend(result)
             result = sorted_result
 
+        if columnar:
+            result = [states_to_columns(states) for states in result]
+
         return await hass.async_add_job(self.json, result)
 
 
@@ -430,6 +514,38 @@ class Filters:
         return query
 
 
+def _stream_history(columnar, *args):
+    """Yield the data of each entity for a streamed history response."""
+    for states in stream_significant_states(*args):
+        yield states_to_columns(states) if columnar else states
+
+
+def _significant_states_query(session, start_time, end_time, entity_ids, filters):
+    """Return the query for significant states during a period."""
+    from homeassistant.components.recorder.models import States
+
+    query = session.query(States).filter(
+        (
+            States.domain.in_(SIGNIFICANT_DOMAINS)
+            | (States.last_changed == States.last_updated)
+        )
+        & (States.last_updated > start_time)
+    )
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+
+    return query
+
+
+def _is_shown(state):
+    """Test if a state should be included in the history."""
+    return _is_significant(state) and not state.attributes.get(ATTR_HIDDEN, False)
+
+
 def _is_significant(state):
     """Test if state is significant for history charts.
 
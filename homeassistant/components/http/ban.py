@@ -1,7 +1,7 @@
 """Ban logic for HTTP component."""
 from collections import defaultdict
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import ip_address, ip_network
 import logging
 from typing import List, Optional
 
@@ -13,6 +13,7 @@ from homeassistant.config import load_yaml_config_file
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util.network import NetworkSet
 from homeassistant.util.yaml import dump
 
 from .const import KEY_REAL_IP
@@ -23,6 +24,7 @@ from .const import KEY_REAL_IP
 _LOGGER = logging.getLogger(__name__)
 
 KEY_BANNED_IPS = "ha_banned_ips"
+KEY_BANNED_NETWORKS = "ha_banned_networks"
 KEY_FAILED_LOGIN_ATTEMPTS = "ha_failed_login_attempts"
 KEY_LOGIN_THRESHOLD = "ha_login_threshold"
 
@@ -49,6 +51,9 @@ def setup_bans(hass, app, login_threshold):
         app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
             hass, hass.config.path(IP_BANS_FILE)
         )
+        app[KEY_BANNED_NETWORKS] = NetworkSet(
+            ip_ban.ip_address for ip_ban in app[KEY_BANNED_IPS]
+        )
 
     app.on_startup.append(ban_startup)
 
@@ -61,12 +66,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = request[KEY_REAL_IP]
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if request[KEY_REAL_IP] in request.app[KEY_BANNED_NETWORKS]:
         raise HTTPForbidden()
 
     try:
@@ -119,6 +119,7 @@ async def process_wrong_login(request):
     ):
         new_ban = IpBan(remote_addr)
         request.app[KEY_BANNED_IPS].append(new_ban)
+        request.app[KEY_BANNED_NETWORKS].add(new_ban.ip_address)
 
         await hass.async_add_job(
             update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
@@ -157,11 +158,14 @@ async def process_success_login(request):
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
     def __init__(self, ip_ban: str, banned_at: Optional[datetime] = None) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        if "/" in str(ip_ban):
+            self.ip_address = ip_network(ip_ban, strict=False)
+        else:
+            self.ip_address = ip_address(ip_ban)
         self.banned_at = banned_at or datetime.utcnow()
 
 
@@ -184,6 +188,9 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBa
         except vol.Invalid as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
+        except ValueError as err:
+            _LOGGER.error("Failed to load IP ban %s: %s", ip_ban, err)
+            continue
 
     return ip_list
 
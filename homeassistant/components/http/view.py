@@ -2,6 +2,7 @@
 import asyncio
 import json
 import logging
+import threading
 from typing import List, Optional
 
 from aiohttp import web
@@ -21,6 +22,11 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Encoded items are handed to the event loop in chunks of about this size
+STREAM_CHUNK_SIZE = 64 * 1024
+# Encoded chunks that may wait for a slow client
+STREAM_QUEUE_SIZE = 4
+
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -61,6 +67,78 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    async def json_stream(self, request, items_func, *args):
+        """Stream the items yielded by items_func as a JSON array.
+
+        items_func is run with args in an executor job, which also encodes
+        the items. The encoded items are written to the response in chunks
+        while items_func is still running. At most STREAM_QUEUE_SIZE chunks
+        wait for the client, items_func is paused until it catches up.
+        """
+        hass = request.app[KEY_HASS]
+        chunks: asyncio.Queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(chunk):
+            """Wait until the event loop has room for the chunk."""
+            if not stop.is_set():
+                asyncio.run_coroutine_threadsafe(chunks.put(chunk), hass.loop).result()
+
+        def produce():
+            """Encode the items and hand them to the event loop in chunks."""
+            chunk = []
+            size = 0
+            try:
+                for item in items_func(*args):
+                    if stop.is_set():
+                        return
+                    encoded = json.dumps(
+                        item, sort_keys=True, cls=JSONEncoder, allow_nan=False
+                    ).encode("UTF-8")
+                    chunk.append(encoded)
+                    size += len(encoded)
+                    if size >= STREAM_CHUNK_SIZE:
+                        put(chunk)
+                        chunk = []
+                        size = 0
+                if chunk:
+                    put(chunk)
+            finally:
+                put(None)
+
+        response = web.StreamResponse(headers={"Content-Type": CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+
+        producer = hass.async_add_executor_job(produce)
+        separator = b"["
+
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                await response.write(separator + b",".join(chunk))
+                separator = b","
+        finally:
+            stop.set()
+            # Make room for a chunk the producer may still be waiting to put
+            while not chunks.empty():
+                chunks.get_nowait()
+
+        try:
+            await producer
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error streaming response to %s", request.path)
+            # The status has been sent, leave the array open and close the
+            # connection so the client does not take the result as complete
+            request.protocol.force_close()
+            return response
+
+        await response.write(b"[]" if separator == b"[" else b"]")
+        await response.write_eof()
+        return response
+
     def json_message(self, message, status_code=200, message_code=None, headers=None):
         """Return a JSON message response."""
         data = {"message": message}
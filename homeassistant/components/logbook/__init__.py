@@ -1,10 +1,10 @@
 """Event parser and human readable log generator."""
 from datetime import timedelta
 from itertools import groupby
+import json
 import logging
-import time
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import false, true
 import voluptuous as vol
 
 from homeassistant.components import sun
@@ -16,12 +16,12 @@ from homeassistant.components.homekit.const import (
     EVENT_HOMEKIT_CHANGED,
 )
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.components.recorder.models import Events, States
-from homeassistant.components.recorder.util import (
-    QUERY_RETRY_WAIT,
-    RETRIES,
-    session_scope,
+from homeassistant.components.recorder.models import (
+    Events,
+    States,
+    process_timestamp,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -41,7 +41,14 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import DOMAIN as HA_DOMAIN, State, callback, split_entity_id
+from homeassistant.core import (
+    DOMAIN as HA_DOMAIN,
+    Context,
+    Event,
+    State,
+    callback,
+    split_entity_id,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.loader import bind_hass
@@ -181,13 +188,9 @@ class LogbookView(HomeAssistantView):
         end_day = start_day + timedelta(days=period)
         hass = request.app["hass"]
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(hass, self.config, start_day, end_day, entity_id)
-            )
-
-        return await hass.async_add_job(json_events)
+        return await self.json_stream(
+            request, _get_events, hass, self.config, start_day, end_day, entity_id
+        )
 
 
 def humanify(hass, events):
@@ -237,7 +240,11 @@ def humanify(hass, events):
         for event in events_batch:
             if event.event_type == EVENT_STATE_CHANGED:
 
-                to_state = State.from_dict(event.data.get("new_state"))
+                new_state = event.data.get("new_state")
+                if isinstance(new_state, State):
+                    to_state = new_state
+                else:
+                    to_state = State.from_dict(new_state)
 
                 domain = to_state.domain
 
@@ -379,33 +386,8 @@ def humanify(hass, events):
                 }
 
 
-def _get_related_entity_ids(session, entity_filter):
-    timer_start = time.perf_counter()
-
-    query = session.query(States).with_entities(States.entity_id).distinct()
-
-    for tryno in range(0, RETRIES):
-        try:
-            result = [row.entity_id for row in query if entity_filter(row.entity_id)]
-
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                elapsed = time.perf_counter() - timer_start
-                _LOGGER.debug(
-                    "fetching %d distinct domain/entity_id pairs took %fs",
-                    len(result),
-                    elapsed,
-                )
-
-            return result
-        except SQLAlchemyError as err:
-            _LOGGER.error("Error executing query: %s", err)
-
-            if tryno == RETRIES - 1:
-                raise
-            time.sleep(QUERY_RETRY_WAIT)
-
-
-def _generate_filter_from_config(config):
+def _filter_lists_from_config(config):
+    """Return the included and excluded domains and entities."""
     excluded_entities = []
     excluded_domains = []
     included_entities = []
@@ -420,44 +402,185 @@ def _generate_filter_from_config(config):
         included_entities = include.get(CONF_ENTITIES, [])
         included_domains = include.get(CONF_DOMAINS, [])
 
-    return generate_filter(
-        included_domains, included_entities, excluded_domains, excluded_entities
+    return included_domains, included_entities, excluded_domains, excluded_entities
+
+
+def _generate_filter_from_config(config):
+    return generate_filter(*_filter_lists_from_config(config))
+
+
+def _entity_filter_sql(config):
+    """Return the SQL equivalent of the entity filter for state rows.
+
+    Follows the cases of homeassistant.helpers.entityfilter.generate_filter.
+    """
+    (
+        included_domains,
+        included_entities,
+        excluded_domains,
+        excluded_entities,
+    ) = _filter_lists_from_config(config)
+
+    def in_(column, values):
+        """Return a clause testing if column is one of values."""
+        return column.in_(values) if values else false()
+
+    domain_included = in_(States.domain, included_domains)
+    entity_included = in_(States.entity_id, included_entities)
+    domain_excluded = in_(States.domain, excluded_domains)
+    entity_excluded = in_(States.entity_id, excluded_entities)
+
+    have_include = bool(included_domains or included_entities)
+    have_exclude = bool(excluded_domains or excluded_entities)
+
+    if not have_include and not have_exclude:
+        return true()
+
+    if not have_exclude:
+        return entity_included | domain_included
+
+    if not have_include:
+        return ~entity_excluded & ~domain_excluded
+
+    if included_domains:
+        return (domain_included & ~entity_excluded) | (
+            ~domain_included & entity_included
+        )
+
+    if excluded_domains:
+        return (domain_excluded & entity_included) | (
+            ~domain_excluded & ~entity_excluded
+        )
+
+    return entity_included
+
+
+def _significant_state_changes_sql():
+    """Return the SQL clause for state changes that are shown in the logbook.
+
+    Attribute only changes are left out by comparing the state columns.
+    New and removed entities and continuous sensor values with a unit are
+    left out in _state_changed_event and humanify.
+    """
+    return States.last_updated == States.last_changed
+
+
+def _state_changed_event(row):
+    """Build a state changed event from a database row.
+
+    The state is built from its columns and the new state in the event data.
+    Returns None if the state change is not shown in the logbook.
+    """
+    try:
+        # Don't show continuous sensor value changes in the logbook, these
+        # are checked on the attributes as they are much smaller than the
+        # event data
+        if row.domain in CONTINUOUS_DOMAINS and json.loads(row.attributes).get(
+            "unit_of_measurement"
+        ):
+            return None
+
+        data = json.loads(row.event_data)
+    except ValueError:
+        # When json.loads fails
+        _LOGGER.exception("Error converting to event: %s", row)
+        return None
+
+    new_state = data.get("new_state")
+
+    # Do not report on new entities or entity removal
+    if data.get("old_state") is None or new_state is None:
+        return None
+
+    attributes = new_state.get("attributes", {})
+
+    # Also filter auto groups.
+    if row.domain == "group" and attributes.get("auto", False):
+        return None
+
+    # exclude entities which are customized hidden
+    if attributes.get(ATTR_HIDDEN, False):
+        return None
+
+    context = Context(id=row.context_id, user_id=row.context_user_id)
+    state = State(
+        row.entity_id,
+        row.state,
+        attributes,
+        process_timestamp(row.last_changed),
+        process_timestamp(row.last_updated),
+        context=context,
+        # Temp, because database can still store invalid entity IDs
+        # Remove with 1.0 or in 2020.
+        temp_invalid_id_bypass=True,
+    )
+
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": state.entity_id, "new_state": state},
+        time_fired=process_timestamp(row.time_fired),
+        context=context,
     )
 
 
 def _get_events(hass, config, start_day, end_day, entity_id=None):
-    """Get events for a period of time."""
+    """Yield the logbook entries for a period of time."""
     entities_filter = _generate_filter_from_config(config)
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
         for row in query.yield_per(500):
-            event = row.to_native()
-            if _keep_event(event, entities_filter):
+            if row.state_id is not None:
+                event = _state_changed_event(row)
+            else:
+                event = Events(
+                    event_type=row.event_type,
+                    event_data=row.event_data,
+                    origin=row.origin,
+                    time_fired=row.time_fired,
+                    context_id=row.context_id,
+                    context_user_id=row.context_user_id,
+                ).to_native()
+                if event is not None and not _keep_event(event, entities_filter):
+                    event = None
+
+            if event is not None:
                 yield event
 
-    with session_scope(hass=hass) as session:
-        if entity_id is not None:
-            entity_ids = [entity_id.lower()]
-        else:
-            entity_ids = _get_related_entity_ids(session, entities_filter)
+    entity_clause = _entity_filter_sql(config)
+
+    if entity_id is not None:
+        entity_clause = (States.entity_id == entity_id.lower()) & entity_clause
 
+    with session_scope(hass=hass) as session:
+        # Query columns instead of model instances, building those is slow
         query = (
-            session.query(Events)
+            session.query(
+                Events.event_type,
+                Events.event_data,
+                Events.origin,
+                Events.time_fired,
+                Events.context_id,
+                Events.context_user_id,
+                States.state_id,
+                States.domain,
+                States.entity_id,
+                States.state,
+                States.attributes,
+                States.last_changed,
+                States.last_updated,
+            )
             .order_by(Events.time_fired)
             .outerjoin(States, (Events.event_id == States.event_id))
             .filter(Events.event_type.in_(ALL_EVENT_TYPES))
             .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
             .filter(
-                (
-                    (States.last_updated == States.last_changed)
-                    & States.entity_id.in_(entity_ids)
-                )
+                (_significant_state_changes_sql() & entity_clause)
                 | (States.state_id.is_(None))
             )
         )
 
-        return list(humanify(hass, yield_events(query)))
+        yield from humanify(hass, yield_events(query))
 
 
 def _keep_event(event, entities_filter):
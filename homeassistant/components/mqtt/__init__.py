@@ -17,7 +17,6 @@ import attr
 import requests.certs
 import voluptuous as vol
 import paho.mqtt.client as mqtt
-from paho.mqtt.matcher import MQTTMatcher
 
 from homeassistant import config_entries
 from homeassistant.components import websocket_api
@@ -58,6 +57,7 @@ from .const import (
     DEFAULT_QOS,
 )
 from .discovery import MQTT_DISCOVERY_UPDATED, clear_discovery_hash
+from .matcher import TopicMatcher
 from .models import PublishPayloadType, Message, MessageCallbackType
 from .subscription import async_subscribe_topics, async_unsubscribe_topics
 
@@ -731,6 +731,7 @@ class MQTT:
         self.port = port
         self.keepalive = keepalive
         self.subscriptions: List[Subscription] = []
+        self._matcher = TopicMatcher()
         self.birth_message = birth_message
         self.connected = False
         self._mqttc: mqtt.Client = None
@@ -833,17 +834,20 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._matcher.add(topic, subscription)
 
         await self._async_perform_subscription(topic, qos)
 
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
+            try:
+                self._matcher.remove(topic, subscription)
+            except KeyError:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._matcher.has_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -915,10 +919,7 @@ class MQTT:
             msg.payload,
         )
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
+        for subscription in self._matcher.match(msg.topic):
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -975,17 +976,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
@@ -0,0 +1,131 @@
+"""Topic index used to dispatch MQTT messages to subscriptions."""
+from itertools import count
+from typing import Any, Dict, List, Tuple
+
+WILDCARD_SINGLE = "+"
+WILDCARD_MULTI = "#"
+
+
+class _Node:
+    """Node in the topic trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_Node"] = {}
+        self.values: List[Tuple[int, Any]] = []
+
+
+class TopicMatcher:
+    """Wildcard aware trie of topic filters.
+
+    Dispatching a topic only walks the levels of that topic, so the cost
+    depends on the topic depth and on the number of matching filters instead
+    of the total number of registered filters. Matches are returned in the
+    order the values were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the matcher."""
+        self._root = _Node()
+        self._counter = count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of registered values."""
+        return self._size
+
+    def add(self, topic_filter: str, value: Any) -> None:
+        """Register value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.values.append((next(self._counter), value))
+        self._size += 1
+
+    def remove(self, topic_filter: str, value: Any) -> None:
+        """Remove a value previously registered for a topic filter."""
+        path = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                raise KeyError(topic_filter)
+            path.append((node, level))
+            node = child
+
+        for index, (_, registered) in enumerate(node.values):
+            if registered is value:
+                del node.values[index]
+                break
+        else:
+            raise KeyError(topic_filter)
+
+        self._size -= 1
+
+        # Prune branches that no longer hold any filters.
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if any value is registered for exactly this topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.get(level)
+            if node is None:
+                return False
+        return bool(node.values)
+
+    def match(self, topic: str) -> List[Any]:
+        """Return all values whose topic filter matches topic."""
+        levels = topic.split("/")
+        # Topics starting with $ are not matched by wildcards at the first
+        # level, see MQTT v3.1.1 section 4.7.2.
+        system = topic.startswith("$")
+        found: List[Tuple[int, Any]] = []
+        self._match(self._root, levels, 0, system, found)
+        if len(found) > 1:
+            found.sort(key=_sort_key)
+        return [value for _, value in found]
+
+    def _match(
+        self,
+        node: _Node,
+        levels: List[str],
+        index: int,
+        system: bool,
+        found: List[Tuple[int, Any]],
+    ) -> None:
+        """Collect matching values below node."""
+        children = node.children
+        wildcards_allowed = index > 0 or not system
+
+        if wildcards_allowed:
+            multi = children.get(WILDCARD_MULTI)
+            if multi is not None:
+                found.extend(multi.values)
+
+        if index == len(levels):
+            found.extend(node.values)
+            return
+
+        child = children.get(levels[index])
+        if child is not None:
+            self._match(child, levels, index + 1, system, found)
+
+        if wildcards_allowed:
+            single = children.get(WILDCARD_SINGLE)
+            if single is not None:
+                self._match(single, levels, index + 1, system, found)
+
+
+def _sort_key(item: Tuple[int, Any]) -> int:
+    """Sort matches in registration order."""
+    return item[0]
@@ -8,7 +8,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import track_state_change
 from homeassistant.util.distance import convert
-from homeassistant.util.location import distance
+from homeassistant.util.location import distance, distances
 
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -184,8 +184,8 @@ class Proximity(Entity):
         if "latitude" not in new_state.attributes:
             return
 
-        # Collect distances to the zone for all devices.
-        distances_to_zone = {}
+        # Collect the devices the distance to the zone can be calculated for.
+        device_states = []
         for device in self.proximity_devices:
             # Ignore devices in an ignored zone.
             device_state = self.hass.states.get(device)
@@ -196,18 +196,23 @@ class Proximity(Entity):
             if "latitude" not in device_state.attributes:
                 continue
 
-            # Calculate the distance to the proximity zone.
-            dist_to_zone = distance(
-                proximity_latitude,
-                proximity_longitude,
-                device_state.attributes["latitude"],
-                device_state.attributes["longitude"],
-            )
+            device_states.append(device_state)
+
+        # Calculate the distances to the proximity zone in one go.
+        device_distances = distances(
+            proximity_latitude,
+            proximity_longitude,
+            [device_state.attributes["latitude"] for device_state in device_states],
+            [device_state.attributes["longitude"] for device_state in device_states],
+        )
 
-            # Add the device and distance to a dictionary.
-            distances_to_zone[device] = round(
+        # Add the devices and distances to a dictionary.
+        distances_to_zone = {
+            device_state.entity_id: round(
                 convert(dist_to_zone, "m", self.unit_of_measurement), 1
             )
+            for device_state, dist_to_zone in zip(device_states, device_distances)
+        }
 
         # Loop through each of the distances collected and work out the
         # closest.
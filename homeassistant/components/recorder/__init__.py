@@ -64,9 +64,17 @@ CONF_DB_URL = "db_url"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
+CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_RETENTION = "retention"
 
 CONNECT_RETRY_WAIT = 3
 
+DEFAULT_COMMIT_INTERVAL = 1
+MAX_BATCH_SIZE = 1000
+
+# Marks that no queue item was carried over from filling a batch
+_NO_ITEM = object()
+
 FILTER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_EXCLUDE, default={}): vol.Schema(
@@ -92,10 +100,23 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                     vol.Coerce(int), vol.Range(min=1)
                 ),
+                vol.Optional(CONF_RETENTION, default={}): vol.Schema(
+                    {
+                        vol.Optional(CONF_DOMAINS, default={}): {
+                            cv.string: vol.All(vol.Coerce(int), vol.Range(min=1))
+                        },
+                        vol.Optional(CONF_ENTITIES, default={}): {
+                            cv.entity_id: vol.All(vol.Coerce(int), vol.Range(min=1))
+                        },
+                    }
+                ),
                 vol.Optional(CONF_PURGE_INTERVAL, default=1): vol.All(
                     vol.Coerce(int), vol.Range(min=0)
                 ),
                 vol.Optional(CONF_DB_URL): cv.string,
+                vol.Optional(
+                    CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
             }
         )
     },
@@ -133,6 +154,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config[DOMAIN]
     keep_days = conf.get(CONF_PURGE_KEEP_DAYS)
     purge_interval = conf.get(CONF_PURGE_INTERVAL)
+    commit_interval = conf.get(CONF_COMMIT_INTERVAL)
+    retention = conf.get(CONF_RETENTION)
 
     db_url = conf.get(CONF_DB_URL, None)
     if not db_url:
@@ -144,6 +167,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         keep_days=keep_days,
         purge_interval=purge_interval,
+        commit_interval=commit_interval,
+        retention=retention,
         uri=db_url,
         include=include,
         exclude=exclude,
@@ -173,6 +198,8 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         keep_days: int,
         purge_interval: int,
+        commit_interval: int,
+        retention: Dict,
         uri: str,
         include: Dict,
         exclude: Dict,
@@ -183,6 +210,9 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.keep_days = keep_days
         self.purge_interval = purge_interval
+        self.commit_interval = commit_interval
+        self.retention = retention
+        self.last_batch_size = 0
         self.queue: Any = queue.Queue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -310,8 +340,13 @@ class Recorder(threading.Thread):
 
             self.hass.helpers.event.track_point_in_time(async_purge, run)
 
+        carried: Any = _NO_ITEM
+
         while True:
-            event = self.queue.get()
+            if carried is _NO_ITEM:
+                event = self.queue.get()
+            else:
+                event, carried = carried, _NO_ITEM
 
             if event is None:
                 self._close_run()
@@ -319,70 +354,153 @@ class Recorder(threading.Thread):
                 self.queue.task_done()
                 return
             if isinstance(event, PurgeTask):
-                purge.purge_old_data(self, event.keep_days, event.repack)
+                # Requeue unfinished purges so events queued in the meantime
+                # are recorded before the next batch is purged.
+                if not purge.purge_old_data(self, event.keep_days, event.repack):
+                    self.queue.put(event)
                 self.queue.task_done()
                 continue
-            if event.event_type == EVENT_TIME_CHANGED:
+            if not self._should_record(event):
                 self.queue.task_done()
                 continue
-            if event.event_type in self.exclude_t:
+
+            batch = [event]
+            carried = self._fill_batch(batch)
+            self._save_batch(batch)
+
+            for _ in batch:
+                self.queue.task_done()
+
+    def _should_record(self, event):
+        """Return if an event should be written to the database."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+        if event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
+    def _fill_batch(self, batch):
+        """Add queued events to batch until the commit interval has passed.
+
+        Returns the shutdown or purge task that ended the batch, if any, so
+        it is processed after the batch has been committed.
+        """
+        deadline = time.monotonic() + self.commit_interval
+
+        while len(batch) < MAX_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    event = self.queue.get(timeout=timeout)
+                else:
+                    event = self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if event is None or isinstance(event, PurgeTask):
+                return event
+            if not self._should_record(event):
                 self.queue.task_done()
                 continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
-
-            tries = 1
-            updated = False
-            while not updated and tries <= 10:
-                if tries != 1:
-                    time.sleep(CONNECT_RETRY_WAIT)
-                try:
-                    with session_scope(session=self.get_session()) as session:
-                        try:
-                            dbevent = Events.from_event(event)
-                            session.add(dbevent)
-                            session.flush()
-                        except (TypeError, ValueError):
-                            _LOGGER.warning("Event is not JSON serializable: %s", event)
-
-                        if event.event_type == EVENT_STATE_CHANGED:
-                            try:
-                                dbstate = States.from_event(event)
-                                dbstate.event_id = dbevent.event_id
-                                session.add(dbstate)
-                            except (TypeError, ValueError):
-                                _LOGGER.warning(
-                                    "State is not JSON serializable: %s",
-                                    event.data.get("new_state"),
-                                )
-
-                    updated = True
-
-                except exc.OperationalError as err:
-                    _LOGGER.error(
-                        "Error in database connectivity: %s. "
-                        "(retrying in %s seconds)",
-                        err,
-                        CONNECT_RETRY_WAIT,
-                    )
-                    tries += 1
+            batch.append(event)
 
-                except exc.SQLAlchemyError:
-                    updated = True
-                    _LOGGER.exception("Error saving event: %s", event)
+        return _NO_ITEM
 
-            if not updated:
+    def _save_batch(self, batch):
+        """Write a batch of events and their states in one transaction.
+
+        If the transaction fails for another reason than the database
+        connection, the events are written again one at a time, so only the
+        events that cause the error are dropped.
+        """
+        if not self._commit_batch(batch) and len(batch) > 1:
+            _LOGGER.debug("Saving %d events one at a time", len(batch))
+            for event in batch:
+                self._commit_batch([event])
+
+        self.last_batch_size = len(batch)
+        _LOGGER.debug(
+            "Saved batch of %d events, %d items queued",
+            self.last_batch_size,
+            self.queue_depth,
+        )
+
+    def _commit_batch(self, batch):
+        """Commit a batch of events, retrying on connection errors.
+
+        Returns False if the batch could not be written because of an error
+        in the data.
+        """
+        tries = 1
+        while tries <= 10:
+            if tries != 1:
+                time.sleep(CONNECT_RETRY_WAIT)
+            try:
+                with session_scope(session=self.get_session()) as session:
+                    self._add_batch(session, batch)
+
+                return True
+
+            except exc.OperationalError as err:
                 _LOGGER.error(
-                    "Error in database update. Could not save "
-                    "after %d tries. Giving up",
-                    tries,
+                    "Error in database connectivity: %s. " "(retrying in %s seconds)",
+                    err,
+                    CONNECT_RETRY_WAIT,
+                )
+                tries += 1
+
+            except exc.SQLAlchemyError:
+                if len(batch) > 1:
+                    return False
+                _LOGGER.exception("Error saving event: %s", batch[0])
+                return True
+
+        _LOGGER.error(
+            "Error in database update. Could not save " "after %d tries. Giving up",
+            tries,
+        )
+        return True
+
+    @staticmethod
+    def _add_batch(session, batch):
+        """Add the rows for a batch of events to the session."""
+        db_events = []
+        pending_states = []
+
+        for event in batch:
+            try:
+                dbevent = Events.from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                continue
+
+            db_events.append(dbevent)
+
+            if event.event_type != EVENT_STATE_CHANGED:
+                continue
+
+            try:
+                pending_states.append((States.from_event(event), dbevent))
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s", event.data.get("new_state")
                 )
 
-            self.queue.task_done()
+        # A single flush inserts all events and assigns their ids
+        session.add_all(db_events)
+        session.flush()
+
+        for dbstate, dbevent in pending_states:
+            dbstate.event_id = dbevent.event_id
+        session.add_all([dbstate for dbstate, _ in pending_states])
+
+    @property
+    def queue_depth(self):
+        """Return the number of items waiting to be processed."""
+        return self.queue.qsize()
 
     @callback
     def event_listener(self, event):
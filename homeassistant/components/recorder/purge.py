@@ -4,6 +4,7 @@ import logging
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES
 import homeassistant.util.dt as dt_util
 from .models import Events, States
 
@@ -11,28 +12,50 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of rows deleted from a table in one transaction
+PURGE_BATCH_SIZE = 1000
+
 
 def purge_old_data(instance, purge_days, repack):
-    """Purge events and states older than purge_days ago."""
+    """Purge one batch of events and states older than purge_days ago.
+
+    Rows are selected by primary key through the time indexes and deleted
+    in batches of PURGE_BATCH_SIZE, so the database is only locked for a
+    short time. Returns True when all old data has been purged, False if
+    purge_old_data needs to be called again.
+    """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging events before %s", purge_before)
 
     try:
         with session_scope(session=instance.get_session()) as session:
-            deleted_rows = (
-                session.query(States)
-                .filter((States.last_updated < purge_before))
-                .delete(synchronize_session=False)
+            finished = _purge_retention(session, instance.retention, purge_before)
+
+            state_ids = _select_ids(
+                session, States.state_id, States.last_updated < purge_before
             )
+            deleted_rows = _delete_ids(session, States.state_id, state_ids)
             _LOGGER.debug("Deleted %s states", deleted_rows)
 
-            deleted_rows = (
-                session.query(Events)
-                .filter((Events.time_fired < purge_before))
-                .delete(synchronize_session=False)
-            )
+            # Events are referenced by states, only purge them when no old
+            # states are left.
+            event_ids = []
+            if len(state_ids) < PURGE_BATCH_SIZE:
+                event_ids = _select_ids(
+                    session, Events.event_id, Events.time_fired < purge_before
+                )
+            deleted_rows = _delete_ids(session, Events.event_id, event_ids)
             _LOGGER.debug("Deleted %s events", deleted_rows)
 
+            finished = (
+                finished
+                and len(state_ids) < PURGE_BATCH_SIZE
+                and len(event_ids) < PURGE_BATCH_SIZE
+            )
+
+        if not finished:
+            return False
+
         # Execute sqlite vacuum command to free up space on disk
         if repack and instance.engine.driver in ("pysqlite", "postgresql"):
             _LOGGER.debug("Vacuuming SQL DB to free space")
@@ -40,3 +63,85 @@ def purge_old_data(instance, purge_days, repack):
 
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s.", err)
+
+    return True
+
+
+def _purge_retention(session, retention, purge_before):
+    """Purge one batch of states with a shorter retention and their events.
+
+    Entity retention takes precedence over the retention of its domain.
+    Returns True if no states with a shorter retention are left to purge.
+    """
+    now = dt_util.utcnow()
+    entity_days = retention[CONF_ENTITIES]
+    finished = True
+
+    rules = [
+        (States.entity_id == entity_id, keep_days)
+        for entity_id, keep_days in entity_days.items()
+    ]
+    for domain, keep_days in retention[CONF_DOMAINS].items():
+        clause = States.domain == domain
+        if entity_days:
+            clause &= ~States.entity_id.in_(list(entity_days))
+        rules.append((clause, keep_days))
+
+    for clause, keep_days in rules:
+        keep_before = now - timedelta(days=keep_days)
+
+        if keep_before <= purge_before:
+            continue
+
+        rows = (
+            session.query(States.state_id, States.event_id)
+            .filter(clause & (States.last_updated < keep_before))
+            .order_by(States.state_id)
+            .limit(PURGE_BATCH_SIZE)
+            .all()
+        )
+
+        if not rows:
+            continue
+
+        deleted_states = _delete_ids(
+            session, States.state_id, [row.state_id for row in rows]
+        )
+        deleted_events = _delete_ids(
+            session,
+            Events.event_id,
+            [row.event_id for row in rows if row.event_id is not None],
+        )
+        _LOGGER.debug(
+            "Deleted %s states and %s events kept for %s days",
+            deleted_states,
+            deleted_events,
+            keep_days,
+        )
+
+        finished = finished and len(rows) < PURGE_BATCH_SIZE
+
+    return finished
+
+
+def _select_ids(session, column, clause):
+    """Return the first batch of primary keys matching clause."""
+    return [
+        row[0]
+        for row in session.query(column)
+        .filter(clause)
+        .order_by(column)
+        .limit(PURGE_BATCH_SIZE)
+    ]
+
+
+def _delete_ids(session, column, ids):
+    """Delete the rows with the given primary keys."""
+    if not ids:
+        return 0
+
+    return (
+        session.query(column.class_)
+        .filter(column.in_(ids))
+        .delete(synchronize_session=False)
+    )
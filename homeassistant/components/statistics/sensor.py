@@ -1,7 +1,8 @@
 """Support for statistics for sensor values."""
-import logging
-import statistics
+import bisect
 from collections import deque
+import logging
+import math
 
 import voluptuous as vol
 
@@ -19,7 +20,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change
 from homeassistant.util import dt as dt_util
-from homeassistant.components.recorder.util import session_scope, execute
+from homeassistant.components.recorder.util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +48,9 @@ DEFAULT_SIZE = 20
 DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
+# Every finite float is a whole number once multiplied by 2 ** SCALE_BITS
+SCALE_BITS = 1074
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -75,6 +79,76 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     return True
 
 
+class RollingStatistics:
+    """Statistics of a window of values, updated as values come and go.
+
+    The sums are kept as exact integers, scaled so that every finite float
+    is a whole number. Dividing them gives the correctly rounded mean and
+    variance that the statistics module returns, and no rounding error
+    builds up when values leave the window. A sorted copy of the window
+    provides the median, min and max.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self.sorted_values = []
+        self._sum = 0
+        self._sum_squares = 0
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return len(self.sorted_values)
+
+    def add(self, value):
+        """Add a value to the window."""
+        exact = _scaled_int(value)
+        self._sum += exact
+        self._sum_squares += exact * exact
+        bisect.insort(self.sorted_values, value)
+
+    def remove(self, value):
+        """Remove a value from the window."""
+        exact = _scaled_int(value)
+        self._sum -= exact
+        self._sum_squares -= exact * exact
+        del self.sorted_values[bisect.bisect_left(self.sorted_values, value)]
+
+    @property
+    def total(self):
+        """Return the sum of the values."""
+        return self._sum / (1 << SCALE_BITS)
+
+    @property
+    def mean(self):
+        """Return the mean, requires one value."""
+        return self._sum / (len(self.sorted_values) << SCALE_BITS)
+
+    @property
+    def median(self):
+        """Return the median, requires one value."""
+        values = self.sorted_values
+        middle = len(values) // 2
+
+        if len(values) % 2:
+            return values[middle]
+
+        return (values[middle - 1] + values[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance, requires two values."""
+        count = len(self.sorted_values)
+        return (count * self._sum_squares - self._sum * self._sum) / (
+            (count * (count - 1)) << (2 * SCALE_BITS)
+        )
+
+
+def _scaled_int(value):
+    """Return a finite float multiplied by 2 ** SCALE_BITS."""
+    numerator, denominator = float(value).as_integer_ratio()
+    return numerator << (SCALE_BITS + 1 - denominator.bit_length())
+
+
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
@@ -89,6 +163,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._statistics = RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -129,22 +204,46 @@ class StatisticsSensor(Entity):
 
     def _add_state_to_queue(self, new_state):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        self._add_value_to_queue(new_state.state, new_state.last_updated)
+
+    def _add_value_to_queue(self, value, last_updated):
+        """Add a state value to the queue."""
+        if value in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            self.states.append(value)
+            self.ages.append(last_updated)
+            return
 
-            self.ages.append(new_state.last_updated)
+        try:
+            number = float(value)
         except ValueError:
+            number = None
+
+        # Infinity and NaN have no place in the running sums
+        if number is None or not math.isfinite(number):
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                value,
             )
+            return
+
+        if len(self.states) == self._sampling_size:
+            self._pop_oldest()
+
+        self.states.append(number)
+        self.ages.append(last_updated)
+        self._statistics.add(number)
+
+    def _pop_oldest(self):
+        """Remove the oldest state from the queue."""
+        self.ages.popleft()
+        value = self.states.popleft()
+
+        if not self.is_binary:
+            self._statistics.remove(value)
 
     @property
     def name(self):
@@ -210,8 +309,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._pop_oldest()
 
     async def async_update(self):
         """Get the latest data and updates the states."""
@@ -222,24 +320,27 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            stats = self._statistics
+
+            if self.count >= 1:
+                self.mean = round(stats.mean, self._precision)
+                self.median = round(stats.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count >= 2:
+                variance = stats.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(stats.total, self._precision)
+                self.min = round(stats.sorted_values[0], self._precision)
+                self.max = round(stats.sorted_values[-1], self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -266,21 +367,34 @@ class StatisticsSensor(Entity):
                 self.change_rate = STATE_UNKNOWN
 
     async def _async_initialize_from_database(self):
-        """Initialize the list of states from the database.
+        """Initialize the list of states from the database."""
+        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+
+        rows = await self.hass.async_add_executor_job(self._fetch_recorded_values)
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
+        for value, last_updated in rows:
+            self._add_value_to_queue(value, last_updated)
+
+        self.async_schedule_update_ha_state(True)
+
+        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+    def _fetch_recorded_values(self):
+        """Fetch the recorded state values and times from the database.
+
+        Only the state and last_updated columns are selected, which avoids
+        building a State object for every row. The query will get the list
+        of states in DESCENDING order so that we can limit the result to
+        self._sample_size. Afterwards reverse the list so that we get it in
+        the right order again.
 
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        from homeassistant.components.recorder.models import States
-
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+        from homeassistant.components.recorder.models import States, process_timestamp
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
+            query = session.query(States.state, States.last_updated).filter(
                 States.entity_id == self._entity_id.lower()
             )
 
@@ -298,11 +412,9 @@ class StatisticsSensor(Entity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._sampling_size
             )
-            states = execute(query)
-
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+            rows = query.all()
 
-        self.async_schedule_update_ha_state(True)
-
-        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+        return [
+            (state, process_timestamp(last_updated))
+            for state, last_updated in reversed(rows)
+        ]
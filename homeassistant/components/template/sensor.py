@@ -245,7 +245,7 @@ class SensorTemplate(Entity):
     async def async_update(self):
         """Update the state from the template."""
         try:
-            self._state = self._template.async_render()
+            self._state = self._template.async_render_cached()
             self._available = True
         except TemplateError as ex:
             self._available = False
@@ -263,7 +263,7 @@ class SensorTemplate(Entity):
         attrs = {}
         for key, value in self._attribute_templates.items():
             try:
-                attrs[key] = value.async_render()
+                attrs[key] = value.async_render_cached()
             except TemplateError as err:
                 _LOGGER.error("Error rendering attribute %s: %s", key, err)
 
@@ -281,7 +281,7 @@ class SensorTemplate(Entity):
                 continue
 
             try:
-                value = template.async_render()
+                value = template.async_render_cached()
                 if property_name == "_available":
                     value = value.lower() == "true"
                 setattr(self, property_name, value)
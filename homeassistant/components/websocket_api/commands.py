@@ -1,15 +1,15 @@
 """Commands part of Websocket API."""
 import voluptuous as vol
 
-from homeassistant.auth.permissions.const import POLICY_READ
-from homeassistant.const import MATCH_ALL, EVENT_TIME_CHANGED, EVENT_STATE_CHANGED
+from homeassistant.const import MATCH_ALL
 from homeassistant.core import callback, DOMAIN as HASS_DOMAIN
 from homeassistant.exceptions import Unauthorized, ServiceNotFound, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.event import async_track_state_change
+from homeassistant.setup import async_get_setup_timings
 
-from . import const, decorators, messages
+from . import const, decorators, messages, subscriptions
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -24,6 +24,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_config)
+    async_reg(hass, handle_get_setup_timings)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
 
@@ -52,30 +53,8 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
-    if event_type == EVENT_STATE_CHANGED:
-
-        @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
-                event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event))
-
-    else:
-
-        @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+    connection.subscriptions[msg["id"]] = subscriptions.async_subscribe_events(
+        hass, connection, msg["id"], event_type
     )
 
     connection.send_message(messages.result_message(msg["id"]))
@@ -201,6 +180,19 @@ def handle_get_config(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"], hass.config.as_dict()))
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "get_setup_timings"})
+def handle_get_setup_timings(hass, connection, msg):
+    """Handle get setup timings command.
+
+    Async friendly.
+    """
+    connection.send_message(
+        messages.result_message(msg["id"], async_get_setup_timings(hass).as_dict())
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -238,7 +230,7 @@ def handle_render_template(hass, connection, msg):
     def state_listener(*_):
         connection.send_message(
             messages.event_message(
-                msg["id"], {"result": template.async_render(variables)}
+                msg["id"], {"result": template.async_render_cached(variables)}
             )
         )
 
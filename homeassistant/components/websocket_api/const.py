@@ -32,4 +32,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS = DOMAIN + ".connections"
 
+# Data used to store the shared event forwarders per event type
+DATA_EVENT_FORWARDERS = DOMAIN + ".event_forwarders"
+
 JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
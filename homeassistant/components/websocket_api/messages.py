@@ -37,3 +37,8 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(iden, event_json):
+    """Return an event message for an event that is already JSON encoded."""
+    return '{"id": %d, "type": "event", "event": %s}' % (iden, event_json)
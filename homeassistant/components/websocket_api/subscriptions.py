@@ -0,0 +1,155 @@
+"""Shared forwarding of bus events to websocket subscriptions."""
+import logging
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.core import callback
+
+from . import const, messages
+
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CHANGED_KEYS = {"entity_id", "old_state", "new_state"}
+
+STATE_CHANGED_JSON = (
+    '{"event_type": %s, '
+    '"data": {"entity_id": %s, "old_state": %s, "new_state": %s}, '
+    '"origin": %s, "time_fired": %s, "context": %s}'
+)
+
+
+@callback
+def async_subscribe_events(hass, connection, iden, event_type):
+    """Forward events of event_type to a connection.
+
+    Returns a function to remove the subscription.
+    """
+    forwarders = hass.data.get(const.DATA_EVENT_FORWARDERS)
+
+    if forwarders is None:
+        forwarders = hass.data[const.DATA_EVENT_FORWARDERS] = {}
+
+    forwarder = forwarders.get(event_type)
+
+    if forwarder is None:
+        forwarder = forwarders[event_type] = EventForwarder(hass, event_type)
+
+    return forwarder.async_add(connection, iden)
+
+
+class EventForwarder:
+    """Forward events of one event type to all subscribed connections.
+
+    A single bus listener is registered per event type and each event is
+    JSON encoded once, no matter how many connections are subscribed. The
+    encoded states of state changed events are cached per entity, so the
+    new state of one event is reused as the old state of the next.
+    """
+
+    def __init__(self, hass, event_type):
+        """Initialize the forwarder."""
+        self.hass = hass
+        self.event_type = event_type
+        self._subscriptions = {}
+        self._encoded_states = {}
+        self._unsub = hass.bus.async_listen(event_type, self._async_forward)
+
+    @callback
+    def async_add(self, connection, iden):
+        """Add a subscription and return a function to remove it."""
+        key = object()
+        self._subscriptions[key] = (connection, iden)
+
+        @callback
+        def async_remove():
+            """Remove the subscription."""
+            if self._subscriptions.pop(key, None) is None or self._subscriptions:
+                return
+
+            self._unsub()
+
+            forwarders = self.hass.data[const.DATA_EVENT_FORWARDERS]
+
+            # A newer forwarder may have been set up for the same event type
+            if forwarders.get(self.event_type) is self:
+                forwarders.pop(self.event_type)
+
+        return async_remove
+
+    @callback
+    def _async_forward(self, event):
+        """Send an event to all subscribed connections."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        is_state_changed = event.event_type == EVENT_STATE_CHANGED
+
+        try:
+            if is_state_changed:
+                event_json = self._encode_state_changed(event)
+            else:
+                event_json = const.JSON_DUMP(event.as_dict())
+        except (ValueError, TypeError) as err:
+            _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, event)
+            event_json = None
+
+        for connection, iden in list(self._subscriptions.values()):
+            if (
+                is_state_changed
+                and self.event_type == EVENT_STATE_CHANGED
+                and not connection.user.permissions.check_entity(
+                    event.data["entity_id"], POLICY_READ
+                )
+            ):
+                continue
+
+            if event_json is None:
+                connection.send_message(
+                    messages.error_message(
+                        iden, const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+                    )
+                )
+            else:
+                connection.send_message(messages.cached_event_message(iden, event_json))
+
+    def _encode_state_changed(self, event):
+        """Encode a state changed event, reusing encoded states."""
+        data = event.data
+
+        if data.keys() != STATE_CHANGED_KEYS:
+            return const.JSON_DUMP(event.as_dict())
+
+        entity_id = data["entity_id"]
+        new_state = data["new_state"]
+        old_state_json = self._encode_state(entity_id, data["old_state"])
+        new_state_json = self._encode_state(entity_id, new_state)
+
+        if new_state is None:
+            self._encoded_states.pop(entity_id, None)
+        else:
+            self._encoded_states[entity_id] = (new_state, new_state_json)
+
+        return STATE_CHANGED_JSON % (
+            const.JSON_DUMP(event.event_type),
+            const.JSON_DUMP(entity_id),
+            old_state_json,
+            new_state_json,
+            const.JSON_DUMP(str(event.origin)),
+            const.JSON_DUMP(event.time_fired),
+            const.JSON_DUMP(event.context.as_dict()),
+        )
+
+    def _encode_state(self, entity_id, state):
+        """Return the JSON for a state, using the cache when possible."""
+        if state is None:
+            return "null"
+
+        cached = self._encoded_states.get(entity_id)
+
+        if cached is not None and cached[0] is state:
+            return cached[1]
+
+        return const.JSON_DUMP(state)
@@ -16,10 +16,11 @@ from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
 )
 from homeassistant.helpers import config_per_platform
+from homeassistant.helpers.location import async_get_location_index
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.util import slugify
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.util.location import distance
+from homeassistant.util.location import distances
 
 
 from .config_flow import configured_zones
@@ -61,26 +62,26 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        hass.states.get(entity_id)
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+    # Zones are sorted by entity ID so that we are deterministic if equal
+    # distance to 2 zones
+    zones = [
+        zone
+        for zone in async_get_location_index(hass).async_candidates(
+            DOMAIN, latitude, longitude, radius
+        )
+        if not zone.attributes.get(ATTR_PASSIVE)
+    ]
+    zone_dists = distances(
+        latitude,
+        longitude,
+        [zone.attributes[ATTR_LATITUDE] for zone in zones],
+        [zone.attributes[ATTR_LONGITUDE] for zone in zones],
     )
 
     min_dist = None
     closest = None
 
-    for zone in zones:
-        if zone.attributes.get(ATTR_PASSIVE):
-            continue
-
-        zone_dist = distance(
-            latitude,
-            longitude,
-            zone.attributes[ATTR_LATITUDE],
-            zone.attributes[ATTR_LONGITUDE],
-        )
-
+    for zone, zone_dist in zip(zones, zone_dists):
         within_zone = zone_dist - radius < zone.attributes[ATTR_RADIUS]
         closer_zone = closest is None or zone_dist < min_dist  # type: ignore
         smaller_zone = (
@@ -54,6 +54,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers import config_per_platform, extract_domain_configs
+from homeassistant.helpers.storage import STORAGE_DIR
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +64,8 @@ RE_ASCII = re.compile(r"\033\[[^m]*m")
 HA_COMPONENT_URL = "[{}](https://home-assistant.io/integrations/{}/)"
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+# Directory in the storage directory to cache parsed YAML files in
+YAML_CACHE_DIR = "yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -311,7 +314,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
             raise HomeAssistantError(
                 f"Config file not found in: {hass.config.config_dir}"
             )
-        config = load_yaml_config_file(path)
+        config = load_yaml_config_file(
+            path, hass.config.path(STORAGE_DIR, YAML_CACHE_DIR)
+        )
         return config
 
     # Not using async_add_executor_job because this is an internal method.
@@ -330,14 +335,16 @@ def find_config_file(config_dir: Optional[str]) -> Optional[str]:
     return config_path if os.path.isfile(config_path) else None
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+def load_yaml_config_file(
+    config_path: str, cache_dir: Optional[str] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    conf_dict = load_yaml(config_path, cache_dir)
 
     if not isinstance(conf_dict, dict):
         msg = "The configuration file {} does not contain a dictionary".format(
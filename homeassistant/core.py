@@ -5,6 +5,7 @@ Home Assistant is a Home Automation framework for observing the state
 of entities and react to changes.
 """
 import asyncio
+import bisect
 from concurrent.futures import ThreadPoolExecutor
 import datetime
 import enum
@@ -717,7 +718,7 @@ class State:
         """Initialize a new state."""
         state = str(state)
 
-        if not valid_entity_id(entity_id) and not temp_invalid_id_bypass:
+        if not temp_invalid_id_bypass and not valid_entity_id(entity_id):
             raise InvalidEntityFormatError(
                 (
                     "Invalid entity id encountered: {}. "
@@ -833,14 +834,45 @@ class State:
 
 
 class StateMachine:
-    """Helper class that tracks the state of different entities."""
+    """Helper class that tracks the state of different entities.
+
+    States are also indexed by domain, together with the entity ids of
+    each domain in sorted order, so the states of a domain can be listed
+    without looking at every state.
+    """
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        self._domain_states: Dict[str, Dict[str, State]] = {}
+        self._sorted_entity_ids: Dict[str, List[str]] = {}
+        self._observers: List[Callable[[str, Optional[State]], None]] = []
         self._bus = bus
         self._loop = loop
 
+    @callback
+    def async_add_observer(
+        self, observer: Callable[[str, Optional[State]], None]
+    ) -> CALLBACK_TYPE:
+        """Call observer with the entity_id and new state of every change.
+
+        Unlike state changed listeners, observers are called right away,
+        before the state changed event is fired. They are meant for indexes
+        that have to be in sync with the state machine. New state is None if
+        the state was removed. Observer needs to be a callback.
+
+        Returns a function to remove the observer.
+        """
+        self._observers.append(observer)
+
+        @callback
+        def async_remove_observer() -> None:
+            """Remove the observer."""
+            if observer in self._observers:
+                self._observers.remove(observer)
+
+        return async_remove_observer
+
     def entity_ids(self, domain_filter: Optional[str] = None) -> List[str]:
         """List of entity ids that are being tracked."""
         future = run_callback_threadsafe(
@@ -857,13 +889,7 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
-
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain == domain_filter
-        ]
+        return list(self._domain_states.get(domain_filter.lower(), ()))
 
     def all(self) -> List[State]:
         """Create a list of all states."""
@@ -879,6 +905,34 @@ class StateMachine:
         """
         return list(self._states.values())
 
+    @callback
+    def async_all_sorted(self) -> List[State]:
+        """Create a list of all states, sorted by entity_id.
+
+        This method must be run in the event loop.
+        """
+        # Entity ids sort by domain first, domains only contain characters
+        # that sort after the dot.
+        return [
+            state
+            for domain in sorted(self._domain_states)
+            for state in self.async_states_for_domain(domain)
+        ]
+
+    @callback
+    def async_states_for_domain(self, domain: str) -> List[State]:
+        """Create a list of the states of a domain, sorted by entity_id.
+
+        This method must be run in the event loop.
+        """
+        domain = domain.lower()
+        states = self._domain_states.get(domain)
+
+        if states is None:
+            return []
+
+        return [states[entity_id] for entity_id in self._sorted_entity_ids[domain]]
+
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
 
@@ -917,6 +971,18 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain = split_entity_id(entity_id)[0]
+        del self._domain_states[domain][entity_id]
+        sorted_entity_ids = self._sorted_entity_ids[domain]
+        del sorted_entity_ids[bisect.bisect_left(sorted_entity_ids, entity_id)]
+
+        if not sorted_entity_ids:
+            del self._domain_states[domain]
+            del self._sorted_entity_ids[domain]
+
+        for observer in self._observers:
+            observer(entity_id, None)
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -987,6 +1053,22 @@ class StateMachine:
 
         state = State(entity_id, new_state, attributes, last_changed, None, context)
         self._states[entity_id] = state
+
+        domain = split_entity_id(entity_id)[0]
+        domain_states = self._domain_states.get(domain)
+
+        if domain_states is None:
+            domain_states = self._domain_states[domain] = {}
+            self._sorted_entity_ids[domain] = []
+
+        if old_state is None:
+            bisect.insort(self._sorted_entity_ids[domain], entity_id)
+
+        domain_states[entity_id] = state
+
+        for observer in self._observers:
+            observer(entity_id, state)
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
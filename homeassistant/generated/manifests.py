@@ -0,0 +1,6097 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "name": "Abode",
+        "dependencies": [],
+        "requirements": [
+            "abodepy==0.16.6"
+        ]
+    },
+    "acer_projector": {
+        "name": "Acer projector",
+        "dependencies": [],
+        "requirements": [
+            "pyserial==3.1.1"
+        ]
+    },
+    "actiontec": {
+        "name": "Actiontec",
+        "dependencies": [],
+        "requirements": []
+    },
+    "adguard": {
+        "name": "AdGuard Home",
+        "dependencies": [],
+        "requirements": [
+            "adguardhome==0.3.0"
+        ]
+    },
+    "ads": {
+        "name": "Ads",
+        "dependencies": [],
+        "requirements": [
+            "pyads==3.0.7"
+        ]
+    },
+    "aftership": {
+        "name": "Aftership",
+        "dependencies": [],
+        "requirements": [
+            "pyaftership==0.1.2"
+        ]
+    },
+    "air_quality": {
+        "name": "Air quality",
+        "dependencies": [],
+        "requirements": []
+    },
+    "airly": {
+        "name": "Airly",
+        "dependencies": [],
+        "requirements": [
+            "airly==0.0.2"
+        ]
+    },
+    "airvisual": {
+        "name": "Airvisual",
+        "dependencies": [],
+        "requirements": [
+            "pyairvisual==3.0.1"
+        ]
+    },
+    "aladdin_connect": {
+        "name": "Aladdin connect",
+        "dependencies": [],
+        "requirements": [
+            "aladdin_connect==0.3"
+        ]
+    },
+    "alarm_control_panel": {
+        "name": "Alarm control panel",
+        "dependencies": [],
+        "requirements": []
+    },
+    "alarmdecoder": {
+        "name": "Alarmdecoder",
+        "dependencies": [],
+        "requirements": [
+            "alarmdecoder==1.13.2"
+        ]
+    },
+    "alarmdotcom": {
+        "name": "Alarmdotcom",
+        "dependencies": [],
+        "requirements": [
+            "pyalarmdotcom==0.3.2"
+        ]
+    },
+    "alert": {
+        "name": "Alert",
+        "dependencies": [],
+        "after_dependencies": [
+            "notify"
+        ],
+        "requirements": []
+    },
+    "alexa": {
+        "name": "Alexa",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "almond": {
+        "name": "Almond",
+        "dependencies": [
+            "http",
+            "conversation"
+        ],
+        "requirements": [
+            "pyalmond==0.0.2"
+        ]
+    },
+    "alpha_vantage": {
+        "name": "Alpha vantage",
+        "dependencies": [],
+        "requirements": [
+            "alpha_vantage==2.1.1"
+        ]
+    },
+    "amazon_polly": {
+        "name": "Amazon polly",
+        "dependencies": [],
+        "requirements": [
+            "boto3==1.9.233"
+        ]
+    },
+    "ambiclimate": {
+        "name": "Ambiclimate",
+        "dependencies": [],
+        "requirements": [
+            "ambiclimate==0.2.1"
+        ]
+    },
+    "ambient_station": {
+        "name": "Ambient station",
+        "dependencies": [],
+        "requirements": [
+            "aioambient==0.3.2"
+        ]
+    },
+    "amcrest": {
+        "name": "Amcrest",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "amcrest==1.5.3"
+        ]
+    },
+    "ampio": {
+        "name": "Ampio",
+        "dependencies": [],
+        "requirements": [
+            "asmog==0.0.6"
+        ]
+    },
+    "android_ip_webcam": {
+        "name": "Android ip webcam",
+        "dependencies": [],
+        "requirements": [
+            "pydroid-ipcam==0.8"
+        ]
+    },
+    "androidtv": {
+        "name": "Androidtv",
+        "dependencies": [],
+        "requirements": [
+            "adb-shell==0.0.8",
+            "androidtv==0.0.32"
+        ]
+    },
+    "anel_pwrctrl": {
+        "name": "Anel pwrctrl",
+        "dependencies": [],
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2"
+        ]
+    },
+    "anthemav": {
+        "name": "Anthemav",
+        "dependencies": [],
+        "requirements": [
+            "anthemav==1.1.10"
+        ]
+    },
+    "apache_kafka": {
+        "name": "Apache Kafka",
+        "dependencies": [],
+        "requirements": [
+            "aiokafka==0.5.1"
+        ]
+    },
+    "apcupsd": {
+        "name": "Apcupsd",
+        "dependencies": [],
+        "requirements": [
+            "apcaccess==0.0.13"
+        ]
+    },
+    "api": {
+        "name": "Home Assistant API",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "apns": {
+        "name": "Apns",
+        "dependencies": [],
+        "requirements": [
+            "apns2==0.3.0"
+        ]
+    },
+    "apple_tv": {
+        "name": "Apple tv",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "pyatv==0.3.13"
+        ]
+    },
+    "apprise": {
+        "name": "Apprise",
+        "dependencies": [],
+        "requirements": [
+            "apprise==0.8.1"
+        ]
+    },
+    "aprs": {
+        "name": "APRS",
+        "dependencies": [],
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==1.19.0"
+        ]
+    },
+    "aqualogic": {
+        "name": "Aqualogic",
+        "dependencies": [],
+        "requirements": [
+            "aqualogic==1.0"
+        ]
+    },
+    "aquostv": {
+        "name": "Aquostv",
+        "dependencies": [],
+        "requirements": [
+            "sharp_aquos_rc==0.3.2"
+        ]
+    },
+    "arcam_fmj": {
+        "name": "Arcam FMJ Receiver control",
+        "dependencies": [],
+        "requirements": [
+            "arcam-fmj==0.4.3"
+        ]
+    },
+    "arduino": {
+        "name": "Arduino",
+        "dependencies": [],
+        "requirements": [
+            "PyMata==2.20"
+        ]
+    },
+    "arest": {
+        "name": "Arest",
+        "dependencies": [],
+        "requirements": []
+    },
+    "arlo": {
+        "name": "Arlo",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "pyarlo==0.2.3"
+        ]
+    },
+    "aruba": {
+        "name": "Aruba",
+        "dependencies": [],
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "arwn": {
+        "name": "Arwn",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "asterisk_cdr": {
+        "name": "Asterisk cdr",
+        "dependencies": [
+            "asterisk_mbox"
+        ],
+        "requirements": []
+    },
+    "asterisk_mbox": {
+        "name": "Asterisk mbox",
+        "dependencies": [],
+        "requirements": [
+            "asterisk_mbox==0.5.0"
+        ]
+    },
+    "asuswrt": {
+        "name": "Asuswrt",
+        "dependencies": [],
+        "requirements": [
+            "aioasuswrt==1.1.22"
+        ]
+    },
+    "atome": {
+        "name": "Atome",
+        "dependencies": [],
+        "requirements": [
+            "pyatome==0.1.1"
+        ]
+    },
+    "august": {
+        "name": "August",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "py-august==0.7.0"
+        ]
+    },
+    "aurora": {
+        "name": "Aurora",
+        "dependencies": [],
+        "requirements": []
+    },
+    "aurora_abb_powerone": {
+        "name": "Aurora ABB Solar PV",
+        "dependencies": [],
+        "requirements": [
+            "aurorapy==0.2.6"
+        ]
+    },
+    "auth": {
+        "name": "Auth",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "automatic": {
+        "name": "Automatic",
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "requirements": [
+            "aioautomatic==0.6.5"
+        ]
+    },
+    "automation": {
+        "name": "Automation",
+        "dependencies": [
+            "device_automation",
+            "group",
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "avea": {
+        "name": "Elgato Avea",
+        "dependencies": [],
+        "requirements": [
+            "avea==1.4"
+        ]
+    },
+    "avion": {
+        "name": "Avion",
+        "dependencies": [],
+        "requirements": [
+            "avion==0.10"
+        ]
+    },
+    "awair": {
+        "name": "Awair",
+        "dependencies": [],
+        "requirements": [
+            "python_awair==0.0.4"
+        ]
+    },
+    "aws": {
+        "name": "Aws",
+        "dependencies": [],
+        "requirements": [
+            "aiobotocore==0.10.2"
+        ]
+    },
+    "axis": {
+        "name": "Axis",
+        "dependencies": [],
+        "requirements": [
+            "axis==25"
+        ]
+    },
+    "azure_event_hub": {
+        "name": "Azure Event Hub",
+        "dependencies": [],
+        "requirements": [
+            "azure-eventhub==1.3.1"
+        ]
+    },
+    "azure_service_bus": {
+        "name": "Azure Service Bus",
+        "dependencies": [],
+        "requirements": [
+            "azure-servicebus==0.50.1"
+        ]
+    },
+    "baidu": {
+        "name": "Baidu",
+        "dependencies": [],
+        "requirements": [
+            "baidu-aip==1.6.6"
+        ]
+    },
+    "bayesian": {
+        "name": "Bayesian",
+        "dependencies": [],
+        "requirements": []
+    },
+    "bbb_gpio": {
+        "name": "Bbb gpio",
+        "dependencies": [],
+        "requirements": [
+            "Adafruit_BBIO==1.0.0"
+        ]
+    },
+    "bbox": {
+        "name": "Bbox",
+        "dependencies": [],
+        "requirements": [
+            "pybbox==0.0.5-alpha"
+        ]
+    },
+    "beewi_smartclim": {
+        "name": "BeeWi SmartClim BLE sensor",
+        "dependencies": [],
+        "requirements": [
+            "beewi_smartclim==0.0.7"
+        ]
+    },
+    "bh1750": {
+        "name": "Bh1750",
+        "dependencies": [],
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "binary_sensor": {
+        "name": "Binary sensor",
+        "dependencies": [],
+        "requirements": []
+    },
+    "bitcoin": {
+        "name": "Bitcoin",
+        "dependencies": [],
+        "requirements": [
+            "blockchain==1.4.4"
+        ]
+    },
+    "bizkaibus": {
+        "name": "Bizkaibus",
+        "dependencies": [],
+        "requirements": [
+            "bizkaibus==0.1.1"
+        ]
+    },
+    "blackbird": {
+        "name": "Blackbird",
+        "dependencies": [],
+        "requirements": [
+            "pyblackbird==0.5"
+        ]
+    },
+    "blink": {
+        "name": "Blink",
+        "dependencies": [],
+        "requirements": [
+            "blinkpy==0.14.2"
+        ]
+    },
+    "blinksticklight": {
+        "name": "Blinksticklight",
+        "dependencies": [],
+        "requirements": [
+            "blinkstick==1.1.8"
+        ]
+    },
+    "blinkt": {
+        "name": "Blinkt",
+        "dependencies": [],
+        "requirements": [
+            "blinkt==0.1.0"
+        ]
+    },
+    "blockchain": {
+        "name": "Blockchain",
+        "dependencies": [],
+        "requirements": [
+            "python-blockchain-api==0.0.2"
+        ]
+    },
+    "bloomsky": {
+        "name": "Bloomsky",
+        "dependencies": [],
+        "requirements": []
+    },
+    "bluesound": {
+        "name": "Bluesound",
+        "dependencies": [],
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "bluetooth_le_tracker": {
+        "name": "Bluetooth le tracker",
+        "dependencies": [],
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "bluetooth_tracker": {
+        "name": "Bluetooth tracker",
+        "dependencies": [],
+        "requirements": [
+            "bt_proximity==0.2",
+            "pybluez==0.22"
+        ]
+    },
+    "bme280": {
+        "name": "Bme280",
+        "dependencies": [],
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bme680": {
+        "name": "Bme680",
+        "dependencies": [],
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bmw_connected_drive": {
+        "name": "BMW Connected Drive",
+        "dependencies": [],
+        "requirements": [
+            "bimmer_connected==0.6.0"
+        ]
+    },
+    "bom": {
+        "name": "Bom",
+        "dependencies": [],
+        "requirements": [
+            "bomradarloop==0.1.3"
+        ]
+    },
+    "braviatv": {
+        "name": "Braviatv",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "braviarc-homeassistant==0.3.7.dev0",
+            "getmac==0.8.1"
+        ]
+    },
+    "broadlink": {
+        "name": "Broadlink",
+        "dependencies": [],
+        "requirements": [
+            "broadlink==0.12.0"
+        ]
+    },
+    "brottsplatskartan": {
+        "name": "Brottsplatskartan",
+        "dependencies": [],
+        "requirements": [
+            "brottsplatskartan==0.0.1"
+        ]
+    },
+    "browser": {
+        "name": "Browser",
+        "dependencies": [],
+        "requirements": []
+    },
+    "brunt": {
+        "name": "Brunt",
+        "dependencies": [],
+        "requirements": [
+            "brunt==0.1.3"
+        ]
+    },
+    "bt_home_hub_5": {
+        "name": "Bt home hub 5",
+        "dependencies": [],
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1"
+        ]
+    },
+    "bt_smarthub": {
+        "name": "Bt smarthub",
+        "dependencies": [],
+        "requirements": [
+            "btsmarthub_devicelist==0.1.3"
+        ]
+    },
+    "buienradar": {
+        "name": "Buienradar",
+        "dependencies": [],
+        "requirements": [
+            "buienradar==1.0.1"
+        ]
+    },
+    "caldav": {
+        "name": "Caldav",
+        "dependencies": [],
+        "requirements": [
+            "caldav==0.6.1"
+        ]
+    },
+    "calendar": {
+        "name": "Calendar",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "camera": {
+        "name": "Camera",
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "stream"
+        ],
+        "requirements": []
+    },
+    "canary": {
+        "name": "Canary",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "py-canary==0.5.0"
+        ]
+    },
+    "cast": {
+        "name": "Cast",
+        "dependencies": [],
+        "requirements": [
+            "pychromecast==4.0.1"
+        ]
+    },
+    "cert_expiry": {
+        "name": "Cert expiry",
+        "dependencies": [],
+        "requirements": []
+    },
+    "channels": {
+        "name": "Channels",
+        "dependencies": [],
+        "requirements": [
+            "pychannels==1.0.0"
+        ]
+    },
+    "cisco_ios": {
+        "name": "Cisco ios",
+        "dependencies": [],
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "cisco_mobility_express": {
+        "name": "Cisco mobility express",
+        "dependencies": [],
+        "requirements": [
+            "ciscomobilityexpress==0.3.3"
+        ]
+    },
+    "cisco_webex_teams": {
+        "name": "Cisco webex teams",
+        "dependencies": [],
+        "requirements": [
+            "webexteamssdk==1.1.1"
+        ]
+    },
+    "ciscospark": {
+        "name": "Ciscospark",
+        "dependencies": [],
+        "requirements": [
+            "ciscosparkapi==0.4.2"
+        ]
+    },
+    "citybikes": {
+        "name": "Citybikes",
+        "dependencies": [],
+        "requirements": []
+    },
+    "clementine": {
+        "name": "Clementine",
+        "dependencies": [],
+        "requirements": [
+            "python-clementine-remote==1.0.1"
+        ]
+    },
+    "clickatell": {
+        "name": "Clickatell",
+        "dependencies": [],
+        "requirements": []
+    },
+    "clicksend": {
+        "name": "Clicksend",
+        "dependencies": [],
+        "requirements": []
+    },
+    "clicksend_tts": {
+        "name": "Clicksend tts",
+        "dependencies": [],
+        "requirements": []
+    },
+    "climate": {
+        "name": "Climate",
+        "dependencies": [],
+        "requirements": []
+    },
+    "cloud": {
+        "name": "Cloud",
+        "dependencies": [
+            "http",
+            "webhook"
+        ],
+        "requirements": [
+            "hass-nabucasa==0.29"
+        ]
+    },
+    "cloudflare": {
+        "name": "Cloudflare",
+        "dependencies": [],
+        "requirements": [
+            "pycfdns==0.0.1"
+        ]
+    },
+    "cmus": {
+        "name": "Cmus",
+        "dependencies": [],
+        "requirements": [
+            "pycmus==0.1.1"
+        ]
+    },
+    "co2signal": {
+        "name": "Co2signal",
+        "dependencies": [],
+        "requirements": [
+            "co2signal==0.4.2"
+        ]
+    },
+    "coinbase": {
+        "name": "Coinbase",
+        "dependencies": [],
+        "requirements": [
+            "coinbase==2.1.0"
+        ]
+    },
+    "coinmarketcap": {
+        "name": "Coinmarketcap",
+        "dependencies": [],
+        "requirements": [
+            "coinmarketcap==5.0.3"
+        ]
+    },
+    "comed_hourly_pricing": {
+        "name": "Comed hourly pricing",
+        "dependencies": [],
+        "requirements": []
+    },
+    "comfoconnect": {
+        "name": "Comfoconnect",
+        "dependencies": [],
+        "requirements": [
+            "pycomfoconnect==0.3"
+        ]
+    },
+    "command_line": {
+        "name": "Command line",
+        "dependencies": [],
+        "requirements": []
+    },
+    "concord232": {
+        "name": "Concord232",
+        "dependencies": [],
+        "requirements": [
+            "concord232==0.15"
+        ]
+    },
+    "config": {
+        "name": "Config",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "configurator": {
+        "name": "Configurator",
+        "dependencies": [],
+        "requirements": []
+    },
+    "conversation": {
+        "name": "Conversation",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "coolmaster": {
+        "name": "Coolmaster",
+        "dependencies": [],
+        "requirements": [
+            "pycoolmasternet==0.0.4"
+        ]
+    },
+    "counter": {
+        "name": "Counter",
+        "dependencies": [],
+        "requirements": []
+    },
+    "cover": {
+        "name": "Cover",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "cppm_tracker": {
+        "name": "Cppm tracker",
+        "dependencies": [],
+        "requirements": [
+            "clearpasspy==1.0.2"
+        ]
+    },
+    "cpuspeed": {
+        "name": "Cpuspeed",
+        "dependencies": [],
+        "requirements": [
+            "py-cpuinfo==5.0.0"
+        ]
+    },
+    "crimereports": {
+        "name": "Crimereports",
+        "dependencies": [],
+        "requirements": [
+            "crimereports==1.0.1"
+        ]
+    },
+    "cups": {
+        "name": "Cups",
+        "dependencies": [],
+        "requirements": [
+            "pycups==1.9.73"
+        ]
+    },
+    "currencylayer": {
+        "name": "Currencylayer",
+        "dependencies": [],
+        "requirements": []
+    },
+    "daikin": {
+        "name": "Daikin",
+        "dependencies": [],
+        "requirements": [
+            "pydaikin==1.6.1"
+        ]
+    },
+    "danfoss_air": {
+        "name": "Danfoss air",
+        "dependencies": [],
+        "requirements": [
+            "pydanfossair==0.1.0"
+        ]
+    },
+    "darksky": {
+        "name": "Darksky",
+        "dependencies": [],
+        "requirements": [
+            "python-forecastio==1.4.0"
+        ]
+    },
+    "datadog": {
+        "name": "Datadog",
+        "dependencies": [],
+        "requirements": [
+            "datadog==0.15.0"
+        ]
+    },
+    "ddwrt": {
+        "name": "Ddwrt",
+        "dependencies": [],
+        "requirements": []
+    },
+    "deconz": {
+        "name": "Deconz",
+        "dependencies": [],
+        "requirements": [
+            "pydeconz==64"
+        ]
+    },
+    "decora": {
+        "name": "Decora",
+        "dependencies": [],
+        "requirements": [
+            "bluepy==1.1.4",
+            "decora==0.6"
+        ]
+    },
+    "decora_wifi": {
+        "name": "Decora wifi",
+        "dependencies": [],
+        "requirements": [
+            "decora_wifi==1.4"
+        ]
+    },
+    "default_config": {
+        "name": "Default config",
+        "dependencies": [
+            "automation",
+            "cloud",
+            "config",
+            "frontend",
+            "history",
+            "logbook",
+            "map",
+            "mobile_app",
+            "person",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "updater",
+            "zeroconf"
+        ],
+        "requirements": []
+    },
+    "delijn": {
+        "name": "De Lijn",
+        "dependencies": [],
+        "requirements": [
+            "pydelijn==0.5.1"
+        ]
+    },
+    "deluge": {
+        "name": "Deluge",
+        "dependencies": [],
+        "requirements": [
+            "deluge-client==1.7.1"
+        ]
+    },
+    "demo": {
+        "name": "Demo",
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group",
+            "configurator"
+        ],
+        "requirements": []
+    },
+    "denon": {
+        "name": "Denon",
+        "dependencies": [],
+        "requirements": []
+    },
+    "denonavr": {
+        "name": "Denonavr",
+        "dependencies": [],
+        "requirements": [
+            "denonavr==0.7.10"
+        ]
+    },
+    "deutsche_bahn": {
+        "name": "Deutsche bahn",
+        "dependencies": [],
+        "requirements": [
+            "schiene==0.23"
+        ]
+    },
+    "device_automation": {
+        "name": "Device automation",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "device_sun_light_trigger": {
+        "name": "Device sun light trigger",
+        "dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person"
+        ],
+        "requirements": []
+    },
+    "device_tracker": {
+        "name": "Device tracker",
+        "dependencies": [
+            "group",
+            "zone"
+        ],
+        "requirements": []
+    },
+    "dht": {
+        "name": "Dht",
+        "dependencies": [],
+        "requirements": [
+            "Adafruit-DHT==1.4.0"
+        ]
+    },
+    "dialogflow": {
+        "name": "Dialogflow",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "digital_ocean": {
+        "name": "Digital ocean",
+        "dependencies": [],
+        "requirements": [
+            "python-digitalocean==1.13.2"
+        ]
+    },
+    "digitalloggers": {
+        "name": "Digitalloggers",
+        "dependencies": [],
+        "requirements": [
+            "dlipower==0.7.165"
+        ]
+    },
+    "directv": {
+        "name": "Directv",
+        "dependencies": [],
+        "requirements": [
+            "directpy==0.5"
+        ]
+    },
+    "discogs": {
+        "name": "Discogs",
+        "dependencies": [],
+        "requirements": [
+            "discogs_client==2.2.1"
+        ]
+    },
+    "discord": {
+        "name": "Discord",
+        "dependencies": [],
+        "requirements": [
+            "discord.py==1.2.4"
+        ]
+    },
+    "discovery": {
+        "name": "Discovery",
+        "dependencies": [],
+        "requirements": [
+            "netdisco==2.6.0"
+        ]
+    },
+    "dlib_face_detect": {
+        "name": "Dlib face detect",
+        "dependencies": [],
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlib_face_identify": {
+        "name": "Dlib face identify",
+        "dependencies": [],
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlink": {
+        "name": "Dlink",
+        "dependencies": [],
+        "requirements": [
+            "pyW215==0.6.0"
+        ]
+    },
+    "dlna_dmr": {
+        "name": "Dlna dmr",
+        "dependencies": [],
+        "requirements": [
+            "async-upnp-client==0.14.11"
+        ]
+    },
+    "dnsip": {
+        "name": "Dnsip",
+        "dependencies": [],
+        "requirements": [
+            "aiodns==2.0.0"
+        ]
+    },
+    "dominos": {
+        "name": "Dominos",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pizzapi==0.0.3"
+        ]
+    },
+    "doods": {
+        "name": "DOODS - Distributed Outside Object Detection Service",
+        "dependencies": [],
+        "requirements": [
+            "pydoods==1.0.2"
+        ]
+    },
+    "doorbird": {
+        "name": "Doorbird",
+        "dependencies": [],
+        "requirements": [
+            "doorbirdpy==2.0.8"
+        ]
+    },
+    "dovado": {
+        "name": "Dovado",
+        "dependencies": [],
+        "requirements": [
+            "dovado==0.4.1"
+        ]
+    },
+    "downloader": {
+        "name": "Downloader",
+        "dependencies": [],
+        "requirements": []
+    },
+    "dsmr": {
+        "name": "Dsmr",
+        "dependencies": [],
+        "requirements": [
+            "dsmr_parser==0.12"
+        ]
+    },
+    "dte_energy_bridge": {
+        "name": "Dte energy bridge",
+        "dependencies": [],
+        "requirements": []
+    },
+    "dublin_bus_transport": {
+        "name": "Dublin bus transport",
+        "dependencies": [],
+        "requirements": []
+    },
+    "duckdns": {
+        "name": "Duckdns",
+        "dependencies": [],
+        "requirements": []
+    },
+    "duke_energy": {
+        "name": "Duke energy",
+        "dependencies": [],
+        "requirements": [
+            "pydukeenergy==0.0.6"
+        ]
+    },
+    "dunehd": {
+        "name": "Dunehd",
+        "dependencies": [],
+        "requirements": [
+            "pdunehd==1.3"
+        ]
+    },
+    "dwd_weather_warnings": {
+        "name": "Dwd weather warnings",
+        "dependencies": [],
+        "requirements": []
+    },
+    "dweet": {
+        "name": "Dweet",
+        "dependencies": [],
+        "requirements": [
+            "dweepy==0.3.0"
+        ]
+    },
+    "dyson": {
+        "name": "Dyson",
+        "dependencies": [],
+        "requirements": [
+            "libpurecool==0.5.0"
+        ]
+    },
+    "ebox": {
+        "name": "Ebox",
+        "dependencies": [],
+        "requirements": [
+            "pyebox==1.1.4"
+        ]
+    },
+    "ebusd": {
+        "name": "Ebusd",
+        "dependencies": [],
+        "requirements": [
+            "ebusdpy==0.0.16"
+        ]
+    },
+    "ecoal_boiler": {
+        "name": "Ecoal boiler",
+        "dependencies": [],
+        "requirements": [
+            "ecoaliface==0.4.0"
+        ]
+    },
+    "ecobee": {
+        "name": "Ecobee",
+        "dependencies": [],
+        "requirements": [
+            "python-ecobee-api==0.1.4"
+        ]
+    },
+    "econet": {
+        "name": "Econet",
+        "dependencies": [],
+        "requirements": [
+            "pyeconet==0.0.11"
+        ]
+    },
+    "ecovacs": {
+        "name": "Ecovacs",
+        "dependencies": [],
+        "requirements": [
+            "sucks==0.9.4"
+        ]
+    },
+    "eddystone_temperature": {
+        "name": "Eddystone temperature",
+        "dependencies": [],
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.9.45"
+        ]
+    },
+    "edimax": {
+        "name": "Edimax",
+        "dependencies": [],
+        "requirements": [
+            "pyedimax==0.1"
+        ]
+    },
+    "ee_brightbox": {
+        "name": "Ee brightbox",
+        "dependencies": [],
+        "requirements": [
+            "eebrightbox==0.0.4"
+        ]
+    },
+    "efergy": {
+        "name": "Efergy",
+        "dependencies": [],
+        "requirements": []
+    },
+    "egardia": {
+        "name": "Egardia",
+        "dependencies": [],
+        "requirements": [
+            "pythonegardia==1.0.40"
+        ]
+    },
+    "eight_sleep": {
+        "name": "Eight sleep",
+        "dependencies": [],
+        "requirements": [
+            "pyeight==0.1.2"
+        ]
+    },
+    "eliqonline": {
+        "name": "Eliqonline",
+        "dependencies": [],
+        "requirements": [
+            "eliqonline==1.2.2"
+        ]
+    },
+    "elkm1": {
+        "name": "Elkm1",
+        "dependencies": [],
+        "requirements": [
+            "elkm1-lib==0.7.15"
+        ]
+    },
+    "elv": {
+        "name": "ELV PCA",
+        "dependencies": [],
+        "requirements": [
+            "pypca==0.0.5"
+        ]
+    },
+    "emby": {
+        "name": "Emby",
+        "dependencies": [],
+        "requirements": [
+            "pyemby==1.6"
+        ]
+    },
+    "emoncms": {
+        "name": "Emoncms",
+        "dependencies": [],
+        "requirements": []
+    },
+    "emoncms_history": {
+        "name": "Emoncms history",
+        "dependencies": [],
+        "requirements": []
+    },
+    "emulated_hue": {
+        "name": "Emulated hue",
+        "dependencies": [],
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "emulated_roku": {
+        "name": "Emulated roku",
+        "dependencies": [],
+        "requirements": [
+            "emulated_roku==0.1.8"
+        ]
+    },
+    "enigma2": {
+        "name": "Enigma2",
+        "dependencies": [],
+        "requirements": [
+            "openwebifpy==3.1.1"
+        ]
+    },
+    "enocean": {
+        "name": "Enocean",
+        "dependencies": [],
+        "requirements": [
+            "enocean==0.50"
+        ]
+    },
+    "enphase_envoy": {
+        "name": "Enphase envoy",
+        "dependencies": [],
+        "requirements": [
+            "envoy_reader==0.8.6"
+        ]
+    },
+    "entur_public_transport": {
+        "name": "Entur public transport",
+        "dependencies": [],
+        "requirements": [
+            "enturclient==0.2.0"
+        ]
+    },
+    "environment_canada": {
+        "name": "Environment Canada",
+        "dependencies": [],
+        "requirements": [
+            "env_canada==0.0.30"
+        ]
+    },
+    "envirophat": {
+        "name": "Envirophat",
+        "dependencies": [],
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "envisalink": {
+        "name": "Envisalink",
+        "dependencies": [],
+        "requirements": [
+            "pyenvisalink==4.0"
+        ]
+    },
+    "ephember": {
+        "name": "Ephember",
+        "dependencies": [],
+        "requirements": [
+            "pyephember==0.3.1"
+        ]
+    },
+    "epson": {
+        "name": "Epson",
+        "dependencies": [],
+        "requirements": [
+            "epson-projector==0.1.3"
+        ]
+    },
+    "epsonworkforce": {
+        "name": "Epson Workforce",
+        "dependencies": [],
+        "requirements": [
+            "epsonprinter==0.0.9"
+        ]
+    },
+    "eq3btsmart": {
+        "name": "Eq3btsmart",
+        "dependencies": [],
+        "requirements": [
+            "construct==2.9.45",
+            "python-eq3bt==0.1.11"
+        ]
+    },
+    "esphome": {
+        "name": "ESPHome",
+        "dependencies": [],
+        "requirements": [
+            "aioesphomeapi==2.4.2"
+        ]
+    },
+    "essent": {
+        "name": "Essent",
+        "dependencies": [],
+        "requirements": [
+            "PyEssent==0.13"
+        ]
+    },
+    "etherscan": {
+        "name": "Etherscan",
+        "dependencies": [],
+        "requirements": [
+            "python-etherscan-api==0.0.3"
+        ]
+    },
+    "eufy": {
+        "name": "Eufy",
+        "dependencies": [],
+        "requirements": [
+            "lakeside==0.12"
+        ]
+    },
+    "everlights": {
+        "name": "Everlights",
+        "dependencies": [],
+        "requirements": [
+            "pyeverlights==0.1.0"
+        ]
+    },
+    "evohome": {
+        "name": "Evohome",
+        "dependencies": [],
+        "requirements": [
+            "evohome-async==0.3.4b1"
+        ]
+    },
+    "facebook": {
+        "name": "Facebook",
+        "dependencies": [],
+        "requirements": []
+    },
+    "facebox": {
+        "name": "Facebox",
+        "dependencies": [],
+        "requirements": []
+    },
+    "fail2ban": {
+        "name": "Fail2ban",
+        "dependencies": [],
+        "requirements": []
+    },
+    "familyhub": {
+        "name": "Familyhub",
+        "dependencies": [],
+        "requirements": [
+            "python-family-hub-local==0.0.2"
+        ]
+    },
+    "fan": {
+        "name": "Fan",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "fastdotcom": {
+        "name": "Fastdotcom",
+        "dependencies": [],
+        "requirements": [
+            "fastdotcom==0.0.3"
+        ]
+    },
+    "feedreader": {
+        "name": "Feedreader",
+        "dependencies": [],
+        "requirements": [
+            "feedparser-homeassistant==5.2.2.dev1"
+        ]
+    },
+    "ffmpeg": {
+        "name": "Ffmpeg",
+        "dependencies": [],
+        "requirements": [
+            "ha-ffmpeg==2.0"
+        ]
+    },
+    "ffmpeg_motion": {
+        "name": "Ffmpeg motion",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": []
+    },
+    "ffmpeg_noise": {
+        "name": "Ffmpeg noise",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": []
+    },
+    "fibaro": {
+        "name": "Fibaro",
+        "dependencies": [],
+        "requirements": [
+            "fiblary3==0.1.7"
+        ]
+    },
+    "fido": {
+        "name": "Fido",
+        "dependencies": [],
+        "requirements": [
+            "pyfido==2.1.1"
+        ]
+    },
+    "file": {
+        "name": "File",
+        "dependencies": [],
+        "requirements": []
+    },
+    "filesize": {
+        "name": "Filesize",
+        "dependencies": [],
+        "requirements": []
+    },
+    "filter": {
+        "name": "Filter",
+        "dependencies": [],
+        "requirements": []
+    },
+    "fints": {
+        "name": "Fints",
+        "dependencies": [],
+        "requirements": [
+            "fints==1.0.1"
+        ]
+    },
+    "fitbit": {
+        "name": "Fitbit",
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "requirements": [
+            "fitbit==0.3.1"
+        ]
+    },
+    "fixer": {
+        "name": "Fixer",
+        "dependencies": [],
+        "requirements": [
+            "fixerio==1.0.0a0"
+        ]
+    },
+    "fleetgo": {
+        "name": "FleetGO",
+        "dependencies": [],
+        "requirements": [
+            "ritassist==0.9.2"
+        ]
+    },
+    "flexit": {
+        "name": "Flexit",
+        "dependencies": [
+            "modbus"
+        ],
+        "requirements": [
+            "pyflexit==0.3"
+        ]
+    },
+    "flic": {
+        "name": "Flic",
+        "dependencies": [],
+        "requirements": [
+            "pyflic-homeassistant==0.4.dev0"
+        ]
+    },
+    "flock": {
+        "name": "Flock",
+        "dependencies": [],
+        "requirements": []
+    },
+    "flunearyou": {
+        "name": "Flunearyou",
+        "dependencies": [],
+        "requirements": [
+            "pyflunearyou==1.0.3"
+        ]
+    },
+    "flux": {
+        "name": "Flux",
+        "dependencies": [],
+        "after_dependencies": [
+            "light"
+        ],
+        "requirements": []
+    },
+    "flux_led": {
+        "name": "Flux led",
+        "dependencies": [],
+        "requirements": [
+            "flux_led==0.22"
+        ]
+    },
+    "folder": {
+        "name": "Folder",
+        "dependencies": [],
+        "requirements": []
+    },
+    "folder_watcher": {
+        "name": "Folder watcher",
+        "dependencies": [],
+        "requirements": [
+            "watchdog==0.8.3"
+        ]
+    },
+    "foobot": {
+        "name": "Foobot",
+        "dependencies": [],
+        "requirements": [
+            "foobot_async==0.3.1"
+        ]
+    },
+    "fortigate": {
+        "name": "Fortigate",
+        "dependencies": [],
+        "requirements": [
+            "pyfgt==0.5.1"
+        ]
+    },
+    "fortios": {
+        "name": "Home Assistant Device Tracker to support FortiOS",
+        "dependencies": [],
+        "requirements": [
+            "fortiosapi==0.10.8"
+        ]
+    },
+    "foscam": {
+        "name": "Foscam",
+        "dependencies": [],
+        "requirements": [
+            "libpyfoscam==1.0"
+        ]
+    },
+    "foursquare": {
+        "name": "Foursquare",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "free_mobile": {
+        "name": "Free mobile",
+        "dependencies": [],
+        "requirements": [
+            "freesms==0.1.2"
+        ]
+    },
+    "freebox": {
+        "name": "Freebox",
+        "dependencies": [],
+        "requirements": [
+            "aiofreepybox==0.0.8"
+        ]
+    },
+    "freedns": {
+        "name": "Freedns",
+        "dependencies": [],
+        "requirements": []
+    },
+    "fritz": {
+        "name": "Fritz",
+        "dependencies": [],
+        "requirements": [
+            "fritzconnection==0.8.4"
+        ]
+    },
+    "fritzbox": {
+        "name": "Fritzbox",
+        "dependencies": [],
+        "requirements": [
+            "pyfritzhome==0.4.0"
+        ]
+    },
+    "fritzbox_callmonitor": {
+        "name": "Fritzbox callmonitor",
+        "dependencies": [],
+        "requirements": [
+            "fritzconnection==0.8.4"
+        ]
+    },
+    "fritzbox_netmonitor": {
+        "name": "Fritzbox netmonitor",
+        "dependencies": [],
+        "requirements": [
+            "fritzconnection==0.8.4"
+        ]
+    },
+    "fritzdect": {
+        "name": "Fritzdect",
+        "dependencies": [],
+        "requirements": [
+            "fritzhome==1.0.4"
+        ]
+    },
+    "fronius": {
+        "name": "Fronius",
+        "dependencies": [],
+        "requirements": [
+            "pyfronius==0.4.6"
+        ]
+    },
+    "frontend": {
+        "name": "Home Assistant Frontend",
+        "dependencies": [
+            "api",
+            "auth",
+            "http",
+            "lovelace",
+            "onboarding",
+            "system_log",
+            "websocket_api"
+        ],
+        "requirements": [
+            "home-assistant-frontend==20191108.0"
+        ]
+    },
+    "frontier_silicon": {
+        "name": "Frontier silicon",
+        "dependencies": [],
+        "requirements": [
+            "afsapi==0.0.4"
+        ]
+    },
+    "futurenow": {
+        "name": "Futurenow",
+        "dependencies": [],
+        "requirements": [
+            "pyfnip==0.2"
+        ]
+    },
+    "garadget": {
+        "name": "Garadget",
+        "dependencies": [],
+        "requirements": []
+    },
+    "gc100": {
+        "name": "Gc100",
+        "dependencies": [],
+        "requirements": [
+            "python-gc100==1.0.3a"
+        ]
+    },
+    "gearbest": {
+        "name": "Gearbest",
+        "dependencies": [],
+        "requirements": [
+            "gearbest_parser==1.0.7"
+        ]
+    },
+    "geizhals": {
+        "name": "Geizhals",
+        "dependencies": [],
+        "requirements": [
+            "geizhals==0.0.9"
+        ]
+    },
+    "generic": {
+        "name": "Generic",
+        "dependencies": [],
+        "requirements": []
+    },
+    "generic_thermostat": {
+        "name": "Generic thermostat",
+        "dependencies": [
+            "sensor",
+            "switch"
+        ],
+        "requirements": []
+    },
+    "geniushub": {
+        "name": "Genius Hub",
+        "dependencies": [],
+        "requirements": [
+            "geniushub-client==0.6.30"
+        ]
+    },
+    "geo_json_events": {
+        "name": "Geo json events",
+        "dependencies": [],
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "geo_location": {
+        "name": "Geo location",
+        "dependencies": [],
+        "requirements": []
+    },
+    "geo_rss_events": {
+        "name": "Geo RSS events",
+        "dependencies": [],
+        "requirements": [
+            "georss_generic_client==0.2"
+        ]
+    },
+    "geofency": {
+        "name": "Geofency",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "geonetnz_quakes": {
+        "name": "GeoNet NZ Quakes",
+        "dependencies": [],
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.11"
+        ]
+    },
+    "github": {
+        "name": "Github",
+        "dependencies": [],
+        "requirements": [
+            "PyGithub==1.43.8"
+        ]
+    },
+    "gitlab_ci": {
+        "name": "Gitlab ci",
+        "dependencies": [],
+        "requirements": [
+            "python-gitlab==1.6.0"
+        ]
+    },
+    "gitter": {
+        "name": "Gitter",
+        "dependencies": [],
+        "requirements": [
+            "gitterpy==0.1.7"
+        ]
+    },
+    "glances": {
+        "name": "Glances",
+        "dependencies": [],
+        "requirements": [
+            "glances_api==0.2.0"
+        ]
+    },
+    "gntp": {
+        "name": "Gntp",
+        "dependencies": [],
+        "requirements": [
+            "gntp==1.0.3"
+        ]
+    },
+    "goalfeed": {
+        "name": "Goalfeed",
+        "dependencies": [],
+        "requirements": [
+            "pysher==1.0.1"
+        ]
+    },
+    "gogogate2": {
+        "name": "Gogogate2",
+        "dependencies": [],
+        "requirements": [
+            "pygogogate2==0.1.1"
+        ]
+    },
+    "google": {
+        "name": "Google",
+        "dependencies": [],
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.10.3",
+            "oauth2client==4.0.0"
+        ]
+    },
+    "google_assistant": {
+        "name": "Google assistant",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "google_cloud": {
+        "name": "Google Cloud Platform",
+        "dependencies": [],
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0"
+        ]
+    },
+    "google_domains": {
+        "name": "Google domains",
+        "dependencies": [],
+        "requirements": []
+    },
+    "google_maps": {
+        "name": "Google maps",
+        "dependencies": [],
+        "requirements": [
+            "locationsharinglib==4.1.0"
+        ]
+    },
+    "google_pubsub": {
+        "name": "Google pubsub",
+        "dependencies": [],
+        "requirements": [
+            "google-cloud-pubsub==0.39.1"
+        ]
+    },
+    "google_translate": {
+        "name": "Google Translate",
+        "dependencies": [],
+        "requirements": [
+            "gTTS-token==1.1.3"
+        ]
+    },
+    "google_travel_time": {
+        "name": "Google travel time",
+        "dependencies": [],
+        "requirements": [
+            "googlemaps==2.5.1"
+        ]
+    },
+    "google_wifi": {
+        "name": "Google wifi",
+        "dependencies": [],
+        "requirements": []
+    },
+    "gpmdp": {
+        "name": "Gpmdp",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "websocket-client==0.54.0"
+        ]
+    },
+    "gpsd": {
+        "name": "Gpsd",
+        "dependencies": [],
+        "requirements": [
+            "gps3==0.33.3"
+        ]
+    },
+    "gpslogger": {
+        "name": "Gpslogger",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "graphite": {
+        "name": "Graphite",
+        "dependencies": [],
+        "requirements": []
+    },
+    "greeneye_monitor": {
+        "name": "Greeneye monitor",
+        "dependencies": [],
+        "requirements": [
+            "greeneye_monitor==1.0.1"
+        ]
+    },
+    "greenwave": {
+        "name": "Greenwave",
+        "dependencies": [],
+        "requirements": [
+            "greenwavereality==0.5.1"
+        ]
+    },
+    "group": {
+        "name": "Group",
+        "dependencies": [],
+        "requirements": []
+    },
+    "growatt_server": {
+        "name": "Growatt Server",
+        "dependencies": [],
+        "requirements": [
+            "growattServer==0.0.1"
+        ]
+    },
+    "gstreamer": {
+        "name": "Gstreamer",
+        "dependencies": [],
+        "requirements": [
+            "gstreamer-player==1.1.2"
+        ]
+    },
+    "gtfs": {
+        "name": "Gtfs",
+        "dependencies": [],
+        "requirements": [
+            "pygtfs==0.1.5"
+        ]
+    },
+    "habitica": {
+        "name": "Habitica",
+        "dependencies": [],
+        "requirements": [
+            "habitipy==0.2.0"
+        ]
+    },
+    "hangouts": {
+        "name": "Hangouts",
+        "dependencies": [],
+        "requirements": [
+            "hangups==0.4.9"
+        ]
+    },
+    "harman_kardon_avr": {
+        "name": "Harman kardon avr",
+        "dependencies": [],
+        "requirements": [
+            "hkavr==0.0.5"
+        ]
+    },
+    "harmony": {
+        "name": "Harmony",
+        "dependencies": [],
+        "requirements": [
+            "aioharmony==0.1.13"
+        ]
+    },
+    "hassio": {
+        "name": "Hass.io",
+        "dependencies": [
+            "http",
+            "panel_custom"
+        ],
+        "requirements": []
+    },
+    "haveibeenpwned": {
+        "name": "Haveibeenpwned",
+        "dependencies": [],
+        "requirements": []
+    },
+    "hddtemp": {
+        "name": "Hddtemp",
+        "dependencies": [],
+        "requirements": []
+    },
+    "hdmi_cec": {
+        "name": "Hdmi cec",
+        "dependencies": [],
+        "requirements": [
+            "pyCEC==0.4.13"
+        ]
+    },
+    "heatmiser": {
+        "name": "Heatmiser",
+        "dependencies": [],
+        "requirements": [
+            "heatmiserV3==0.9.1"
+        ]
+    },
+    "heos": {
+        "name": "HEOS",
+        "dependencies": [],
+        "requirements": [
+            "pyheos==0.6.0"
+        ]
+    },
+    "here_travel_time": {
+        "name": "HERE travel time",
+        "dependencies": [],
+        "requirements": [
+            "herepy==0.6.3.1"
+        ]
+    },
+    "hikvision": {
+        "name": "Hikvision",
+        "dependencies": [],
+        "requirements": [
+            "pyhik==0.2.4"
+        ]
+    },
+    "hikvisioncam": {
+        "name": "Hikvisioncam",
+        "dependencies": [],
+        "requirements": [
+            "hikvision==0.4"
+        ]
+    },
+    "history": {
+        "name": "History",
+        "dependencies": [
+            "http",
+            "recorder"
+        ],
+        "requirements": []
+    },
+    "history_graph": {
+        "name": "History graph",
+        "dependencies": [
+            "history"
+        ],
+        "requirements": []
+    },
+    "history_stats": {
+        "name": "History stats",
+        "dependencies": [
+            "history"
+        ],
+        "requirements": []
+    },
+    "hitron_coda": {
+        "name": "Hitron coda",
+        "dependencies": [],
+        "requirements": []
+    },
+    "hive": {
+        "name": "Hive",
+        "dependencies": [],
+        "requirements": [
+            "pyhiveapi==0.2.19.3"
+        ]
+    },
+    "hlk_sw16": {
+        "name": "Hlk sw16",
+        "dependencies": [],
+        "requirements": [
+            "hlk-sw16==0.0.7"
+        ]
+    },
+    "homeassistant": {
+        "name": "Home Assistant Core Integration",
+        "dependencies": [],
+        "requirements": []
+    },
+    "homekit": {
+        "name": "Homekit",
+        "dependencies": [],
+        "requirements": [
+            "HAP-python==2.6.0"
+        ]
+    },
+    "homekit_controller": {
+        "name": "Homekit controller",
+        "dependencies": [],
+        "requirements": [
+            "homekit[IP]==0.15.0"
+        ]
+    },
+    "homematic": {
+        "name": "Homematic",
+        "dependencies": [],
+        "requirements": [
+            "pyhomematic==0.1.61"
+        ]
+    },
+    "homematicip_cloud": {
+        "name": "Homematicip cloud",
+        "dependencies": [],
+        "requirements": [
+            "homematicip==0.10.13"
+        ]
+    },
+    "homeworks": {
+        "name": "Homeworks",
+        "dependencies": [],
+        "requirements": [
+            "pyhomeworks==0.0.6"
+        ]
+    },
+    "honeywell": {
+        "name": "Honeywell",
+        "dependencies": [],
+        "requirements": [
+            "somecomfort==0.5.2"
+        ]
+    },
+    "hook": {
+        "name": "Hook",
+        "dependencies": [],
+        "requirements": []
+    },
+    "horizon": {
+        "name": "Horizon",
+        "dependencies": [],
+        "requirements": [
+            "horimote==0.4.1"
+        ]
+    },
+    "hp_ilo": {
+        "name": "Hp ilo",
+        "dependencies": [],
+        "requirements": [
+            "python-hpilo==4.3"
+        ]
+    },
+    "html5": {
+        "name": "HTML5 Notifications",
+        "dependencies": [
+            "frontend"
+        ],
+        "requirements": [
+            "pywebpush==1.9.2"
+        ]
+    },
+    "http": {
+        "name": "HTTP",
+        "dependencies": [],
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "htu21d": {
+        "name": "Htu21d",
+        "dependencies": [],
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "huawei_lte": {
+        "name": "Huawei LTE",
+        "dependencies": [],
+        "requirements": [
+            "getmac==0.8.1",
+            "huawei-lte-api==1.4.3",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1"
+        ]
+    },
+    "huawei_router": {
+        "name": "Huawei router",
+        "dependencies": [],
+        "requirements": []
+    },
+    "hue": {
+        "name": "Philips Hue",
+        "dependencies": [],
+        "requirements": [
+            "aiohue==1.9.2"
+        ]
+    },
+    "hunterdouglas_powerview": {
+        "name": "Hunterdouglas powerview",
+        "dependencies": [],
+        "requirements": [
+            "aiopvapi==1.6.14"
+        ]
+    },
+    "hydrawise": {
+        "name": "Hydrawise",
+        "dependencies": [],
+        "requirements": [
+            "hydrawiser==0.1.1"
+        ]
+    },
+    "hyperion": {
+        "name": "Hyperion",
+        "dependencies": [],
+        "requirements": []
+    },
+    "ialarm": {
+        "name": "Ialarm",
+        "dependencies": [],
+        "requirements": [
+            "pyialarm==0.3"
+        ]
+    },
+    "iaqualink": {
+        "name": "Jandy iAqualink",
+        "dependencies": [],
+        "requirements": [
+            "iaqualink==0.3.0"
+        ]
+    },
+    "icloud": {
+        "name": "Icloud",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "pyicloud==0.9.1"
+        ]
+    },
+    "idteck_prox": {
+        "name": "Idteck prox",
+        "dependencies": [],
+        "requirements": [
+            "rfk101py==0.0.1"
+        ]
+    },
+    "ifttt": {
+        "name": "Ifttt",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pyfttt==0.3"
+        ]
+    },
+    "iglo": {
+        "name": "Iglo",
+        "dependencies": [],
+        "requirements": [
+            "iglo==1.2.7"
+        ]
+    },
+    "ign_sismologia": {
+        "name": "IGN Sismologia",
+        "dependencies": [],
+        "requirements": [
+            "georss_ign_sismologia_client==0.2"
+        ]
+    },
+    "ihc": {
+        "name": "Ihc",
+        "dependencies": [],
+        "requirements": [
+            "defusedxml==0.6.0",
+            "ihcsdk==2.3.0"
+        ]
+    },
+    "image_processing": {
+        "name": "Image processing",
+        "dependencies": [
+            "camera"
+        ],
+        "requirements": [
+            "pillow==6.2.1"
+        ]
+    },
+    "imap": {
+        "name": "Imap",
+        "dependencies": [],
+        "requirements": [
+            "aioimaplib==0.7.15"
+        ]
+    },
+    "imap_email_content": {
+        "name": "Imap email content",
+        "dependencies": [],
+        "requirements": []
+    },
+    "incomfort": {
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "dependencies": [],
+        "requirements": [
+            "incomfort-client==0.4.0"
+        ]
+    },
+    "influxdb": {
+        "name": "Influxdb",
+        "dependencies": [],
+        "requirements": [
+            "influxdb==5.2.3"
+        ]
+    },
+    "input_boolean": {
+        "name": "Input boolean",
+        "dependencies": [],
+        "requirements": []
+    },
+    "input_datetime": {
+        "name": "Input datetime",
+        "dependencies": [],
+        "requirements": []
+    },
+    "input_number": {
+        "name": "Input number",
+        "dependencies": [],
+        "requirements": []
+    },
+    "input_select": {
+        "name": "Input select",
+        "dependencies": [],
+        "requirements": []
+    },
+    "input_text": {
+        "name": "Input text",
+        "dependencies": [],
+        "requirements": []
+    },
+    "insteon": {
+        "name": "Insteon",
+        "dependencies": [],
+        "requirements": [
+            "insteonplm==0.16.5"
+        ]
+    },
+    "integration": {
+        "name": "Integration",
+        "dependencies": [],
+        "requirements": []
+    },
+    "intent_script": {
+        "name": "Intent script",
+        "dependencies": [],
+        "requirements": []
+    },
+    "ios": {
+        "name": "Ios",
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf"
+        ],
+        "requirements": []
+    },
+    "iota": {
+        "name": "Iota",
+        "dependencies": [],
+        "requirements": [
+            "pyota==2.0.5"
+        ]
+    },
+    "iperf3": {
+        "name": "Iperf3",
+        "dependencies": [],
+        "requirements": [
+            "iperf3==0.1.11"
+        ]
+    },
+    "ipma": {
+        "name": "Ipma",
+        "dependencies": [],
+        "requirements": [
+            "pyipma==1.2.1"
+        ]
+    },
+    "iqvia": {
+        "name": "IQVIA",
+        "dependencies": [],
+        "requirements": [
+            "numpy==1.17.3",
+            "pyiqvia==0.2.1"
+        ]
+    },
+    "irish_rail_transport": {
+        "name": "Irish rail transport",
+        "dependencies": [],
+        "requirements": [
+            "pyirishrail==0.0.2"
+        ]
+    },
+    "islamic_prayer_times": {
+        "name": "Islamic prayer times",
+        "dependencies": [],
+        "requirements": [
+            "prayer_times_calculator==0.0.3"
+        ]
+    },
+    "iss": {
+        "name": "Iss",
+        "dependencies": [],
+        "requirements": [
+            "pyiss==1.0.1"
+        ]
+    },
+    "isy994": {
+        "name": "Isy994",
+        "dependencies": [],
+        "requirements": [
+            "PyISY==1.1.2"
+        ]
+    },
+    "itach": {
+        "name": "Itach",
+        "dependencies": [],
+        "requirements": [
+            "pyitachip2ir==0.0.7"
+        ]
+    },
+    "itunes": {
+        "name": "Itunes",
+        "dependencies": [],
+        "requirements": []
+    },
+    "izone": {
+        "name": "izone",
+        "dependencies": [],
+        "requirements": [
+            "python-izone==1.1.1"
+        ]
+    },
+    "jewish_calendar": {
+        "name": "Jewish calendar",
+        "dependencies": [],
+        "requirements": [
+            "hdate==0.9.3"
+        ]
+    },
+    "joaoapps_join": {
+        "name": "Joaoapps join",
+        "dependencies": [],
+        "requirements": [
+            "python-join-api==0.0.4"
+        ]
+    },
+    "juicenet": {
+        "name": "Juicenet",
+        "dependencies": [],
+        "requirements": [
+            "python-juicenet==0.1.5"
+        ]
+    },
+    "kaiterra": {
+        "name": "Kaiterra",
+        "dependencies": [],
+        "requirements": [
+            "kaiterra-async-client==0.0.2"
+        ]
+    },
+    "kankun": {
+        "name": "Kankun",
+        "dependencies": [],
+        "requirements": []
+    },
+    "keba": {
+        "name": "Keba Charging Station",
+        "dependencies": [],
+        "requirements": [
+            "keba-kecontact==0.2.0"
+        ]
+    },
+    "keenetic_ndms2": {
+        "name": "Keenetic ndms2",
+        "dependencies": [],
+        "requirements": [
+            "ndms2_client==0.0.10"
+        ]
+    },
+    "keyboard": {
+        "name": "Keyboard",
+        "dependencies": [],
+        "requirements": [
+            "pyuserinput==0.1.11"
+        ]
+    },
+    "keyboard_remote": {
+        "name": "Keyboard remote",
+        "dependencies": [],
+        "requirements": [
+            "evdev==1.1.2",
+            "aionotify==0.2.0"
+        ]
+    },
+    "kira": {
+        "name": "Kira",
+        "dependencies": [],
+        "requirements": [
+            "pykira==0.1.1"
+        ]
+    },
+    "kiwi": {
+        "name": "Kiwi",
+        "dependencies": [],
+        "requirements": [
+            "kiwiki-client==0.1.1"
+        ]
+    },
+    "knx": {
+        "name": "Knx",
+        "dependencies": [],
+        "requirements": [
+            "xknx==0.11.2"
+        ]
+    },
+    "kodi": {
+        "name": "Kodi",
+        "dependencies": [],
+        "requirements": [
+            "jsonrpc-async==0.6",
+            "jsonrpc-websocket==0.6"
+        ]
+    },
+    "konnected": {
+        "name": "Konnected",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "konnected==0.1.5"
+        ]
+    },
+    "kwb": {
+        "name": "Kwb",
+        "dependencies": [],
+        "requirements": [
+            "pykwb==0.0.8"
+        ]
+    },
+    "lacrosse": {
+        "name": "Lacrosse",
+        "dependencies": [],
+        "requirements": [
+            "pylacrosse==0.4.0"
+        ]
+    },
+    "lametric": {
+        "name": "Lametric",
+        "dependencies": [],
+        "requirements": [
+            "lmnotify==0.0.4"
+        ]
+    },
+    "lannouncer": {
+        "name": "Lannouncer",
+        "dependencies": [],
+        "requirements": []
+    },
+    "lastfm": {
+        "name": "Lastfm",
+        "dependencies": [],
+        "requirements": [
+            "pylast==3.1.0"
+        ]
+    },
+    "launch_library": {
+        "name": "Launch library",
+        "dependencies": [],
+        "requirements": [
+            "pylaunches==0.2.0"
+        ]
+    },
+    "lcn": {
+        "name": "Lcn",
+        "dependencies": [],
+        "requirements": [
+            "pypck==0.6.3"
+        ]
+    },
+    "lg_netcast": {
+        "name": "Lg netcast",
+        "dependencies": [],
+        "requirements": [
+            "pylgnetcast-homeassistant==0.2.0.dev0"
+        ]
+    },
+    "lg_soundbar": {
+        "name": "Lg soundbar",
+        "dependencies": [],
+        "requirements": [
+            "temescal==0.1"
+        ]
+    },
+    "life360": {
+        "name": "Life360",
+        "dependencies": [],
+        "requirements": [
+            "life360==4.1.1"
+        ]
+    },
+    "lifx": {
+        "name": "Lifx",
+        "dependencies": [],
+        "requirements": [
+            "aiolifx==0.6.7",
+            "aiolifx_effects==0.2.2"
+        ]
+    },
+    "lifx_cloud": {
+        "name": "Lifx cloud",
+        "dependencies": [],
+        "requirements": []
+    },
+    "lifx_legacy": {
+        "name": "Lifx legacy",
+        "dependencies": [],
+        "requirements": [
+            "liffylights==0.9.4"
+        ]
+    },
+    "light": {
+        "name": "Light",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "lightwave": {
+        "name": "Lightwave",
+        "dependencies": [],
+        "requirements": [
+            "lightwave==0.15"
+        ]
+    },
+    "limitlessled": {
+        "name": "Limitlessled",
+        "dependencies": [],
+        "requirements": [
+            "limitlessled==1.1.3"
+        ]
+    },
+    "linksys_smart": {
+        "name": "Linksys smart",
+        "dependencies": [],
+        "requirements": []
+    },
+    "linky": {
+        "name": "Linky",
+        "dependencies": [],
+        "requirements": [
+            "pylinky==0.4.0"
+        ]
+    },
+    "linode": {
+        "name": "Linode",
+        "dependencies": [],
+        "requirements": [
+            "linode-api==4.1.9b1"
+        ]
+    },
+    "linux_battery": {
+        "name": "Linux battery",
+        "dependencies": [],
+        "requirements": [
+            "batinfo==0.4.2"
+        ]
+    },
+    "lirc": {
+        "name": "Lirc",
+        "dependencies": [],
+        "requirements": [
+            "python-lirc==1.2.3"
+        ]
+    },
+    "litejet": {
+        "name": "Litejet",
+        "dependencies": [],
+        "requirements": [
+            "pylitejet==0.1"
+        ]
+    },
+    "liveboxplaytv": {
+        "name": "Liveboxplaytv",
+        "dependencies": [],
+        "requirements": [
+            "liveboxplaytv==2.0.2",
+            "pyteleloisirs==3.5"
+        ]
+    },
+    "llamalab_automate": {
+        "name": "Llamalab automate",
+        "dependencies": [],
+        "requirements": []
+    },
+    "local_file": {
+        "name": "Local file",
+        "dependencies": [],
+        "requirements": []
+    },
+    "locative": {
+        "name": "Locative",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "lock": {
+        "name": "Lock",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "lockitron": {
+        "name": "Lockitron",
+        "dependencies": [],
+        "requirements": []
+    },
+    "logbook": {
+        "name": "Logbook",
+        "dependencies": [
+            "frontend",
+            "recorder"
+        ],
+        "requirements": []
+    },
+    "logentries": {
+        "name": "Logentries",
+        "dependencies": [],
+        "requirements": []
+    },
+    "logger": {
+        "name": "Logger",
+        "dependencies": [],
+        "requirements": []
+    },
+    "logi_circle": {
+        "name": "Logi Circle",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "logi_circle==0.2.2"
+        ]
+    },
+    "london_air": {
+        "name": "London air",
+        "dependencies": [],
+        "requirements": []
+    },
+    "london_underground": {
+        "name": "London underground",
+        "dependencies": [],
+        "requirements": [
+            "london-tube-status==0.2"
+        ]
+    },
+    "loopenergy": {
+        "name": "Loopenergy",
+        "dependencies": [],
+        "requirements": [
+            "pyloopenergy==0.1.3"
+        ]
+    },
+    "lovelace": {
+        "name": "Lovelace",
+        "dependencies": [],
+        "requirements": []
+    },
+    "luci": {
+        "name": "Luci",
+        "dependencies": [],
+        "requirements": [
+            "openwrt-luci-rpc==1.1.2"
+        ]
+    },
+    "luftdaten": {
+        "name": "Luftdaten",
+        "dependencies": [],
+        "requirements": [
+            "luftdaten==0.6.3"
+        ]
+    },
+    "lupusec": {
+        "name": "Lupusec",
+        "dependencies": [],
+        "requirements": [
+            "lupupy==0.0.17"
+        ]
+    },
+    "lutron": {
+        "name": "Lutron",
+        "dependencies": [],
+        "requirements": [
+            "pylutron==0.2.5"
+        ]
+    },
+    "lutron_caseta": {
+        "name": "Lutron caseta",
+        "dependencies": [],
+        "requirements": [
+            "pylutron-caseta==0.5.0"
+        ]
+    },
+    "lw12wifi": {
+        "name": "Lw12wifi",
+        "dependencies": [],
+        "requirements": [
+            "lw12==0.9.2"
+        ]
+    },
+    "lyft": {
+        "name": "Lyft",
+        "dependencies": [],
+        "requirements": [
+            "lyft_rides==0.2"
+        ]
+    },
+    "magicseaweed": {
+        "name": "Magicseaweed",
+        "dependencies": [],
+        "requirements": [
+            "magicseaweed==1.0.3"
+        ]
+    },
+    "mailbox": {
+        "name": "Mailbox",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "mailgun": {
+        "name": "Mailgun",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pymailgunner==1.4"
+        ]
+    },
+    "manual": {
+        "name": "Manual",
+        "dependencies": [],
+        "requirements": []
+    },
+    "manual_mqtt": {
+        "name": "Manual mqtt",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "map": {
+        "name": "Map",
+        "dependencies": [
+            "frontend"
+        ],
+        "requirements": []
+    },
+    "marytts": {
+        "name": "Marytts",
+        "dependencies": [],
+        "requirements": []
+    },
+    "mastodon": {
+        "name": "Mastodon",
+        "dependencies": [],
+        "requirements": [
+            "Mastodon.py==1.5.0"
+        ]
+    },
+    "matrix": {
+        "name": "Matrix",
+        "dependencies": [],
+        "requirements": [
+            "matrix-client==0.2.0"
+        ]
+    },
+    "maxcube": {
+        "name": "Maxcube",
+        "dependencies": [],
+        "requirements": [
+            "maxcube-api==0.1.0"
+        ]
+    },
+    "mcp23017": {
+        "name": "MCP23017 I/O Expander",
+        "dependencies": [],
+        "requirements": [
+            "RPi.GPIO==0.7.0",
+            "adafruit-blinka==1.2.1",
+            "adafruit-circuitpython-mcp230xx==1.1.2"
+        ]
+    },
+    "media_extractor": {
+        "name": "Media extractor",
+        "dependencies": [
+            "media_player"
+        ],
+        "requirements": [
+            "youtube_dl==2019.11.05"
+        ]
+    },
+    "media_player": {
+        "name": "Media player",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "mediaroom": {
+        "name": "Mediaroom",
+        "dependencies": [],
+        "requirements": [
+            "pymediaroom==0.6.4"
+        ]
+    },
+    "melissa": {
+        "name": "Melissa",
+        "dependencies": [],
+        "requirements": [
+            "py-melissa-climate==2.0.0"
+        ]
+    },
+    "meraki": {
+        "name": "Meraki",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "message_bird": {
+        "name": "Message bird",
+        "dependencies": [],
+        "requirements": [
+            "messagebird==1.2.0"
+        ]
+    },
+    "met": {
+        "name": "Met",
+        "dependencies": [],
+        "requirements": [
+            "pyMetno==0.4.6"
+        ]
+    },
+    "meteo_france": {
+        "name": "Meteo france",
+        "dependencies": [],
+        "requirements": [
+            "meteofrance==0.3.7",
+            "vigilancemeteo==3.0.0"
+        ]
+    },
+    "meteoalarm": {
+        "name": "meteoalarm",
+        "dependencies": [],
+        "requirements": [
+            "meteoalertapi==0.1.6"
+        ]
+    },
+    "metoffice": {
+        "name": "Metoffice",
+        "dependencies": [],
+        "requirements": [
+            "datapoint==0.4.3"
+        ]
+    },
+    "mfi": {
+        "name": "Mfi",
+        "dependencies": [],
+        "requirements": [
+            "mficlient==0.3.0"
+        ]
+    },
+    "mhz19": {
+        "name": "Mhz19",
+        "dependencies": [],
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "microsoft": {
+        "name": "Microsoft",
+        "dependencies": [],
+        "requirements": [
+            "pycsspeechtts==1.0.3"
+        ]
+    },
+    "microsoft_face": {
+        "name": "Microsoft face",
+        "dependencies": [
+            "camera"
+        ],
+        "requirements": []
+    },
+    "microsoft_face_detect": {
+        "name": "Microsoft face detect",
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "requirements": []
+    },
+    "microsoft_face_identify": {
+        "name": "Microsoft face identify",
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "requirements": []
+    },
+    "miflora": {
+        "name": "Miflora",
+        "dependencies": [],
+        "requirements": [
+            "bluepy==1.1.4",
+            "miflora==0.4.0"
+        ]
+    },
+    "mikrotik": {
+        "name": "Mikrotik",
+        "dependencies": [],
+        "requirements": [
+            "librouteros==2.3.0"
+        ]
+    },
+    "mill": {
+        "name": "Mill",
+        "dependencies": [],
+        "requirements": [
+            "millheater==0.3.4"
+        ]
+    },
+    "min_max": {
+        "name": "Min max",
+        "dependencies": [],
+        "requirements": []
+    },
+    "minio": {
+        "name": "Minio",
+        "dependencies": [],
+        "requirements": [
+            "minio==4.0.9"
+        ]
+    },
+    "mitemp_bt": {
+        "name": "Mitemp bt",
+        "dependencies": [],
+        "requirements": [
+            "mitemp_bt==0.0.1"
+        ]
+    },
+    "mjpeg": {
+        "name": "Mjpeg",
+        "dependencies": [],
+        "requirements": []
+    },
+    "mobile_app": {
+        "name": "Home Assistant Mobile App Support",
+        "dependencies": [
+            "cloud",
+            "http",
+            "webhook"
+        ],
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ]
+    },
+    "mochad": {
+        "name": "Mochad",
+        "dependencies": [],
+        "requirements": [
+            "pymochad==0.2.0"
+        ]
+    },
+    "modbus": {
+        "name": "Modbus",
+        "dependencies": [],
+        "requirements": [
+            "pymodbus==1.5.2"
+        ]
+    },
+    "modem_callerid": {
+        "name": "Modem callerid",
+        "dependencies": [],
+        "requirements": [
+            "basicmodem==0.7"
+        ]
+    },
+    "mold_indicator": {
+        "name": "Mold indicator",
+        "dependencies": [],
+        "requirements": []
+    },
+    "monoprice": {
+        "name": "Monoprice",
+        "dependencies": [],
+        "requirements": [
+            "pymonoprice==0.3"
+        ]
+    },
+    "moon": {
+        "name": "Moon",
+        "dependencies": [],
+        "requirements": []
+    },
+    "mopar": {
+        "name": "Mopar",
+        "dependencies": [],
+        "requirements": [
+            "motorparts==1.1.0"
+        ]
+    },
+    "mpchc": {
+        "name": "Mpchc",
+        "dependencies": [],
+        "requirements": []
+    },
+    "mpd": {
+        "name": "Mpd",
+        "dependencies": [],
+        "requirements": [
+            "python-mpd2==1.0.0"
+        ]
+    },
+    "mqtt": {
+        "name": "MQTT",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "hbmqtt==0.9.5",
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "mqtt_eventstream": {
+        "name": "Mqtt eventstream",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "mqtt_json": {
+        "name": "Mqtt json",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "mqtt_room": {
+        "name": "Mqtt room",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "mqtt_statestream": {
+        "name": "Mqtt statestream",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "msteams": {
+        "name": "Microsoft Teams",
+        "dependencies": [],
+        "requirements": [
+            "pymsteams==0.1.12"
+        ]
+    },
+    "mvglive": {
+        "name": "Mvglive",
+        "dependencies": [],
+        "requirements": [
+            "PyMVGLive==1.1.4"
+        ]
+    },
+    "mychevy": {
+        "name": "Mychevy",
+        "dependencies": [],
+        "requirements": [
+            "mychevy==1.2.0"
+        ]
+    },
+    "mycroft": {
+        "name": "Mycroft",
+        "dependencies": [],
+        "requirements": [
+            "mycroftapi==2.0"
+        ]
+    },
+    "myq": {
+        "name": "Myq",
+        "dependencies": [],
+        "requirements": [
+            "pymyq==2.0.1"
+        ]
+    },
+    "mysensors": {
+        "name": "Mysensors",
+        "dependencies": [],
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "requirements": [
+            "pymysensors==0.18.0"
+        ]
+    },
+    "mystrom": {
+        "name": "Mystrom",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "python-mystrom==0.5.0"
+        ]
+    },
+    "mythicbeastsdns": {
+        "name": "Mythicbeastsdns",
+        "dependencies": [],
+        "requirements": [
+            "mbddns==0.1.2"
+        ]
+    },
+    "n26": {
+        "name": "N26",
+        "dependencies": [],
+        "requirements": [
+            "n26==0.2.7"
+        ]
+    },
+    "nad": {
+        "name": "Nad",
+        "dependencies": [],
+        "requirements": [
+            "nad_receiver==0.0.11"
+        ]
+    },
+    "namecheapdns": {
+        "name": "Namecheapdns",
+        "dependencies": [],
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "nanoleaf": {
+        "name": "Nanoleaf",
+        "dependencies": [],
+        "requirements": [
+            "pynanoleaf==0.0.5"
+        ]
+    },
+    "neato": {
+        "name": "Neato",
+        "dependencies": [],
+        "requirements": [
+            "pybotvac==0.0.17"
+        ]
+    },
+    "nederlandse_spoorwegen": {
+        "name": "Nederlandse spoorwegen",
+        "dependencies": [],
+        "requirements": [
+            "nsapi==2.7.4"
+        ]
+    },
+    "nello": {
+        "name": "Nello",
+        "dependencies": [],
+        "requirements": [
+            "pynello==2.0.2"
+        ]
+    },
+    "ness_alarm": {
+        "name": "Ness alarm",
+        "dependencies": [],
+        "requirements": [
+            "nessclient==0.9.15"
+        ]
+    },
+    "nest": {
+        "name": "Nest",
+        "dependencies": [],
+        "requirements": [
+            "python-nest==4.1.0"
+        ]
+    },
+    "netatmo": {
+        "name": "Netatmo",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pyatmo==2.3.3"
+        ]
+    },
+    "netdata": {
+        "name": "Netdata",
+        "dependencies": [],
+        "requirements": [
+            "netdata==0.1.2"
+        ]
+    },
+    "netgear": {
+        "name": "Netgear",
+        "dependencies": [],
+        "requirements": [
+            "pynetgear==0.6.1"
+        ]
+    },
+    "netgear_lte": {
+        "name": "Netgear lte",
+        "dependencies": [],
+        "requirements": [
+            "eternalegypt==0.0.10"
+        ]
+    },
+    "netio": {
+        "name": "Netio",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pynetio==0.1.9.1"
+        ]
+    },
+    "neurio_energy": {
+        "name": "Neurio energy",
+        "dependencies": [],
+        "requirements": [
+            "neurio==0.3.1"
+        ]
+    },
+    "nextbus": {
+        "name": "NextBus",
+        "dependencies": [],
+        "requirements": [
+            "py_nextbusnext==0.1.4"
+        ]
+    },
+    "nfandroidtv": {
+        "name": "Nfandroidtv",
+        "dependencies": [],
+        "requirements": []
+    },
+    "niko_home_control": {
+        "name": "Niko home control",
+        "dependencies": [],
+        "requirements": [
+            "niko-home-control==0.2.1"
+        ]
+    },
+    "nilu": {
+        "name": "Nilu",
+        "dependencies": [],
+        "requirements": [
+            "niluclient==0.1.2"
+        ]
+    },
+    "nissan_leaf": {
+        "name": "Nissan leaf",
+        "dependencies": [],
+        "requirements": [
+            "pycarwings2==2.9"
+        ]
+    },
+    "nmap_tracker": {
+        "name": "Nmap tracker",
+        "dependencies": [],
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.1"
+        ]
+    },
+    "nmbs": {
+        "name": "Nmbs",
+        "dependencies": [],
+        "requirements": [
+            "pyrail==0.0.3"
+        ]
+    },
+    "no_ip": {
+        "name": "No ip",
+        "dependencies": [],
+        "requirements": []
+    },
+    "noaa_tides": {
+        "name": "Noaa tides",
+        "dependencies": [],
+        "requirements": [
+            "py_noaa==0.3.0"
+        ]
+    },
+    "norway_air": {
+        "name": "Norway air",
+        "dependencies": [],
+        "requirements": [
+            "pyMetno==0.4.6"
+        ]
+    },
+    "notify": {
+        "name": "Notify",
+        "dependencies": [],
+        "requirements": []
+    },
+    "notion": {
+        "name": "Notion",
+        "dependencies": [],
+        "requirements": [
+            "aionotion==1.1.0"
+        ]
+    },
+    "nsw_fuel_station": {
+        "name": "Nsw fuel station",
+        "dependencies": [],
+        "requirements": [
+            "nsw-fuel-api-client==1.0.10"
+        ]
+    },
+    "nsw_rural_fire_service_feed": {
+        "name": "Nsw rural fire service feed",
+        "dependencies": [],
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "nuheat": {
+        "name": "Nuheat",
+        "dependencies": [],
+        "requirements": [
+            "nuheat==0.3.0"
+        ]
+    },
+    "nuimo_controller": {
+        "name": "Nuimo controller",
+        "dependencies": [],
+        "requirements": [
+            "--only-binary=all nuimo==0.1.0"
+        ]
+    },
+    "nuki": {
+        "name": "Nuki",
+        "dependencies": [],
+        "requirements": [
+            "pynuki==1.3.3"
+        ]
+    },
+    "nut": {
+        "name": "Nut",
+        "dependencies": [],
+        "requirements": [
+            "pynut2==2.1.2"
+        ]
+    },
+    "nws": {
+        "name": "National Weather Service",
+        "dependencies": [],
+        "requirements": [
+            "pynws==0.8.1"
+        ]
+    },
+    "nx584": {
+        "name": "Nx584",
+        "dependencies": [],
+        "requirements": [
+            "pynx584==0.4"
+        ]
+    },
+    "nzbget": {
+        "name": "Nzbget",
+        "dependencies": [],
+        "requirements": [
+            "pynzbgetapi==0.2.0"
+        ]
+    },
+    "oasa_telematics": {
+        "name": "OASA Telematics",
+        "dependencies": [],
+        "requirements": [
+            "oasatelematics==0.3"
+        ]
+    },
+    "obihai": {
+        "name": "Obihai",
+        "dependencies": [],
+        "requirements": [
+            "pyobihai==1.2.0"
+        ]
+    },
+    "octoprint": {
+        "name": "Octoprint",
+        "dependencies": [],
+        "requirements": []
+    },
+    "oem": {
+        "name": "Oem",
+        "dependencies": [],
+        "requirements": [
+            "oemthermostat==1.1"
+        ]
+    },
+    "ohmconnect": {
+        "name": "Ohmconnect",
+        "dependencies": [],
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "ombi": {
+        "name": "Ombi",
+        "dependencies": [],
+        "requirements": [
+            "pyombi==0.1.5"
+        ]
+    },
+    "onboarding": {
+        "name": "Onboarding",
+        "dependencies": [
+            "auth",
+            "http"
+        ],
+        "requirements": []
+    },
+    "onewire": {
+        "name": "Onewire",
+        "dependencies": [],
+        "requirements": []
+    },
+    "onkyo": {
+        "name": "Onkyo",
+        "dependencies": [],
+        "requirements": [
+            "onkyo-eiscp==1.2.7"
+        ]
+    },
+    "onvif": {
+        "name": "Onvif",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "onvif-zeep-async==0.2.0"
+        ]
+    },
+    "openalpr_cloud": {
+        "name": "Openalpr cloud",
+        "dependencies": [],
+        "requirements": []
+    },
+    "openalpr_local": {
+        "name": "Openalpr local",
+        "dependencies": [],
+        "requirements": []
+    },
+    "opencv": {
+        "name": "Opencv",
+        "dependencies": [],
+        "requirements": [
+            "numpy==1.17.3",
+            "opencv-python-headless==4.1.1.26"
+        ]
+    },
+    "openevse": {
+        "name": "Openevse",
+        "dependencies": [],
+        "requirements": [
+            "openevsewifi==0.4"
+        ]
+    },
+    "openexchangerates": {
+        "name": "Openexchangerates",
+        "dependencies": [],
+        "requirements": []
+    },
+    "opengarage": {
+        "name": "Opengarage",
+        "dependencies": [],
+        "requirements": []
+    },
+    "openhardwaremonitor": {
+        "name": "Openhardwaremonitor",
+        "dependencies": [],
+        "requirements": []
+    },
+    "openhome": {
+        "name": "Openhome",
+        "dependencies": [],
+        "requirements": [
+            "openhomedevice==0.4.2"
+        ]
+    },
+    "opensensemap": {
+        "name": "Opensensemap",
+        "dependencies": [],
+        "requirements": [
+            "opensensemap-api==0.1.5"
+        ]
+    },
+    "opensky": {
+        "name": "Opensky",
+        "dependencies": [],
+        "requirements": []
+    },
+    "opentherm_gw": {
+        "name": "Opentherm Gateway",
+        "dependencies": [],
+        "requirements": [
+            "pyotgw==0.5b0"
+        ]
+    },
+    "openuv": {
+        "name": "Openuv",
+        "dependencies": [],
+        "requirements": [
+            "pyopenuv==1.0.9"
+        ]
+    },
+    "openweathermap": {
+        "name": "Openweathermap",
+        "dependencies": [],
+        "requirements": [
+            "pyowm==2.10.0"
+        ]
+    },
+    "opple": {
+        "name": "Opple",
+        "dependencies": [],
+        "requirements": [
+            "pyoppleio==1.0.5"
+        ]
+    },
+    "orangepi_gpio": {
+        "name": "Orangepi GPIO",
+        "dependencies": [],
+        "requirements": [
+            "OPi.GPIO==0.4.0"
+        ]
+    },
+    "oru": {
+        "name": "Orange and Rockland Utility Smart Energy Meter Sensor",
+        "dependencies": [],
+        "requirements": [
+            "oru==0.1.9"
+        ]
+    },
+    "orvibo": {
+        "name": "Orvibo",
+        "dependencies": [],
+        "requirements": [
+            "orvibo==1.1.1"
+        ]
+    },
+    "osramlightify": {
+        "name": "Osramlightify",
+        "dependencies": [],
+        "requirements": [
+            "lightify==1.0.7.2"
+        ]
+    },
+    "otp": {
+        "name": "Otp",
+        "dependencies": [],
+        "requirements": [
+            "pyotp==2.3.0"
+        ]
+    },
+    "owlet": {
+        "name": "Owlet",
+        "dependencies": [],
+        "requirements": [
+            "pyowlet==1.0.3"
+        ]
+    },
+    "owntracks": {
+        "name": "Owntracks",
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ]
+    },
+    "panasonic_bluray": {
+        "name": "Panasonic bluray",
+        "dependencies": [],
+        "requirements": [
+            "panacotta==0.1"
+        ]
+    },
+    "panasonic_viera": {
+        "name": "Panasonic viera",
+        "dependencies": [],
+        "requirements": [
+            "panasonic_viera==0.3.2",
+            "wakeonlan==1.1.6"
+        ]
+    },
+    "pandora": {
+        "name": "Pandora",
+        "dependencies": [],
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "panel_custom": {
+        "name": "Panel custom",
+        "dependencies": [
+            "frontend"
+        ],
+        "requirements": []
+    },
+    "panel_iframe": {
+        "name": "Panel iframe",
+        "dependencies": [
+            "frontend"
+        ],
+        "requirements": []
+    },
+    "pencom": {
+        "name": "Pencom",
+        "dependencies": [],
+        "requirements": [
+            "pencompy==0.0.3"
+        ]
+    },
+    "persistent_notification": {
+        "name": "Persistent notification",
+        "dependencies": [],
+        "requirements": []
+    },
+    "person": {
+        "name": "Person",
+        "dependencies": [],
+        "requirements": []
+    },
+    "philips_js": {
+        "name": "Philips js",
+        "dependencies": [],
+        "requirements": [
+            "ha-philipsjs==0.0.8"
+        ]
+    },
+    "pi_hole": {
+        "name": "Pi hole",
+        "dependencies": [],
+        "requirements": [
+            "hole==0.5.0"
+        ]
+    },
+    "picotts": {
+        "name": "Picotts",
+        "dependencies": [],
+        "requirements": []
+    },
+    "piglow": {
+        "name": "Piglow",
+        "dependencies": [],
+        "requirements": [
+            "piglow==1.2.4"
+        ]
+    },
+    "pilight": {
+        "name": "Pilight",
+        "dependencies": [],
+        "requirements": [
+            "pilight==0.1.1"
+        ]
+    },
+    "ping": {
+        "name": "Ping",
+        "dependencies": [],
+        "requirements": []
+    },
+    "pioneer": {
+        "name": "Pioneer",
+        "dependencies": [],
+        "requirements": []
+    },
+    "pjlink": {
+        "name": "Pjlink",
+        "dependencies": [],
+        "requirements": [
+            "pypjlink2==1.2.0"
+        ]
+    },
+    "plaato": {
+        "name": "Plaato Airlock",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "plant": {
+        "name": "Plant",
+        "dependencies": [
+            "group",
+            "zone"
+        ],
+        "requirements": []
+    },
+    "plex": {
+        "name": "Plex",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "plexapi==3.0.6",
+            "plexauth==0.0.5",
+            "plexwebsocket==0.0.4"
+        ]
+    },
+    "plugwise": {
+        "name": "Plugwise",
+        "dependencies": [],
+        "requirements": [
+            "haanna==0.13.5"
+        ]
+    },
+    "plum_lightpad": {
+        "name": "Plum lightpad",
+        "dependencies": [],
+        "requirements": [
+            "plumlightpad==0.0.11"
+        ]
+    },
+    "pocketcasts": {
+        "name": "Pocketcasts",
+        "dependencies": [],
+        "requirements": [
+            "pocketcasts==0.1"
+        ]
+    },
+    "point": {
+        "name": "Point",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pypoint==1.1.1"
+        ]
+    },
+    "postnl": {
+        "name": "Postnl",
+        "dependencies": [],
+        "requirements": [
+            "postnl_api==1.0.2"
+        ]
+    },
+    "prezzibenzina": {
+        "name": "Prezzibenzina",
+        "dependencies": [],
+        "requirements": [
+            "prezzibenzina-py==1.1.4"
+        ]
+    },
+    "proliphix": {
+        "name": "Proliphix",
+        "dependencies": [],
+        "requirements": [
+            "proliphix==0.4.1"
+        ]
+    },
+    "prometheus": {
+        "name": "Prometheus",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "prometheus_client==0.7.1"
+        ]
+    },
+    "prowl": {
+        "name": "Prowl",
+        "dependencies": [],
+        "requirements": []
+    },
+    "proximity": {
+        "name": "Proximity",
+        "dependencies": [
+            "device_tracker",
+            "zone"
+        ],
+        "requirements": []
+    },
+    "proxy": {
+        "name": "Proxy",
+        "dependencies": [],
+        "requirements": [
+            "pillow==6.2.1"
+        ]
+    },
+    "ps4": {
+        "name": "Ps4",
+        "dependencies": [],
+        "requirements": [
+            "pyps4-2ndscreen==1.0.1"
+        ]
+    },
+    "ptvsd": {
+        "name": "ptvsd",
+        "dependencies": [],
+        "requirements": [
+            "ptvsd==4.2.8"
+        ]
+    },
+    "pulseaudio_loopback": {
+        "name": "Pulseaudio loopback",
+        "dependencies": [],
+        "requirements": []
+    },
+    "push": {
+        "name": "Push",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": []
+    },
+    "pushbullet": {
+        "name": "Pushbullet",
+        "dependencies": [],
+        "requirements": [
+            "pushbullet.py==0.11.0"
+        ]
+    },
+    "pushetta": {
+        "name": "Pushetta",
+        "dependencies": [],
+        "requirements": [
+            "pushetta==1.0.15"
+        ]
+    },
+    "pushover": {
+        "name": "Pushover",
+        "dependencies": [],
+        "requirements": [
+            "python-pushover==0.4"
+        ]
+    },
+    "pushsafer": {
+        "name": "Pushsafer",
+        "dependencies": [],
+        "requirements": []
+    },
+    "pvoutput": {
+        "name": "Pvoutput",
+        "dependencies": [],
+        "requirements": []
+    },
+    "pyload": {
+        "name": "Pyload",
+        "dependencies": [],
+        "requirements": []
+    },
+    "python_script": {
+        "name": "Python script",
+        "dependencies": [],
+        "requirements": [
+            "restrictedpython==5.0"
+        ]
+    },
+    "qbittorrent": {
+        "name": "Qbittorrent",
+        "dependencies": [],
+        "requirements": [
+            "python-qbittorrent==0.3.1"
+        ]
+    },
+    "qld_bushfire": {
+        "name": "Queensland Bushfire Alert",
+        "dependencies": [],
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.3"
+        ]
+    },
+    "qnap": {
+        "name": "Qnap",
+        "dependencies": [],
+        "requirements": [
+            "qnapstats==0.2.7"
+        ]
+    },
+    "qrcode": {
+        "name": "Qrcode",
+        "dependencies": [],
+        "requirements": [
+            "pillow==6.2.1",
+            "pyzbar==0.1.7"
+        ]
+    },
+    "quantum_gateway": {
+        "name": "Quantum gateway",
+        "dependencies": [],
+        "requirements": [
+            "quantum-gateway==0.0.5"
+        ]
+    },
+    "qwikswitch": {
+        "name": "Qwikswitch",
+        "dependencies": [],
+        "requirements": [
+            "pyqwikswitch==0.93"
+        ]
+    },
+    "rachio": {
+        "name": "Rachio",
+        "dependencies": [],
+        "requirements": [
+            "rachiopy==0.1.3"
+        ]
+    },
+    "radarr": {
+        "name": "Radarr",
+        "dependencies": [],
+        "requirements": []
+    },
+    "radiotherm": {
+        "name": "Radiotherm",
+        "dependencies": [],
+        "requirements": [
+            "radiotherm==2.0.0"
+        ]
+    },
+    "rainbird": {
+        "name": "Rainbird",
+        "dependencies": [],
+        "requirements": [
+            "pyrainbird==0.4.1"
+        ]
+    },
+    "raincloud": {
+        "name": "Raincloud",
+        "dependencies": [],
+        "requirements": [
+            "raincloudy==0.0.7"
+        ]
+    },
+    "rainforest_eagle": {
+        "name": "Rainforest Eagle-200",
+        "dependencies": [],
+        "requirements": [
+            "eagle200_reader==0.2.1"
+        ]
+    },
+    "rainmachine": {
+        "name": "Rainmachine",
+        "dependencies": [],
+        "requirements": [
+            "regenmaschine==1.5.1"
+        ]
+    },
+    "random": {
+        "name": "Random",
+        "dependencies": [],
+        "requirements": []
+    },
+    "raspihats": {
+        "name": "Raspihats",
+        "dependencies": [],
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "raspyrfm": {
+        "name": "Raspyrfm",
+        "dependencies": [],
+        "requirements": [
+            "raspyrfm-client==1.2.8"
+        ]
+    },
+    "recollect_waste": {
+        "name": "Recollect waste",
+        "dependencies": [],
+        "requirements": [
+            "recollect-waste==1.0.1"
+        ]
+    },
+    "recorder": {
+        "name": "Recorder",
+        "dependencies": [],
+        "requirements": [
+            "sqlalchemy==1.3.10"
+        ]
+    },
+    "recswitch": {
+        "name": "Recswitch",
+        "dependencies": [],
+        "requirements": [
+            "pyrecswitch==1.0.2"
+        ]
+    },
+    "reddit": {
+        "name": "Reddit",
+        "dependencies": [],
+        "requirements": [
+            "praw==6.4.0"
+        ]
+    },
+    "rejseplanen": {
+        "name": "Rejseplanen",
+        "dependencies": [],
+        "requirements": [
+            "rjpl==0.3.5"
+        ]
+    },
+    "remember_the_milk": {
+        "name": "Remember the milk",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.10.3"
+        ]
+    },
+    "remote": {
+        "name": "Remote",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "remote_rpi_gpio": {
+        "name": "remote_rpi_gpio",
+        "dependencies": [],
+        "requirements": [
+            "gpiozero==1.5.1"
+        ]
+    },
+    "repetier": {
+        "name": "Repetier Server",
+        "dependencies": [],
+        "requirements": [
+            "pyrepetier==3.0.5"
+        ]
+    },
+    "rest": {
+        "name": "Rest",
+        "dependencies": [],
+        "requirements": []
+    },
+    "rest_command": {
+        "name": "Rest command",
+        "dependencies": [],
+        "requirements": []
+    },
+    "rflink": {
+        "name": "Rflink",
+        "dependencies": [],
+        "requirements": [
+            "rflink==0.0.46"
+        ]
+    },
+    "rfxtrx": {
+        "name": "Rfxtrx",
+        "dependencies": [],
+        "requirements": [
+            "pyRFXtrx==0.23"
+        ]
+    },
+    "ring": {
+        "name": "Ring",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "ring_doorbell==0.2.3"
+        ]
+    },
+    "ripple": {
+        "name": "Ripple",
+        "dependencies": [],
+        "requirements": [
+            "python-ripple-api==0.0.3"
+        ]
+    },
+    "rmvtransport": {
+        "name": "Rmvtransport",
+        "dependencies": [],
+        "requirements": [
+            "PyRMVtransport==0.2.9"
+        ]
+    },
+    "rocketchat": {
+        "name": "Rocketchat",
+        "dependencies": [],
+        "requirements": [
+            "rocketchat-API==0.6.1"
+        ]
+    },
+    "roku": {
+        "name": "Roku",
+        "dependencies": [],
+        "requirements": [
+            "roku==3.1"
+        ]
+    },
+    "roomba": {
+        "name": "Roomba",
+        "dependencies": [],
+        "requirements": [
+            "roombapy==1.3.1"
+        ]
+    },
+    "route53": {
+        "name": "Route53",
+        "dependencies": [],
+        "requirements": [
+            "boto3==1.9.233",
+            "ipify==1.0.0"
+        ]
+    },
+    "rova": {
+        "name": "Rova",
+        "dependencies": [],
+        "requirements": [
+            "rova==0.1.0"
+        ]
+    },
+    "rpi_camera": {
+        "name": "Rpi camera",
+        "dependencies": [],
+        "requirements": []
+    },
+    "rpi_gpio": {
+        "name": "Rpi gpio",
+        "dependencies": [],
+        "requirements": [
+            "RPi.GPIO==0.7.0"
+        ]
+    },
+    "rpi_gpio_pwm": {
+        "name": "Rpi gpio pwm",
+        "dependencies": [],
+        "requirements": [
+            "pwmled==1.4.1"
+        ]
+    },
+    "rpi_pfio": {
+        "name": "Rpi pfio",
+        "dependencies": [],
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5"
+        ]
+    },
+    "rpi_rf": {
+        "name": "Rpi rf",
+        "dependencies": [],
+        "requirements": [
+            "rpi-rf==0.9.7"
+        ]
+    },
+    "rss_feed_template": {
+        "name": "Rss feed template",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "rtorrent": {
+        "name": "Rtorrent",
+        "dependencies": [],
+        "requirements": []
+    },
+    "russound_rio": {
+        "name": "Russound rio",
+        "dependencies": [],
+        "requirements": [
+            "russound_rio==0.1.7"
+        ]
+    },
+    "russound_rnet": {
+        "name": "Russound rnet",
+        "dependencies": [],
+        "requirements": [
+            "russound==0.1.9"
+        ]
+    },
+    "sabnzbd": {
+        "name": "Sabnzbd",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "pysabnzbd==1.1.0"
+        ]
+    },
+    "saj": {
+        "name": "SAJ",
+        "dependencies": [],
+        "requirements": [
+            "pysaj==0.0.13"
+        ]
+    },
+    "samsungtv": {
+        "name": "Samsung TV",
+        "dependencies": [],
+        "requirements": [
+            "samsungctl[websocket]==0.7.1",
+            "wakeonlan==1.1.6"
+        ]
+    },
+    "satel_integra": {
+        "name": "Satel integra",
+        "dependencies": [],
+        "requirements": [
+            "satel_integra==0.3.4"
+        ]
+    },
+    "scene": {
+        "name": "Scene",
+        "dependencies": [],
+        "requirements": []
+    },
+    "scrape": {
+        "name": "Scrape",
+        "dependencies": [],
+        "requirements": [
+            "beautifulsoup4==4.8.1"
+        ]
+    },
+    "script": {
+        "name": "Script",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "scsgate": {
+        "name": "Scsgate",
+        "dependencies": [],
+        "requirements": [
+            "scsgate==0.1.0"
+        ]
+    },
+    "season": {
+        "name": "Season",
+        "dependencies": [],
+        "requirements": [
+            "ephem==3.7.6.0"
+        ]
+    },
+    "sendgrid": {
+        "name": "Sendgrid",
+        "dependencies": [],
+        "requirements": [
+            "sendgrid==6.1.0"
+        ]
+    },
+    "sense": {
+        "name": "Sense",
+        "dependencies": [],
+        "requirements": [
+            "sense_energy==0.7.0"
+        ]
+    },
+    "sensehat": {
+        "name": "Sensehat",
+        "dependencies": [],
+        "requirements": [
+            "sense-hat==2.2.0"
+        ]
+    },
+    "sensibo": {
+        "name": "Sensibo",
+        "dependencies": [],
+        "requirements": [
+            "pysensibo==1.0.3"
+        ]
+    },
+    "sensor": {
+        "name": "Sensor",
+        "dependencies": [],
+        "requirements": []
+    },
+    "serial": {
+        "name": "Serial",
+        "dependencies": [],
+        "requirements": [
+            "pyserial-asyncio==0.4"
+        ]
+    },
+    "serial_pm": {
+        "name": "Serial pm",
+        "dependencies": [],
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "sesame": {
+        "name": "Sesame Smart Lock",
+        "dependencies": [],
+        "requirements": [
+            "pysesame2==1.0.1"
+        ]
+    },
+    "seven_segments": {
+        "name": "Seven segments",
+        "dependencies": [],
+        "requirements": []
+    },
+    "seventeentrack": {
+        "name": "Seventeentrack",
+        "dependencies": [],
+        "requirements": [
+            "py17track==2.2.2"
+        ]
+    },
+    "shell_command": {
+        "name": "Shell command",
+        "dependencies": [],
+        "requirements": []
+    },
+    "shiftr": {
+        "name": "Shiftr",
+        "dependencies": [],
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "shodan": {
+        "name": "Shodan",
+        "dependencies": [],
+        "requirements": [
+            "shodan==1.19.0"
+        ]
+    },
+    "shopping_list": {
+        "name": "Shopping list",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "sht31": {
+        "name": "Sht31",
+        "dependencies": [],
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2"
+        ]
+    },
+    "sigfox": {
+        "name": "Sigfox",
+        "dependencies": [],
+        "requirements": []
+    },
+    "simplepush": {
+        "name": "Simplepush",
+        "dependencies": [],
+        "requirements": [
+            "simplepush==1.1.4"
+        ]
+    },
+    "simplisafe": {
+        "name": "Simplisafe",
+        "dependencies": [],
+        "requirements": [
+            "simplisafe-python==5.0.1"
+        ]
+    },
+    "simulated": {
+        "name": "Simulated",
+        "dependencies": [],
+        "requirements": []
+    },
+    "sinch": {
+        "name": "Sinch",
+        "dependencies": [],
+        "requirements": [
+            "clx-sdk-xms==1.0.0"
+        ]
+    },
+    "sisyphus": {
+        "name": "Sisyphus",
+        "dependencies": [],
+        "requirements": [
+            "sisyphus-control==2.2.1"
+        ]
+    },
+    "sky_hub": {
+        "name": "Sky hub",
+        "dependencies": [],
+        "requirements": []
+    },
+    "skybeacon": {
+        "name": "Skybeacon",
+        "dependencies": [],
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "skybell": {
+        "name": "Skybell",
+        "dependencies": [],
+        "requirements": [
+            "skybellpy==0.4.0"
+        ]
+    },
+    "slack": {
+        "name": "Slack",
+        "dependencies": [],
+        "requirements": [
+            "slacker==0.13.0"
+        ]
+    },
+    "sleepiq": {
+        "name": "Sleepiq",
+        "dependencies": [],
+        "requirements": [
+            "sleepyq==0.7"
+        ]
+    },
+    "slide": {
+        "name": "Slide",
+        "dependencies": [],
+        "requirements": [
+            "goslide-api==0.5.1"
+        ]
+    },
+    "sma": {
+        "name": "Sma",
+        "dependencies": [],
+        "requirements": [
+            "pysma==0.3.4"
+        ]
+    },
+    "smappee": {
+        "name": "Smappee",
+        "dependencies": [],
+        "requirements": [
+            "smappy==0.2.16"
+        ]
+    },
+    "smarthab": {
+        "name": "SmartHab",
+        "dependencies": [],
+        "requirements": [
+            "smarthab==0.20"
+        ]
+    },
+    "smartthings": {
+        "name": "Smartthings",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pysmartapp==0.3.2",
+            "pysmartthings==0.6.9"
+        ]
+    },
+    "smarty": {
+        "name": "smarty",
+        "dependencies": [],
+        "requirements": [
+            "pysmarty==0.8"
+        ]
+    },
+    "smhi": {
+        "name": "Smhi",
+        "dependencies": [],
+        "requirements": [
+            "smhi-pkg==1.0.10"
+        ]
+    },
+    "smtp": {
+        "name": "Smtp",
+        "dependencies": [],
+        "requirements": []
+    },
+    "snapcast": {
+        "name": "Snapcast",
+        "dependencies": [],
+        "requirements": [
+            "snapcast==2.0.10"
+        ]
+    },
+    "snips": {
+        "name": "Snips",
+        "dependencies": [
+            "mqtt"
+        ],
+        "requirements": []
+    },
+    "snmp": {
+        "name": "Snmp",
+        "dependencies": [],
+        "requirements": [
+            "pysnmp==4.4.12"
+        ]
+    },
+    "sochain": {
+        "name": "Sochain",
+        "dependencies": [],
+        "requirements": [
+            "python-sochain-api==0.0.2"
+        ]
+    },
+    "socialblade": {
+        "name": "Socialblade",
+        "dependencies": [],
+        "requirements": [
+            "socialbladeclient==0.2"
+        ]
+    },
+    "solaredge": {
+        "name": "Solaredge",
+        "dependencies": [],
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0"
+        ]
+    },
+    "solaredge_local": {
+        "name": "Solar Edge Local",
+        "dependencies": [],
+        "requirements": [
+            "solaredge-local==0.2.0"
+        ]
+    },
+    "solarlog": {
+        "name": "Solar-Log",
+        "dependencies": [],
+        "requirements": [
+            "sunwatcher==0.2.1"
+        ]
+    },
+    "solax": {
+        "name": "Solax Inverter",
+        "dependencies": [],
+        "requirements": [
+            "solax==0.2.2"
+        ]
+    },
+    "soma": {
+        "name": "Soma Open API",
+        "dependencies": [],
+        "requirements": [
+            "pysoma==0.0.10"
+        ]
+    },
+    "somfy": {
+        "name": "Somfy Open API",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pymfy==0.6.1"
+        ]
+    },
+    "somfy_mylink": {
+        "name": "Somfy MyLink",
+        "dependencies": [],
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6"
+        ]
+    },
+    "sonarr": {
+        "name": "Sonarr",
+        "dependencies": [],
+        "requirements": []
+    },
+    "songpal": {
+        "name": "Songpal",
+        "dependencies": [],
+        "requirements": [
+            "python-songpal==0.11.2"
+        ]
+    },
+    "sonos": {
+        "name": "Sonos",
+        "dependencies": [],
+        "requirements": [
+            "pysonos==0.0.24"
+        ]
+    },
+    "sony_projector": {
+        "name": "Sony projector",
+        "dependencies": [],
+        "requirements": [
+            "pysdcp==1"
+        ]
+    },
+    "soundtouch": {
+        "name": "Soundtouch",
+        "dependencies": [],
+        "requirements": [
+            "libsoundtouch==0.7.2"
+        ]
+    },
+    "spaceapi": {
+        "name": "Spaceapi",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "spc": {
+        "name": "Spc",
+        "dependencies": [],
+        "requirements": [
+            "pyspcwebgw==0.4.0"
+        ]
+    },
+    "speedtestdotnet": {
+        "name": "Speedtestdotnet",
+        "dependencies": [],
+        "requirements": [
+            "speedtest-cli==2.1.2"
+        ]
+    },
+    "spider": {
+        "name": "Spider",
+        "dependencies": [],
+        "requirements": [
+            "spiderpy==1.3.1"
+        ]
+    },
+    "splunk": {
+        "name": "Splunk",
+        "dependencies": [],
+        "requirements": []
+    },
+    "spotcrime": {
+        "name": "Spotcrime",
+        "dependencies": [],
+        "requirements": [
+            "spotcrime==1.0.4"
+        ]
+    },
+    "spotify": {
+        "name": "Spotify",
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "requirements": [
+            "spotipy-homeassistant==2.4.4.dev1"
+        ]
+    },
+    "sql": {
+        "name": "Sql",
+        "dependencies": [],
+        "requirements": [
+            "sqlalchemy==1.3.10"
+        ]
+    },
+    "squeezebox": {
+        "name": "Squeezebox",
+        "dependencies": [],
+        "requirements": []
+    },
+    "ssdp": {
+        "name": "SSDP",
+        "dependencies": [],
+        "requirements": [
+            "netdisco==2.6.0"
+        ]
+    },
+    "starlingbank": {
+        "name": "Starlingbank",
+        "dependencies": [],
+        "requirements": [
+            "starlingbank==3.1"
+        ]
+    },
+    "startca": {
+        "name": "Startca",
+        "dependencies": [],
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "statistics": {
+        "name": "Statistics",
+        "dependencies": [],
+        "requirements": []
+    },
+    "statsd": {
+        "name": "Statsd",
+        "dependencies": [],
+        "requirements": [
+            "statsd==3.2.1"
+        ]
+    },
+    "steam_online": {
+        "name": "Steam online",
+        "dependencies": [],
+        "requirements": [
+            "steamodd==4.21"
+        ]
+    },
+    "stiebel_eltron": {
+        "name": "STIEBEL ELTRON",
+        "dependencies": [
+            "modbus"
+        ],
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2"
+        ]
+    },
+    "stream": {
+        "name": "Stream",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "av==6.1.2"
+        ]
+    },
+    "streamlabswater": {
+        "name": "Streamlabs Water",
+        "dependencies": [],
+        "requirements": [
+            "streamlabswater==1.0.1"
+        ]
+    },
+    "stt": {
+        "name": "Stt",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "suez_water": {
+        "name": "Suez Water Consumption Sensor",
+        "dependencies": [],
+        "requirements": [
+            "pysuez==0.1.17"
+        ]
+    },
+    "sun": {
+        "name": "Sun",
+        "dependencies": [],
+        "requirements": []
+    },
+    "supervisord": {
+        "name": "Supervisord",
+        "dependencies": [],
+        "requirements": []
+    },
+    "supla": {
+        "name": "Supla",
+        "dependencies": [],
+        "requirements": [
+            "pysupla==0.0.3"
+        ]
+    },
+    "swiss_hydrological_data": {
+        "name": "Swiss hydrological data",
+        "dependencies": [],
+        "requirements": [
+            "swisshydrodata==0.0.3"
+        ]
+    },
+    "swiss_public_transport": {
+        "name": "Swiss public transport",
+        "dependencies": [],
+        "requirements": [
+            "python_opendata_transport==0.1.4"
+        ]
+    },
+    "swisscom": {
+        "name": "Swisscom",
+        "dependencies": [],
+        "requirements": []
+    },
+    "switch": {
+        "name": "Switch",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "switchbot": {
+        "name": "Switchbot",
+        "dependencies": [],
+        "requirements": [
+            "PySwitchbot==0.6.2"
+        ]
+    },
+    "switcher_kis": {
+        "name": "Switcher",
+        "dependencies": [],
+        "requirements": [
+            "aioswitcher==2019.4.26"
+        ]
+    },
+    "switchmate": {
+        "name": "Switchmate",
+        "dependencies": [],
+        "requirements": [
+            "pySwitchmate==0.4.6"
+        ]
+    },
+    "syncthru": {
+        "name": "Syncthru",
+        "dependencies": [],
+        "requirements": [
+            "pysyncthru==0.5.0"
+        ]
+    },
+    "synology": {
+        "name": "Synology",
+        "dependencies": [],
+        "requirements": [
+            "py-synology==0.2.0"
+        ]
+    },
+    "synology_chat": {
+        "name": "Synology chat",
+        "dependencies": [],
+        "requirements": []
+    },
+    "synology_srm": {
+        "name": "Synology SRM",
+        "dependencies": [],
+        "requirements": [
+            "synology-srm==0.0.7"
+        ]
+    },
+    "synologydsm": {
+        "name": "Synologydsm",
+        "dependencies": [],
+        "requirements": [
+            "python-synology==0.2.0"
+        ]
+    },
+    "syslog": {
+        "name": "Syslog",
+        "dependencies": [],
+        "requirements": []
+    },
+    "system_health": {
+        "name": "System health",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "system_log": {
+        "name": "System log",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "systemmonitor": {
+        "name": "Systemmonitor",
+        "dependencies": [],
+        "requirements": [
+            "psutil==5.6.3"
+        ]
+    },
+    "tado": {
+        "name": "Tado",
+        "dependencies": [],
+        "requirements": [
+            "python-tado==0.2.9"
+        ]
+    },
+    "tahoma": {
+        "name": "Tahoma",
+        "dependencies": [],
+        "requirements": [
+            "tahoma-api==0.0.14"
+        ]
+    },
+    "tank_utility": {
+        "name": "Tank utility",
+        "dependencies": [],
+        "requirements": [
+            "tank_utility==1.4.0"
+        ]
+    },
+    "tapsaff": {
+        "name": "Tapsaff",
+        "dependencies": [],
+        "requirements": [
+            "tapsaff==0.2.1"
+        ]
+    },
+    "tautulli": {
+        "name": "Tautulli",
+        "dependencies": [],
+        "requirements": [
+            "pytautulli==0.5.0"
+        ]
+    },
+    "tcp": {
+        "name": "Tcp",
+        "dependencies": [],
+        "requirements": []
+    },
+    "ted5000": {
+        "name": "Ted5000",
+        "dependencies": [],
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "teksavvy": {
+        "name": "Teksavvy",
+        "dependencies": [],
+        "requirements": []
+    },
+    "telegram": {
+        "name": "Telegram",
+        "dependencies": [
+            "telegram_bot"
+        ],
+        "requirements": []
+    },
+    "telegram_bot": {
+        "name": "Telegram bot",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "python-telegram-bot==11.1.0",
+            "PySocks==1.7.1"
+        ]
+    },
+    "tellduslive": {
+        "name": "Tellduslive",
+        "dependencies": [],
+        "requirements": [
+            "tellduslive==0.10.10"
+        ]
+    },
+    "tellstick": {
+        "name": "Tellstick",
+        "dependencies": [],
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2"
+        ]
+    },
+    "telnet": {
+        "name": "Telnet",
+        "dependencies": [],
+        "requirements": []
+    },
+    "temper": {
+        "name": "Temper",
+        "dependencies": [],
+        "requirements": [
+            "temperusb==1.5.3"
+        ]
+    },
+    "template": {
+        "name": "Template",
+        "dependencies": [],
+        "requirements": []
+    },
+    "tensorflow": {
+        "name": "Tensorflow",
+        "dependencies": [],
+        "requirements": [
+            "tensorflow==1.13.2",
+            "numpy==1.17.3",
+            "protobuf==3.6.1"
+        ]
+    },
+    "tesla": {
+        "name": "Tesla",
+        "dependencies": [],
+        "requirements": [
+            "teslajsonpy==0.0.26"
+        ]
+    },
+    "tfiac": {
+        "name": "Tfiac",
+        "dependencies": [],
+        "requirements": [
+            "pytfiac==0.4"
+        ]
+    },
+    "thermoworks_smoke": {
+        "name": "Thermoworks smoke",
+        "dependencies": [],
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8"
+        ]
+    },
+    "thethingsnetwork": {
+        "name": "Thethingsnetwork",
+        "dependencies": [],
+        "requirements": []
+    },
+    "thingspeak": {
+        "name": "Thingspeak",
+        "dependencies": [],
+        "requirements": [
+            "thingspeak==1.0.0"
+        ]
+    },
+    "thinkingcleaner": {
+        "name": "Thinkingcleaner",
+        "dependencies": [],
+        "requirements": [
+            "pythinkingcleaner==0.0.3"
+        ]
+    },
+    "thomson": {
+        "name": "Thomson",
+        "dependencies": [],
+        "requirements": []
+    },
+    "threshold": {
+        "name": "Threshold",
+        "dependencies": [],
+        "requirements": []
+    },
+    "tibber": {
+        "name": "Tibber",
+        "dependencies": [],
+        "requirements": [
+            "pyTibber==0.11.7"
+        ]
+    },
+    "tikteck": {
+        "name": "Tikteck",
+        "dependencies": [],
+        "requirements": [
+            "tikteck==0.4"
+        ]
+    },
+    "tile": {
+        "name": "Tile",
+        "dependencies": [],
+        "requirements": [
+            "pytile==3.0.1"
+        ]
+    },
+    "time_date": {
+        "name": "Time date",
+        "dependencies": [],
+        "requirements": []
+    },
+    "timer": {
+        "name": "Timer",
+        "dependencies": [],
+        "requirements": []
+    },
+    "tod": {
+        "name": "Tod",
+        "dependencies": [],
+        "requirements": []
+    },
+    "todoist": {
+        "name": "Todoist",
+        "dependencies": [],
+        "requirements": [
+            "todoist-python==8.0.0"
+        ]
+    },
+    "tof": {
+        "name": "Tof",
+        "dependencies": [
+            "rpi_gpio"
+        ],
+        "requirements": [
+            "VL53L1X2==0.1.5"
+        ]
+    },
+    "tomato": {
+        "name": "Tomato",
+        "dependencies": [],
+        "requirements": []
+    },
+    "toon": {
+        "name": "Toon",
+        "dependencies": [],
+        "requirements": [
+            "toonapilib==3.2.4"
+        ]
+    },
+    "torque": {
+        "name": "Torque",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "totalconnect": {
+        "name": "Totalconnect",
+        "dependencies": [],
+        "requirements": [
+            "total_connect_client==0.28"
+        ]
+    },
+    "touchline": {
+        "name": "Touchline",
+        "dependencies": [],
+        "requirements": [
+            "pytouchline==0.7"
+        ]
+    },
+    "tplink": {
+        "name": "Tplink",
+        "dependencies": [],
+        "requirements": [
+            "pyHS100==0.3.5"
+        ]
+    },
+    "tplink_lte": {
+        "name": "Tplink lte",
+        "dependencies": [],
+        "requirements": [
+            "tp-connected==0.0.4"
+        ]
+    },
+    "traccar": {
+        "name": "Traccar",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0"
+        ]
+    },
+    "trackr": {
+        "name": "Trackr",
+        "dependencies": [],
+        "requirements": [
+            "pytrackr==0.0.5"
+        ]
+    },
+    "tradfri": {
+        "name": "Tradfri",
+        "dependencies": [],
+        "requirements": [
+            "pytradfri[async]==6.4.0"
+        ]
+    },
+    "trafikverket_train": {
+        "name": "Trafikverket train information",
+        "dependencies": [],
+        "requirements": [
+            "pytrafikverket==0.1.5.9"
+        ]
+    },
+    "trafikverket_weatherstation": {
+        "name": "Trafikverket weatherstation",
+        "dependencies": [],
+        "requirements": [
+            "pytrafikverket==0.1.5.9"
+        ]
+    },
+    "transmission": {
+        "name": "Transmission",
+        "dependencies": [],
+        "requirements": [
+            "transmissionrpc==0.11"
+        ]
+    },
+    "transport_nsw": {
+        "name": "Transport nsw",
+        "dependencies": [],
+        "requirements": [
+            "PyTransportNSW==0.1.1"
+        ]
+    },
+    "travisci": {
+        "name": "Travisci",
+        "dependencies": [],
+        "requirements": [
+            "TravisPy==0.3.5"
+        ]
+    },
+    "trend": {
+        "name": "Trend",
+        "dependencies": [],
+        "requirements": [
+            "numpy==1.17.3"
+        ],
+        "lazy_imports": [
+            "numpy"
+        ]
+    },
+    "tts": {
+        "name": "Tts",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "mutagen==1.42.0"
+        ]
+    },
+    "tuya": {
+        "name": "Tuya",
+        "dependencies": [],
+        "requirements": [
+            "tuyaha==0.0.4"
+        ]
+    },
+    "twentemilieu": {
+        "name": "Twente Milieu",
+        "dependencies": [],
+        "requirements": [
+            "twentemilieu==0.1.0"
+        ]
+    },
+    "twilio": {
+        "name": "Twilio",
+        "dependencies": [
+            "webhook"
+        ],
+        "requirements": [
+            "twilio==6.32.0"
+        ]
+    },
+    "twilio_call": {
+        "name": "Twilio call",
+        "dependencies": [
+            "twilio"
+        ],
+        "requirements": []
+    },
+    "twilio_sms": {
+        "name": "Twilio sms",
+        "dependencies": [
+            "twilio"
+        ],
+        "requirements": []
+    },
+    "twitch": {
+        "name": "Twitch",
+        "dependencies": [],
+        "requirements": [
+            "python-twitch-client==0.6.0"
+        ]
+    },
+    "twitter": {
+        "name": "Twitter",
+        "dependencies": [],
+        "requirements": [
+            "TwitterAPI==2.5.10"
+        ]
+    },
+    "ubee": {
+        "name": "Ubee",
+        "dependencies": [],
+        "requirements": [
+            "pyubee==0.7"
+        ]
+    },
+    "ubus": {
+        "name": "Ubus",
+        "dependencies": [],
+        "requirements": []
+    },
+    "ue_smart_radio": {
+        "name": "Ue smart radio",
+        "dependencies": [],
+        "requirements": []
+    },
+    "uk_transport": {
+        "name": "Uk transport",
+        "dependencies": [],
+        "requirements": []
+    },
+    "unifi": {
+        "name": "Unifi",
+        "dependencies": [],
+        "requirements": [
+            "aiounifi==11"
+        ]
+    },
+    "unifi_direct": {
+        "name": "Unifi direct",
+        "dependencies": [],
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "unifiled": {
+        "name": "Unifi LED",
+        "dependencies": [],
+        "requirements": [
+            "unifiled==0.11"
+        ]
+    },
+    "universal": {
+        "name": "Universal",
+        "dependencies": [],
+        "requirements": []
+    },
+    "upc_connect": {
+        "name": "Upc connect",
+        "dependencies": [],
+        "requirements": [
+            "connect-box==0.2.5"
+        ]
+    },
+    "upcloud": {
+        "name": "Upcloud",
+        "dependencies": [],
+        "requirements": [
+            "upcloud-api==0.4.3"
+        ]
+    },
+    "updater": {
+        "name": "Updater",
+        "dependencies": [],
+        "requirements": [
+            "distro==1.4.0"
+        ]
+    },
+    "upnp": {
+        "name": "Upnp",
+        "dependencies": [],
+        "requirements": [
+            "async-upnp-client==0.14.11"
+        ]
+    },
+    "uptime": {
+        "name": "Uptime",
+        "dependencies": [],
+        "requirements": []
+    },
+    "uptimerobot": {
+        "name": "Uptimerobot",
+        "dependencies": [],
+        "requirements": [
+            "pyuptimerobot==0.0.5"
+        ]
+    },
+    "uscis": {
+        "name": "Uscis",
+        "dependencies": [],
+        "requirements": [
+            "uscisstatus==0.1.1"
+        ]
+    },
+    "usgs_earthquakes_feed": {
+        "name": "Usgs earthquakes feed",
+        "dependencies": [],
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "utility_meter": {
+        "name": "Utility meter",
+        "dependencies": [],
+        "requirements": []
+    },
+    "uvc": {
+        "name": "Uvc",
+        "dependencies": [],
+        "requirements": [
+            "uvcclient==0.11.0"
+        ]
+    },
+    "vacuum": {
+        "name": "Vacuum",
+        "dependencies": [
+            "group"
+        ],
+        "requirements": []
+    },
+    "vallox": {
+        "name": "Vallox",
+        "dependencies": [],
+        "requirements": [
+            "vallox-websocket-api==2.2.0"
+        ]
+    },
+    "vasttrafik": {
+        "name": "Vasttrafik",
+        "dependencies": [],
+        "requirements": [
+            "vtjp==0.1.14"
+        ]
+    },
+    "velbus": {
+        "name": "Velbus",
+        "dependencies": [],
+        "requirements": [
+            "python-velbus==2.0.27"
+        ]
+    },
+    "velux": {
+        "name": "Velux",
+        "dependencies": [],
+        "requirements": [
+            "pyvlx==0.2.11"
+        ]
+    },
+    "venstar": {
+        "name": "Venstar",
+        "dependencies": [],
+        "requirements": [
+            "venstarcolortouch==0.9"
+        ]
+    },
+    "vera": {
+        "name": "Vera",
+        "dependencies": [],
+        "requirements": [
+            "pyvera==0.3.6"
+        ]
+    },
+    "verisure": {
+        "name": "Verisure",
+        "dependencies": [],
+        "requirements": [
+            "jsonpath==0.75",
+            "vsure==1.5.2"
+        ]
+    },
+    "version": {
+        "name": "Version",
+        "dependencies": [],
+        "requirements": [
+            "pyhaversion==3.1.0"
+        ]
+    },
+    "vesync": {
+        "name": "VeSync",
+        "dependencies": [],
+        "requirements": [
+            "pyvesync==1.1.0"
+        ]
+    },
+    "viaggiatreno": {
+        "name": "Viaggiatreno",
+        "dependencies": [],
+        "requirements": []
+    },
+    "vicare": {
+        "name": "Viessmann ViCare",
+        "dependencies": [],
+        "requirements": [
+            "PyViCare==0.1.2"
+        ]
+    },
+    "vivotek": {
+        "name": "Vivotek",
+        "dependencies": [],
+        "requirements": [
+            "libpyvivotek==0.2.2"
+        ]
+    },
+    "vizio": {
+        "name": "Vizio",
+        "dependencies": [],
+        "requirements": [
+            "pyvizio==0.0.7"
+        ]
+    },
+    "vlc": {
+        "name": "Vlc",
+        "dependencies": [],
+        "requirements": [
+            "python-vlc==1.1.2"
+        ]
+    },
+    "vlc_telnet": {
+        "name": "VLC telnet",
+        "dependencies": [],
+        "requirements": [
+            "python-telnet-vlc==1.0.4"
+        ]
+    },
+    "voicerss": {
+        "name": "Voicerss",
+        "dependencies": [],
+        "requirements": []
+    },
+    "volkszaehler": {
+        "name": "Volkszaehler",
+        "dependencies": [],
+        "requirements": [
+            "volkszaehler==0.1.2"
+        ]
+    },
+    "volumio": {
+        "name": "Volumio",
+        "dependencies": [],
+        "requirements": []
+    },
+    "volvooncall": {
+        "name": "Volvooncall",
+        "dependencies": [],
+        "requirements": [
+            "volvooncall==0.8.7"
+        ]
+    },
+    "vultr": {
+        "name": "Vultr",
+        "dependencies": [],
+        "requirements": [
+            "vultr==0.1.2"
+        ]
+    },
+    "w800rf32": {
+        "name": "W800rf32",
+        "dependencies": [],
+        "requirements": [
+            "pyW800rf32==0.1"
+        ]
+    },
+    "wake_on_lan": {
+        "name": "Wake on lan",
+        "dependencies": [],
+        "requirements": [
+            "wakeonlan==1.1.6"
+        ]
+    },
+    "waqi": {
+        "name": "Waqi",
+        "dependencies": [],
+        "requirements": [
+            "waqiasync==1.0.0"
+        ]
+    },
+    "water_heater": {
+        "name": "Water heater",
+        "dependencies": [],
+        "requirements": []
+    },
+    "waterfurnace": {
+        "name": "Waterfurnace",
+        "dependencies": [],
+        "requirements": [
+            "waterfurnace==1.1.0"
+        ]
+    },
+    "watson_iot": {
+        "name": "Watson iot",
+        "dependencies": [],
+        "requirements": [
+            "ibmiotf==0.3.4"
+        ]
+    },
+    "watson_tts": {
+        "name": "IBM Watson TTS",
+        "dependencies": [],
+        "requirements": [
+            "ibm-watson==4.0.1"
+        ]
+    },
+    "waze_travel_time": {
+        "name": "Waze travel time",
+        "dependencies": [],
+        "requirements": [
+            "WazeRouteCalculator==0.10"
+        ]
+    },
+    "weather": {
+        "name": "Weather",
+        "dependencies": [],
+        "requirements": []
+    },
+    "webhook": {
+        "name": "Webhook",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "weblink": {
+        "name": "Weblink",
+        "dependencies": [],
+        "requirements": []
+    },
+    "webostv": {
+        "name": "Webostv",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "pylgtv==0.1.9",
+            "websockets==6.0"
+        ]
+    },
+    "websocket_api": {
+        "name": "Websocket api",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": []
+    },
+    "wemo": {
+        "name": "Wemo",
+        "dependencies": [],
+        "requirements": [
+            "pywemo==0.4.34"
+        ]
+    },
+    "whois": {
+        "name": "Whois",
+        "dependencies": [],
+        "requirements": [
+            "python-whois==0.7.2"
+        ]
+    },
+    "wink": {
+        "name": "Wink",
+        "dependencies": [
+            "configurator"
+        ],
+        "requirements": [
+            "pubnubsub-handler==1.0.8",
+            "python-wink==1.10.5"
+        ]
+    },
+    "wirelesstag": {
+        "name": "Wirelesstag",
+        "dependencies": [],
+        "requirements": [
+            "wirelesstagpy==0.4.0"
+        ]
+    },
+    "withings": {
+        "name": "Withings",
+        "dependencies": [
+            "api",
+            "http",
+            "webhook"
+        ],
+        "requirements": [
+            "withings-api==2.1.3"
+        ]
+    },
+    "wled": {
+        "name": "WLED",
+        "dependencies": [],
+        "requirements": [
+            "wled==0.1.0"
+        ]
+    },
+    "workday": {
+        "name": "Workday",
+        "dependencies": [],
+        "requirements": [
+            "holidays==0.9.11"
+        ]
+    },
+    "worldclock": {
+        "name": "Worldclock",
+        "dependencies": [],
+        "requirements": []
+    },
+    "worldtidesinfo": {
+        "name": "Worldtidesinfo",
+        "dependencies": [],
+        "requirements": []
+    },
+    "worxlandroid": {
+        "name": "Worxlandroid",
+        "dependencies": [],
+        "requirements": []
+    },
+    "wsdot": {
+        "name": "Wsdot",
+        "dependencies": [],
+        "requirements": []
+    },
+    "wunderground": {
+        "name": "Wunderground",
+        "dependencies": [],
+        "requirements": []
+    },
+    "wunderlist": {
+        "name": "Wunderlist",
+        "dependencies": [],
+        "requirements": [
+            "wunderpy2==0.1.6"
+        ]
+    },
+    "wwlln": {
+        "name": "World Wide Lightning Location Network",
+        "dependencies": [],
+        "requirements": [
+            "aiowwlln==2.0.2"
+        ]
+    },
+    "x10": {
+        "name": "X10",
+        "dependencies": [],
+        "requirements": []
+    },
+    "xbox_live": {
+        "name": "Xbox live",
+        "dependencies": [],
+        "requirements": [
+            "xboxapi==0.1.1"
+        ]
+    },
+    "xeoma": {
+        "name": "Xeoma",
+        "dependencies": [],
+        "requirements": [
+            "pyxeoma==1.4.1"
+        ]
+    },
+    "xfinity": {
+        "name": "Xfinity",
+        "dependencies": [],
+        "requirements": [
+            "xfinity-gateway==0.0.4"
+        ]
+    },
+    "xiaomi": {
+        "name": "Xiaomi",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": []
+    },
+    "xiaomi_aqara": {
+        "name": "Xiaomi aqara",
+        "dependencies": [],
+        "requirements": [
+            "PyXiaomiGateway==0.12.4"
+        ]
+    },
+    "xiaomi_miio": {
+        "name": "Xiaomi miio",
+        "dependencies": [],
+        "requirements": [
+            "construct==2.9.45",
+            "python-miio==0.4.7"
+        ]
+    },
+    "xiaomi_tv": {
+        "name": "Xiaomi tv",
+        "dependencies": [],
+        "requirements": [
+            "pymitv==1.4.3"
+        ]
+    },
+    "xmpp": {
+        "name": "Xmpp",
+        "dependencies": [],
+        "requirements": [
+            "slixmpp==1.4.2"
+        ]
+    },
+    "xs1": {
+        "name": "Xs1",
+        "dependencies": [],
+        "requirements": [
+            "xs1-api-client==2.3.5"
+        ]
+    },
+    "yale_smart_alarm": {
+        "name": "Yale smart alarm",
+        "dependencies": [],
+        "requirements": [
+            "yalesmartalarmclient==0.1.6"
+        ]
+    },
+    "yamaha": {
+        "name": "Yamaha",
+        "dependencies": [],
+        "requirements": [
+            "rxv==0.6.0"
+        ]
+    },
+    "yamaha_musiccast": {
+        "name": "Yamaha musiccast",
+        "dependencies": [],
+        "requirements": [
+            "pymusiccast==0.1.6"
+        ]
+    },
+    "yandex_transport": {
+        "name": "Yandex Transport",
+        "dependencies": [],
+        "requirements": [
+            "ya_ma==0.3.8"
+        ]
+    },
+    "yandextts": {
+        "name": "Yandextts",
+        "dependencies": [],
+        "requirements": []
+    },
+    "yeelight": {
+        "name": "Yeelight",
+        "dependencies": [],
+        "requirements": [
+            "yeelight==0.5.0"
+        ]
+    },
+    "yeelightsunflower": {
+        "name": "Yeelightsunflower",
+        "dependencies": [],
+        "requirements": [
+            "yeelightsunflower==0.0.10"
+        ]
+    },
+    "yessssms": {
+        "name": "Yessssms",
+        "dependencies": [],
+        "requirements": [
+            "YesssSMS==0.4.1"
+        ]
+    },
+    "yi": {
+        "name": "Yi",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "requirements": [
+            "aioftp==0.12.0"
+        ]
+    },
+    "yr": {
+        "name": "Yr",
+        "dependencies": [],
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "yweather": {
+        "name": "Yweather",
+        "dependencies": [],
+        "requirements": [
+            "yahooweather==0.10"
+        ]
+    },
+    "zabbix": {
+        "name": "Zabbix",
+        "dependencies": [],
+        "requirements": [
+            "pyzabbix==0.7.4"
+        ]
+    },
+    "zamg": {
+        "name": "Zamg",
+        "dependencies": [],
+        "requirements": []
+    },
+    "zengge": {
+        "name": "Zengge",
+        "dependencies": [],
+        "requirements": [
+            "zengge==0.2"
+        ]
+    },
+    "zeroconf": {
+        "name": "Zeroconf",
+        "dependencies": [
+            "api"
+        ],
+        "requirements": [
+            "zeroconf==0.23.0"
+        ]
+    },
+    "zestimate": {
+        "name": "Zestimate",
+        "dependencies": [],
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "zha": {
+        "name": "Zigbee Home Automation",
+        "dependencies": [],
+        "requirements": [
+            "bellows-homeassistant==0.10.0",
+            "zha-quirks==0.0.27",
+            "zigpy-deconz==0.6.0",
+            "zigpy-homeassistant==0.10.0",
+            "zigpy-xbee-homeassistant==0.6.0",
+            "zigpy-zigate==0.5.0"
+        ]
+    },
+    "zhong_hong": {
+        "name": "Zhong hong",
+        "dependencies": [],
+        "requirements": [
+            "zhong_hong_hvac==1.0.9"
+        ]
+    },
+    "zigbee": {
+        "name": "Zigbee",
+        "dependencies": [],
+        "requirements": [
+            "xbee-helper==0.0.7"
+        ]
+    },
+    "ziggo_mediabox_xl": {
+        "name": "Ziggo mediabox xl",
+        "dependencies": [],
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0"
+        ]
+    },
+    "zone": {
+        "name": "Zone",
+        "dependencies": [],
+        "requirements": []
+    },
+    "zoneminder": {
+        "name": "Zoneminder",
+        "dependencies": [],
+        "requirements": [
+            "zm-py==0.3.3"
+        ]
+    },
+    "zwave": {
+        "name": "Z-Wave",
+        "dependencies": [],
+        "requirements": [
+            "homeassistant-pyozw==0.1.4",
+            "pydispatcher==2.0.5"
+        ]
+    }
+}
@@ -180,7 +180,7 @@ def async_numeric_state(
         variables = dict(variables or {})
         variables["state"] = entity
         try:
-            value = value_template.async_render(variables)
+            value = value_template.async_render_cached(variables)
         except TemplateError as ex:
             _LOGGER.error("Template error: %s", ex)
             return False
@@ -364,7 +364,7 @@ def async_template(
 ) -> bool:
     """Test if template condition matches."""
     try:
-        value = value_template.async_render(variables)
+        value = value_template.async_render_cached(variables)
     except TemplateError as ex:
         _LOGGER.error("Error during template condition: %s", ex)
         return False
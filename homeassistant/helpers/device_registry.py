@@ -2,8 +2,8 @@
 import logging
 import uuid
 from asyncio import Event
-from collections import OrderedDict
-from typing import List, Optional, cast
+from collections import UserDict
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 import attr
 
@@ -69,6 +69,93 @@ def format_mac(mac):
     return mac
 
 
+class DeviceRegistryItems(UserDict):
+    """Container for device registry entries, keyed by device id.
+
+    Keeps secondary indexes by identifier, connection and config entry id up
+    to date when entries are added, replaced or removed.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, DeviceEntry]] = None) -> None:
+        """Initialize the container."""
+        # Ordered sets of device ids, devices can share identifiers and
+        # connections
+        self._identifier_index: Dict[tuple, Dict[str, None]] = {}
+        self._connection_index: Dict[tuple, Dict[str, None]] = {}
+        self._config_entry_index: Dict[str, Dict[str, None]] = {}
+        super().__init__(entries)
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add or replace an entry."""
+        old = self.data.get(key)
+        if old is not None:
+            self._unindex(old)
+        self.data[key] = entry
+        self._index(entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry."""
+        self._unindex(self.data.pop(key))
+
+    def get_entry(self, identifiers: set, connections: set) -> Optional[DeviceEntry]:
+        """Return the entry matching any of the identifiers or connections.
+
+        If several entries match, the one that was added first is returned.
+        """
+        device_ids: Set[str] = set()
+
+        for index, keys in (
+            (self._identifier_index, identifiers),
+            (self._connection_index, connections),
+        ):
+            for key in keys:
+                device_ids.update(index.get(key, ()))
+
+        if not device_ids:
+            return None
+
+        if len(device_ids) == 1:
+            return self.data[device_ids.pop()]
+
+        return next(
+            entry for device_id, entry in self.data.items() if device_id in device_ids
+        )
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> List[DeviceEntry]:
+        """Return the entries of a config entry."""
+        return [
+            self.data[device_id]
+            for device_id in self._config_entry_index.get(config_entry_id, ())
+        ]
+
+    def _index(self, entry: DeviceEntry) -> None:
+        """Add an entry to the indexes."""
+        for index, keys in self._index_keys(entry):
+            for key in keys:
+                index.setdefault(key, {})[entry.id] = None
+
+    def _unindex(self, entry: DeviceEntry) -> None:
+        """Remove an entry from the indexes."""
+        for index, keys in self._index_keys(entry):
+            for key in keys:
+                device_ids = index.get(key)
+                if device_ids is None:
+                    continue
+                device_ids.pop(entry.id, None)
+                if not device_ids:
+                    del index[key]
+
+    def _index_keys(self, entry: DeviceEntry) -> Tuple[Tuple[dict, set], ...]:
+        """Return the indexes and the keys the entry is indexed by."""
+        return (
+            (self._identifier_index, entry.identifiers),
+            (self._connection_index, entry.connections),
+            (self._config_entry_index, entry.config_entries),
+        )
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -88,12 +175,7 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        return self.devices.get_entry(identifiers, connections)
 
     @callback
     def async_get_or_create(
@@ -273,7 +355,7 @@ class DeviceRegistry:
         """Load the device registry."""
         data = await self._store.async_load()
 
-        devices = OrderedDict()
+        devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -331,12 +413,12 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id):
         """Clear config entry from registry entries."""
         remove = []
-        for dev_id, device in self.devices.items():
+        for device in self.devices.get_entries_for_config_entry_id(config_entry_id):
             if device.config_entries == {config_entry_id}:
-                remove.append(dev_id)
+                remove.append(device.id)
             else:
                 self._async_update_device(
-                    dev_id, remove_config_entry_id=config_entry_id
+                    device.id, remove_config_entry_id=config_entry_id
                 )
         for dev_id in remove:
             self.async_remove_device(dev_id)
@@ -1,11 +1,13 @@
 """Class to manage the entities for a single platform."""
 import asyncio
 from contextvars import ContextVar
+from timeit import default_timer as timer
 from typing import Optional
 
 from homeassistant.const import DEVICE_DEFAULT_NAME
 from homeassistant.core import callback, valid_entity_id, split_entity_id
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
+from homeassistant.setup import async_get_setup_timings
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -143,6 +145,7 @@ class EntityPlatform:
             self.platform_name,
             SLOW_SETUP_WARNING,
         )
+        start = timer()
 
         try:
             task = async_create_setup_task()
@@ -190,6 +193,14 @@ class EntityPlatform:
             return False
         finally:
             warn_task.cancel()
+            timings = async_get_setup_timings(hass)
+            timings.async_set_dependencies(full_name, [self.domain, self.platform_name])
+            timings.async_record(
+                full_name,
+                "setup_entry" if self.config_entry else "setup",
+                start,
+                timer(),
+            )
 
     def _schedule_add_entities(self, new_entities, update_before_add=False):
         """Schedule adding entities for a single platform, synchronously."""
@@ -387,9 +398,9 @@ class EntityPlatform:
         # Make sure it is valid in case an entity set the value themselves
         if not valid_entity_id(entity.entity_id):
             raise HomeAssistantError(f"Invalid entity id: {entity.entity_id}")
-        if (
-            entity.entity_id in self.entities
-            or entity.entity_id in self.hass.states.async_entity_ids(self.domain)
+        if entity.entity_id in self.entities or (
+            split_entity_id(entity.entity_id)[0] == self.domain
+            and self.hass.states.get(entity.entity_id) is not None
         ):
             msg = f"Entity id already exists: {entity.entity_id}"
             if entity.unique_id is not None:
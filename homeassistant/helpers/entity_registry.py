@@ -8,10 +8,10 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 import asyncio
-from collections import OrderedDict
+from collections import UserDict
 from itertools import chain
 import logging
-from typing import Any, Dict, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import attr
 
@@ -77,14 +77,95 @@ class RegistryEntry:
         return self.disabled_by is not None
 
 
+class EntityRegistryItems(UserDict):
+    """Container for entity registry entries, keyed by entity_id.
+
+    Keeps secondary indexes by (domain, platform, unique_id), device id and
+    config entry id up to date when entries are added, replaced or removed.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, RegistryEntry]] = None) -> None:
+        """Initialize the container."""
+        self._unique_id_index: Dict[Tuple[str, str, str], str] = {}
+        # Ordered sets of entity ids
+        self._device_index: Dict[str, Dict[str, None]] = {}
+        self._config_entry_index: Dict[str, Dict[str, None]] = {}
+        super().__init__(entries)
+
+    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
+        """Add or replace an entry."""
+        old = self.data.get(key)
+        if old is not None:
+            self._unindex(old)
+        self.data[key] = entry
+        self._index(entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry."""
+        self._unindex(self.data.pop(key))
+
+    def get_entity_id(
+        self, domain: str, platform: str, unique_id: str
+    ) -> Optional[str]:
+        """Return the entity_id registered for a unique id."""
+        return self._unique_id_index.get((domain, platform, unique_id))
+
+    def get_entries_for_device_id(self, device_id: str) -> List[RegistryEntry]:
+        """Return the entries of a device."""
+        return [
+            self.data[entity_id] for entity_id in self._device_index.get(device_id, ())
+        ]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> List[RegistryEntry]:
+        """Return the entries of a config entry."""
+        return [
+            self.data[entity_id]
+            for entity_id in self._config_entry_index.get(config_entry_id, ())
+        ]
+
+    def _index(self, entry: RegistryEntry) -> None:
+        """Add an entry to the indexes."""
+        self._unique_id_index[
+            (entry.domain, entry.platform, entry.unique_id)
+        ] = entry.entity_id
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entry.entity_id] = None
+        if entry.config_entry_id is not None:
+            self._config_entry_index.setdefault(entry.config_entry_id, {})[
+                entry.entity_id
+            ] = None
+
+    def _unindex(self, entry: RegistryEntry) -> None:
+        """Remove an entry from the indexes."""
+        key = (entry.domain, entry.platform, entry.unique_id)
+        if self._unique_id_index.get(key) == entry.entity_id:
+            del self._unique_id_index[key]
+        for index, index_key in (
+            (self._device_index, entry.device_id),
+            (self._config_entry_index, entry.config_entry_id),
+        ):
+            if index_key is None:
+                continue
+            entity_ids = index.get(index_key)
+            if entity_ids is None:
+                continue
+            entity_ids.pop(entry.entity_id, None)
+            if not entity_ids:
+                del index[index_key]
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
     def __init__(self, hass: HomeAssistantType):
         """Initialize the registry."""
         self.hass = hass
-        self.entities: Dict[str, RegistryEntry]
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self.entities: EntityRegistryItems
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
         )
@@ -104,14 +185,7 @@ class EntityRegistry:
         self, domain: str, platform: str, unique_id: str
     ) -> Optional[str]:
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if (
-                entity.domain == domain
-                and entity.platform == platform
-                and entity.unique_id == unique_id
-            ):
-                return entity.entity_id
-        return None
+        return self.entities.get_entity_id(domain, platform, unique_id)
 
     @callback
     def async_generate_entity_id(
@@ -277,20 +351,13 @@ class EntityRegistry:
             entity_id = changes["entity_id"] = new_entity_id
 
         if new_unique_id is not _UNDEF:
-            conflict = next(
-                (
-                    entity
-                    for entity in self.entities.values()
-                    if entity.unique_id == new_unique_id
-                    and entity.domain == old.domain
-                    and entity.platform == old.platform
-                ),
-                None,
+            conflict_entity_id = self.entities.get_entity_id(
+                old.domain, old.platform, new_unique_id
             )
-            if conflict:
+            if conflict_entity_id:
                 raise ValueError(
                     "Unique id '{}' is already in use by '{}'".format(
-                        new_unique_id, conflict.entity_id
+                        new_unique_id, conflict_entity_id
                     )
                 )
             changes["unique_id"] = new_unique_id
@@ -319,7 +386,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate,
         )
-        entities: Dict[str, RegistryEntry] = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -363,12 +430,8 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
 
 @bind_hass
@@ -399,9 +462,7 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    return registry.entities.get_entries_for_device_id(device_id)
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
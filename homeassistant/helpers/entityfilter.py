@@ -1,5 +1,8 @@
 """Helper class to implement include/exclude of entities and domains."""
-from typing import Callable, Dict, List
+import fnmatch
+from functools import lru_cache
+import re
+from typing import Callable, Dict, FrozenSet, List, Optional, Pattern
 
 import voluptuous as vol
 
@@ -7,21 +10,28 @@ from homeassistant.core import split_entity_id
 from homeassistant.helpers import config_validation as cv
 
 CONF_INCLUDE_DOMAINS = "include_domains"
+CONF_INCLUDE_ENTITY_GLOBS = "include_entity_globs"
 CONF_INCLUDE_ENTITIES = "include_entities"
 CONF_EXCLUDE_DOMAINS = "exclude_domains"
+CONF_EXCLUDE_ENTITY_GLOBS = "exclude_entity_globs"
 CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
+# Number of filter results remembered per filter
+FILTER_CACHE_SIZE = 8192
+# Number of distinct filters shared between callers
+SHARED_FILTERS = 64
 
-def _convert_filter(config: Dict[str, List[str]]) -> Callable[[str], bool]:
+
+def _convert_filter(config: Dict[str, List[str]]) -> "ConfigEntityFilter":
     filt = generate_filter(
         config[CONF_INCLUDE_DOMAINS],
         config[CONF_INCLUDE_ENTITIES],
         config[CONF_EXCLUDE_DOMAINS],
         config[CONF_EXCLUDE_ENTITIES],
+        config.get(CONF_INCLUDE_ENTITY_GLOBS),
+        config.get(CONF_EXCLUDE_ENTITY_GLOBS),
     )
-    setattr(filt, "config", config)
-    setattr(filt, "empty_filter", sum(len(val) for val in config.values()) == 0)
-    return filt
+    return ConfigEntityFilter(filt, config)
 
 
 FILTER_SCHEMA = vol.All(
@@ -30,10 +40,16 @@ FILTER_SCHEMA = vol.All(
             vol.Optional(CONF_EXCLUDE_DOMAINS, default=[]): vol.All(
                 cv.ensure_list, [cv.string]
             ),
+            vol.Optional(CONF_EXCLUDE_ENTITY_GLOBS): vol.All(
+                cv.ensure_list, [cv.string]
+            ),
             vol.Optional(CONF_EXCLUDE_ENTITIES, default=[]): cv.entity_ids,
             vol.Optional(CONF_INCLUDE_DOMAINS, default=[]): vol.All(
                 cv.ensure_list, [cv.string]
             ),
+            vol.Optional(CONF_INCLUDE_ENTITY_GLOBS): vol.All(
+                cv.ensure_list, [cv.string]
+            ),
             vol.Optional(CONF_INCLUDE_ENTITIES, default=[]): cv.entity_ids,
         }
     ),
@@ -46,15 +62,119 @@ def generate_filter(
     include_entities: List[str],
     exclude_domains: List[str],
     exclude_entities: List[str],
+    include_entity_globs: Optional[List[str]] = None,
+    exclude_entity_globs: Optional[List[str]] = None,
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
-    include_d = set(include_domains)
-    include_e = set(include_entities)
-    exclude_d = set(exclude_domains)
-    exclude_e = set(exclude_entities)
+    """Return a function that will filter entities based on the args.
+
+    Filters are shared between all callers that pass the same args.
+    """
+    return _get_filter(
+        frozenset(include_domains),
+        frozenset(include_entities),
+        frozenset(exclude_domains),
+        frozenset(exclude_entities),
+        frozenset(include_entity_globs or ()),
+        frozenset(exclude_entity_globs or ()),
+    )
+
+
+@lru_cache(maxsize=SHARED_FILTERS)
+def _get_filter(
+    include_d: FrozenSet[str],
+    include_e: FrozenSet[str],
+    exclude_d: FrozenSet[str],
+    exclude_e: FrozenSet[str],
+    include_g: FrozenSet[str],
+    exclude_g: FrozenSet[str],
+) -> "EntityFilter":
+    """Return the shared filter for the args."""
+    return EntityFilter(
+        include_d, include_e, exclude_d, exclude_e, include_g, exclude_g
+    )
+
+
+def _compile_globs(globs: FrozenSet[str]) -> Optional[Pattern]:
+    """Compile entity id globs into a single pattern."""
+    if not globs:
+        return None
+
+    return re.compile("|".join(fnmatch.translate(glob) for glob in sorted(globs)))
+
+
+class EntityFilter:
+    """Filter of entity ids compiled from include and exclude rules.
+
+    Results are remembered per entity id, so the rules are only evaluated
+    once for each entity.
+    """
+
+    def __init__(
+        self,
+        include_d: FrozenSet[str],
+        include_e: FrozenSet[str],
+        exclude_d: FrozenSet[str],
+        exclude_e: FrozenSet[str],
+        include_g: FrozenSet[str],
+        exclude_g: FrozenSet[str],
+    ) -> None:
+        """Initialize the filter."""
+        self._filter = _compile_filter(
+            include_d,
+            include_e,
+            exclude_d,
+            exclude_e,
+            _compile_globs(include_g),
+            _compile_globs(exclude_g),
+        )
+        self._cached_filter = lru_cache(maxsize=FILTER_CACHE_SIZE)(self._filter)
+
+    def __call__(self, entity_id: str) -> bool:
+        """Return if the entity passes the filter."""
+        return self._cached_filter(entity_id)
+
+
+class ConfigEntityFilter:
+    """Shared entity filter together with the config it was created from.
+
+    The config is kept on this wrapper, so callers sharing the filter each
+    keep their own config.
+    """
+
+    __slots__ = ("_filter", "config", "empty_filter")
+
+    def __init__(
+        self, filt: Callable[[str], bool], config: Dict[str, List[str]]
+    ) -> None:
+        """Initialize the filter."""
+        self._filter = filt
+        self.config = config
+        self.empty_filter = sum(len(val) for val in config.values()) == 0
+
+    def __call__(self, entity_id: str) -> bool:
+        """Return if the entity passes the filter."""
+        return self._filter(entity_id)
+
+
+def _compile_filter(
+    include_d: FrozenSet[str],
+    include_e: FrozenSet[str],
+    exclude_d: FrozenSet[str],
+    exclude_e: FrozenSet[str],
+    include_g: Optional[Pattern],
+    exclude_g: Optional[Pattern],
+) -> Callable[[str], bool]:
+    """Return a function that will filter entities based on the rules."""
+    have_exclude = bool(exclude_e or exclude_d or exclude_g)
+    have_include = bool(include_e or include_d or include_g)
+
+    def included(entity_id: str, domain: str) -> bool:
+        """Return if domain or glob are included."""
+        return domain in include_d or bool(include_g and include_g.match(entity_id))
 
-    have_exclude = bool(exclude_e or exclude_d)
-    have_include = bool(include_e or include_d)
+    def excluded(entity_id: str, domain: str) -> bool:
+        """Return if domain or glob are excluded."""
+        return domain in exclude_d or bool(exclude_g and exclude_g.match(entity_id))
 
     # Case 1 - no includes or excludes - pass all entities
     if not have_include and not have_exclude:
@@ -66,7 +186,7 @@ def generate_filter(
         def entity_filter_2(entity_id: str) -> bool:
             """Return filter function for case 2."""
             domain = split_entity_id(entity_id)[0]
-            return entity_id in include_e or domain in include_d
+            return entity_id in include_e or included(entity_id, domain)
 
         return entity_filter_2
 
@@ -76,36 +196,38 @@ def generate_filter(
         def entity_filter_3(entity_id: str) -> bool:
             """Return filter function for case 3."""
             domain = split_entity_id(entity_id)[0]
-            return entity_id not in exclude_e and domain not in exclude_d
+            return entity_id not in exclude_e and not excluded(entity_id, domain)
 
         return entity_filter_3
 
     # Case 4 - both includes and excludes specified
-    # Case 4a - include domain specified
-    #  - if domain is included, pass if entity not excluded
-    #  - if domain is not included, pass if entity is included
+    # Case 4a - include domain or glob specified
+    #  - if domain or glob is included, pass if entity not excluded
+    #  - if domain or glob is not included, pass if entity is included
     # note: if both include and exclude domains specified,
     #   the exclude domains are ignored
-    if include_d:
+    if include_d or include_g:
 
         def entity_filter_4a(entity_id: str) -> bool:
             """Return filter function for case 4a."""
             domain = split_entity_id(entity_id)[0]
-            if domain in include_d:
-                return entity_id not in exclude_e
+            if included(entity_id, domain):
+                return entity_id not in exclude_e and not (
+                    exclude_g and exclude_g.match(entity_id)
+                )
             return entity_id in include_e
 
         return entity_filter_4a
 
-    # Case 4b - exclude domain specified
-    #  - if domain is excluded, pass if entity is included
-    #  - if domain is not excluded, pass if entity not excluded
-    if exclude_d:
+    # Case 4b - exclude domain or glob specified
+    #  - if domain or glob is excluded, pass if entity is included
+    #  - if domain or glob is not excluded, pass if entity not excluded
+    if exclude_d or exclude_g:
 
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d:
+            if excluded(entity_id, domain):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
@@ -1,14 +1,35 @@
 """Helpers for listening to events."""
+import asyncio
 from datetime import datetime, timedelta
 import functools as ft
-from typing import Any, Callable, Dict, Iterable, Optional, Union, cast
+from heapq import heapify, heappop, heappush
+from itertools import count
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import attr
 
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.helpers.template import Template
-from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE, Event, State
+from homeassistant.helpers.template import RenderInfo, Template
+from homeassistant.core import (
+    HomeAssistant,
+    callback,
+    split_entity_id,
+    CALLBACK_TYPE,
+    Event,
+    State,
+)
 from homeassistant.const import (
     ATTR_NOW,
     EVENT_STATE_CHANGED,
@@ -17,11 +38,24 @@ from homeassistant.const import (
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
 )
+from homeassistant.exceptions import TemplateError
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TIME_SCHEDULER = "event_time_scheduler"
+DATA_STATE_CHANGE_DISPATCHER = "event_state_change_dispatcher"
+
+# Minimum time between two renders of a template that iterates over all states
+ALL_STATES_RATE_LIMIT = timedelta(seconds=1)
+# Maximum difference between the last seen time and the real clock for
+# overdue jobs to run without waiting for the next timer tick
+CLOCK_SYNC_TOLERANCE = timedelta(seconds=2)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -50,6 +84,336 @@ def threaded_listener_factory(async_factory: Callable[..., Any]) -> CALLBACK_TYP
     return factory
 
 
+class _ScheduledJob:
+    """A job registered with the time scheduler."""
+
+    __slots__ = ("action", "cancelled")
+
+    def __init__(self, action: Callable[[datetime], None]) -> None:
+        """Initialize the job."""
+        self.action = action
+        self.cancelled = False
+
+
+class TimeScheduler:
+    """Run callbacks at points in time without a listener per callback.
+
+    Jobs are kept in a heap ordered by their UTC point in time. A single
+    loop.call_at handle is armed for the earliest job, and the scheduler also
+    listens to EVENT_TIME_CHANGED so overdue jobs and externally driven
+    clocks are handled on the next timer tick. Each tick only has to look at
+    the head of the heap, so jobs that are not due cost nothing.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: List[Tuple[datetime, int, _ScheduledJob]] = []
+        self._counter = count()
+        self._cancelled = 0
+        self._loop_handle: Optional[asyncio.TimerHandle] = None
+        self._armed_for: Optional[datetime] = None
+        self._last_now: Optional[datetime] = None
+        self._stopped = False
+        # Ordered sets of listeners that need to know the current time
+        self._clock_listeners: Dict[Callable[[datetime], None], None] = {}
+        self._unsynced: Dict[Callable[[datetime], None], None] = {}
+
+        hass.bus.async_listen(EVENT_TIME_CHANGED, self._async_time_changed)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    def __len__(self) -> int:
+        """Return the number of pending jobs."""
+        return len(self._heap) - self._cancelled
+
+    @callback
+    def async_schedule(
+        self, point_in_time: datetime, action: Callable[[datetime], None]
+    ) -> CALLBACK_TYPE:
+        """Run action once with the current time when point_in_time is reached.
+
+        Action needs to be a callback. Returns a function to cancel the job.
+        """
+        job = _ScheduledJob(action)
+        heappush(self._heap, (point_in_time, next(self._counter), job))
+
+        if self._armed_for is None or point_in_time < self._armed_for:
+            self._async_arm()
+
+        @callback
+        def async_cancel() -> None:
+            """Cancel the job."""
+            if job.cancelled:
+                return
+            job.cancelled = True
+            self._cancelled += 1
+            self._async_compact()
+
+        return async_cancel
+
+    @callback
+    def async_track_clock(self, listener: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Call listener when the clock is first seen or has been rolled back.
+
+        Listener needs to be a callback. Returns a function to remove it.
+        """
+        self._clock_listeners[listener] = None
+        self._unsynced[listener] = None
+
+        @callback
+        def async_remove() -> None:
+            """Remove the clock listener."""
+            self._clock_listeners.pop(listener, None)
+            self._unsynced.pop(listener, None)
+
+        return async_remove
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Process a timer tick."""
+        now: datetime = event.data[ATTR_NOW]
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=dt_util.UTC)
+        self._async_process(now)
+
+    @callback
+    def _async_wake(self) -> None:
+        """Process jobs when the armed loop timer fires."""
+        self._loop_handle = None
+        self._armed_for = None
+        self._async_process(dt_util.utcnow())
+
+    @callback
+    def _async_process(self, now: datetime) -> None:
+        """Run all jobs that are due at now."""
+        if self._last_now is None or now < self._last_now:
+            # Time rolled back, everybody has to recalculate
+            to_sync = list(self._clock_listeners)
+        else:
+            to_sync = list(self._unsynced)
+        self._unsynced.clear()
+        self._last_now = now
+
+        for listener in to_sync:
+            listener(now)
+
+        # Collect the due jobs first, jobs scheduled while running them are
+        # handled on the next run.
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            point_in_time, _, job = heappop(heap)
+            if job.cancelled:
+                self._cancelled -= 1
+                continue
+            job.cancelled = True
+            due.append((point_in_time, job))
+
+        try:
+            for point_in_time, job in due:
+                try:
+                    job.action(now)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error running job scheduled for %s", point_in_time
+                    )
+        finally:
+            self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the loop timer for the earliest pending job."""
+        if self._stopped:
+            return
+
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heappop(heap)
+            self._cancelled -= 1
+
+        point_in_time = heap[0][0] if heap else None
+
+        if point_in_time == self._armed_for:
+            return
+
+        if self._loop_handle is not None:
+            self._loop_handle.cancel()
+            self._loop_handle = None
+            self._armed_for = None
+
+        if point_in_time is None:
+            return
+
+        now = dt_util.utcnow()
+        delay = (point_in_time - now).total_seconds()
+
+        # Jobs that are already overdue run on the next loop iteration. When
+        # the time is driven by timer ticks that do not follow the real clock
+        # they are left to the next tick instead.
+        if delay <= 0:
+            if (
+                self._last_now is None
+                or abs(now - self._last_now) > CLOCK_SYNC_TOLERANCE
+            ):
+                return
+            delay = 0
+
+        loop = self.hass.loop
+        self._loop_handle = loop.call_at(loop.time() + delay, self._async_wake)
+        self._armed_for = point_in_time
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop cancelled jobs when they make up most of the heap."""
+        if self._cancelled < 64 or self._cancelled * 2 < len(self._heap):
+            return
+        self._heap = [item for item in self._heap if not item[2].cancelled]
+        heapify(self._heap)
+        self._cancelled = 0
+        self._async_arm()
+
+    @callback
+    def _async_stop(self, _: Event) -> None:
+        """Stop arming the loop timer."""
+        self._stopped = True
+        if self._loop_handle is not None:
+            self._loop_handle.cancel()
+            self._loop_handle = None
+            self._armed_for = None
+
+
+@callback
+def async_get_time_scheduler(hass: HomeAssistant) -> TimeScheduler:
+    """Return the time scheduler, creating it if necessary."""
+    scheduler: Optional[TimeScheduler] = hass.data.get(DATA_TIME_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = hass.data[DATA_TIME_SCHEDULER] = TimeScheduler(hass)
+
+    return scheduler
+
+
+class StateChangeDispatcher:
+    """Dispatch state changed events to the listeners of the changed entity.
+
+    A single EVENT_STATE_CHANGED listener is registered on the bus and each
+    event is only handed to the listeners that track its entity_id or its
+    domain. Listeners need to be callbacks and are called directly.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._trackers = 0
+        # Ordered sets of listeners per entity_id and per domain
+        self._listeners: Dict[str, Dict[Callable[[Event], None], None]] = {}
+        self._domain_listeners: Dict[str, Dict[Callable[[Event], None], None]] = {}
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_dispatch)
+
+    def __len__(self) -> int:
+        """Return the number of registered trackers."""
+        return self._trackers
+
+    @callback
+    def async_track(
+        self,
+        entity_ids: Iterable[str],
+        listener: Callable[[Event], None],
+        domains: Iterable[str] = (),
+    ) -> CALLBACK_TYPE:
+        """Call listener for state changes of entity_ids or domains.
+
+        Entity ids and domains need to be lowercase. The listener is called
+        once per event, even if both its entity_id and its domain match.
+        Returns a function to remove it.
+        """
+        entity_ids = tuple(entity_ids)
+        domains = tuple(domains)
+
+        for entity_id in entity_ids:
+            self._listeners.setdefault(entity_id, {})[listener] = None
+
+        for domain in domains:
+            self._domain_listeners.setdefault(domain, {})[listener] = None
+
+        self._trackers += 1
+        removed = False
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            nonlocal removed
+
+            if removed:
+                return
+
+            removed = True
+            self._trackers -= 1
+
+            for entity_id in entity_ids:
+                _remove_listener(self._listeners, entity_id, listener)
+
+            for domain in domains:
+                _remove_listener(self._domain_listeners, domain, listener)
+
+        return async_remove
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Hand a state changed event to the listeners of its entity."""
+        entity_id = event.data.get("entity_id")
+        if entity_id is None:
+            return
+
+        listeners = self._listeners.get(entity_id)
+
+        if self._domain_listeners:
+            domain_listeners = self._domain_listeners.get(split_entity_id(entity_id)[0])
+            if domain_listeners:
+                listeners = (
+                    {**listeners, **domain_listeners} if listeners else domain_listeners
+                )
+
+        if not listeners:
+            return
+
+        for listener in list(listeners):
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling state change %s", event)
+
+
+def _remove_listener(
+    listeners: Dict[str, Dict[Callable[[Event], None], None]],
+    key: str,
+    listener: Callable[[Event], None],
+) -> None:
+    """Remove a listener from the ordered set stored under key."""
+    key_listeners = listeners.get(key)
+    if key_listeners is None:
+        return
+    key_listeners.pop(listener, None)
+    if not key_listeners:
+        del listeners[key]
+
+
+@callback
+def async_get_state_change_dispatcher(hass: HomeAssistant) -> StateChangeDispatcher:
+    """Return the state change dispatcher, creating it if necessary."""
+    dispatcher: Optional[StateChangeDispatcher] = hass.data.get(
+        DATA_STATE_CHANGE_DISPATCHER
+    )
+
+    if dispatcher is None:
+        dispatcher = hass.data[DATA_STATE_CHANGE_DISPATCHER] = StateChangeDispatcher(
+            hass
+        )
+
+    return dispatcher
+
+
 @callback
 @bind_hass
 def async_track_state_change(
@@ -82,12 +446,6 @@ def async_track_state_change(
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
-        if (
-            entity_ids != MATCH_ALL
-            and cast(str, event.data.get("entity_id")) not in entity_ids
-        ):
-            return
-
         old_state = event.data.get("old_state")
         if old_state is not None:
             old_state = old_state.state
@@ -104,12 +462,192 @@ def async_track_state_change(
                 event.data.get("new_state"),
             )
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    if entity_ids == MATCH_ALL:
+        return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+
+    return async_get_state_change_dispatcher(hass).async_track(
+        entity_ids, state_change_listener
+    )
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+class TemplateTracker:
+    """Re-render a template when the states it accessed change.
+
+    After each render the tracker subscribes to exactly the entities and
+    domains collected in the RenderInfo of that render. Entities trigger a
+    render on every change, domains only when an entity is added to or
+    removed from them. Templates that iterate over all states, or that did
+    not access any state at all, listen to all state changes and are
+    rendered at most once per rate_limit. Static templates are not tracked.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        template: Template,
+        action: Callable[[Optional[Event], Any, Any], None],
+        variables: Optional[Dict[str, Any]] = None,
+        rate_limit: timedelta = ALL_STATES_RATE_LIMIT,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.template = template
+        self.action = action
+        self.variables = variables
+        self.rate_limit = rate_limit
+        self.result: Any = None
+        self._entities: FrozenSet[str] = frozenset()
+        self._domains: FrozenSet[str] = frozenset()
+        self._all_states = False
+        self._match_all = False
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        self._last_render: Optional[datetime] = None
+        self._last_event: Optional[Event] = None
+        self._unsub_render: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def rate_limited(self) -> bool:
+        """Return if renders of the template are rate limited."""
+        return self._all_states or self._match_all
+
+    @callback
+    def async_setup(self) -> None:
+        """Render the template for the first time and start tracking."""
+        self.result = self._async_render_to_result()
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop tracking the template."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+        if self._unsub_render is not None:
+            self._unsub_render()
+            self._unsub_render = None
+
+    @callback
+    def _async_render_to_result(self) -> Any:
+        """Render the template and track what the render accessed."""
+        info = self.template.async_render_to_info(self.variables)
+
+        try:
+            result: Any = info.result
+        except TemplateError as ex:
+            result = ex
+
+        self._async_update_listeners(info)
+        return result
+
+    @callback
+    def _async_update_listeners(self, info: RenderInfo) -> None:
+        """Subscribe to the entities and domains of the last render."""
+        if self.template.is_static:
+            return
+
+        entities = frozenset(entity_id.lower() for entity_id in info.entities)
+        domains = frozenset(domain.lower() for domain in info.domains)
+        all_states = info.all_states
+        match_all = not (all_states or entities or domains)
+
+        if self._unsub is not None and (
+            entities == self._entities
+            and domains == self._domains
+            and all_states == self._all_states
+            and match_all == self._match_all
+        ):
+            return
+
+        if self._unsub is not None:
+            self._unsub()
+
+        self._entities = entities
+        self._domains = domains
+        self._all_states = all_states
+        self._match_all = match_all
+
+        if self.rate_limited:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+        else:
+            self._unsub = async_get_state_change_dispatcher(self.hass).async_track(
+                entities, self._async_state_changed, domains
+            )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Render the template if the state change affects it."""
+        if not self._match_all:
+            entity_id = event.data["entity_id"]
+
+            if entity_id not in self._entities and (
+                (
+                    event.data.get("old_state") is not None
+                    and event.data.get("new_state") is not None
+                )
+                or not (
+                    self._all_states or split_entity_id(entity_id)[0] in self._domains
+                )
+            ):
+                return
+
+        self._last_event = event
+
+        if self._unsub_render is not None:
+            return
+
+        if self.rate_limited and self._last_render is not None:
+            delay = self._last_render + self.rate_limit - dt_util.utcnow()
+
+            if delay > timedelta(0):
+                self._unsub_render = async_call_later(
+                    self.hass, delay.total_seconds(), self._async_render_later
+                )
+                return
+
+        self._async_render()
+
+    @callback
+    def _async_render_later(self, _now: datetime) -> None:
+        """Render the template once the rate limit has passed."""
+        self._unsub_render = None
+        self._async_render()
+
+    @callback
+    def _async_render(self) -> None:
+        """Render the template and pass the result to the action."""
+        self._last_render = dt_util.utcnow()
+        last_result = self.result
+        self.result = self._async_render_to_result()
+        self.hass.async_run_job(self.action, self._last_event, last_result, self.result)
+
+
+@callback
+@bind_hass
+def async_track_template_result(
+    hass: HomeAssistant,
+    template: Template,
+    action: Callable[[Optional[Event], Any, Any], None],
+    variables: Optional[Dict[str, Any]] = None,
+    rate_limit: timedelta = ALL_STATES_RATE_LIMIT,
+) -> CALLBACK_TYPE:
+    """Render template whenever a state it accessed changes.
+
+    The action is called with the state changed event that caused the
+    render, the previous result and the new result. Results are strings, or
+    the TemplateError raised while rendering.
+
+    Returns a function that can be called to remove the listener.
+    """
+    tracker = TemplateTracker(hass, template, action, variables, rate_limit)
+    tracker.async_setup()
+    return tracker.async_remove
+
+
 @callback
 @bind_hass
 def async_track_template(
@@ -119,26 +657,37 @@ def async_track_template(
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that track state changes with template condition."""
-    from . import condition
-
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(
+        event: Optional[Event], last_result: Any, result: Any
+    ) -> None:
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+
+        if isinstance(result, TemplateError):
+            _LOGGER.error("Error during template condition: %s", result)
+            template_result = False
+        else:
+            template_result = result.lower() == "true"
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            assert event is not None
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
+    return async_track_template_result(
+        hass, template, template_condition_listener, variables
     )
 
 
@@ -233,26 +782,13 @@ def async_track_point_in_utc_time(
     point_in_time = dt_util.as_utc(point_in_time)
 
     @callback
-    def point_in_time_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, "run"):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        setattr(point_in_time_listener, "run", True)
-        async_unsub()
-
+    def point_in_time_listener(now: datetime) -> None:
+        """Run the action once point_in_time has been reached."""
         hass.async_run_job(action, now)
 
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, point_in_time_listener)
-
-    return async_unsub
+    return async_get_time_scheduler(hass).async_schedule(
+        point_in_time, point_in_time_listener
+    )
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -417,42 +953,45 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
+    scheduler = async_get_time_scheduler(hass)
+    cancel_next: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def schedule_next(now: datetime) -> None:
+        """Calculate and schedule the next time the trigger should fire."""
+        nonlocal cancel_next
 
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
+        if cancel_next is not None:
+            cancel_next()
 
         localized_now = dt_util.as_local(now) if local else now
         next_time = dt_util.find_next_time_expression_time(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
-
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
+        cancel_next = scheduler.async_schedule(
+            dt_util.as_utc(next_time), pattern_time_change_listener
+        )
 
     @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
+    def pattern_time_change_listener(now: datetime) -> None:
+        """Fire the action and schedule the next run."""
+        nonlocal cancel_next
+        cancel_next = None
+        hass.async_run_job(action, dt_util.as_local(now) if local else now)
+        schedule_next(now + timedelta(seconds=1))
 
-        now = event.data[ATTR_NOW]
+    # The next time is calculated from the first time the scheduler sees
+    # and recalculated whenever the system time abruptly jumps backwards.
+    remove_clock = scheduler.async_track_clock(schedule_next)
 
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
-
-        last_now = now
-
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
+    @callback
+    def remove_listener() -> None:
+        """Remove the pattern listener."""
+        remove_clock()
+        if cancel_next is not None:
+            cancel_next()
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+    return remove_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -1,11 +1,33 @@
 """Location helpers for Home Assistant."""
-
-from typing import Optional, Sequence
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import State
+from homeassistant.core import State, callback, split_entity_id
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.loader import bind_hass
 from homeassistant.util import location as loc_util
 
+DATA_LOCATION_INDEX = "location_index"
+
+ATTR_RADIUS = "radius"
+
+# Size of a grid cell of the location index in degrees
+CELL_DEGREES = 0.1
+LON_CELLS = 3600
+# Lower bound of the radius of the earth, used to bound distances from below
+MIN_EARTH_RADIUS = 6300000
+# Entities covering more cells are returned by every query
+MAX_ENTITY_CELLS = 64
+# Queries covering more cells look at all entities
+MAX_QUERY_CELLS = 256
+# Rings of cells searched for the closest entity before looking at all
+MAX_CLOSEST_RINGS = 20
+# Smaller grids are searched for the closest entity by looking at all
+MIN_CLOSEST_STATES = 16
+
+Cell = Tuple[int, int]
+
 
 def has_location(state: State) -> bool:
     """Test if state contains a valid location.
@@ -32,12 +54,347 @@ def closest(
     if not with_location:
         return None
 
-    return min(
-        with_location,
-        key=lambda state: loc_util.distance(
-            state.attributes.get(ATTR_LATITUDE),
-            state.attributes.get(ATTR_LONGITUDE),
+    distances = _distances(latitude, longitude, with_location)
+    return with_location[min(range(len(distances)), key=distances.__getitem__)]
+
+
+def _distances(latitude: float, longitude: float, states: List[State]) -> List[float]:
+    """Return the distances to states, infinite where it can't be computed."""
+    return [
+        math.inf if distance is None else distance
+        for distance in loc_util.distances(
             latitude,
             longitude,
+            [state.attributes[ATTR_LATITUDE] for state in states],
+            [state.attributes[ATTR_LONGITUDE] for state in states],
+        )
+    ]
+
+
+def _closest_key(
+    latitude: float, longitude: float, states: List[State]
+) -> Optional[Tuple[float, str]]:
+    """Return distance and entity_id of the closest state, by entity_id on ties."""
+    return min(
+        zip(
+            _distances(latitude, longitude, states),
+            (state.entity_id for state in states),
         ),
+        default=None,
+    )
+
+
+def _cell(latitude: float, longitude: float) -> Cell:
+    """Return the grid cell of a point."""
+    return (
+        math.floor(latitude / CELL_DEGREES),
+        math.floor(longitude / CELL_DEGREES) % LON_CELLS,
     )
+
+
+def _lon_degrees(radius: float, max_latitude: float) -> Optional[float]:
+    """Return the longitude difference covered by radius meters.
+
+    Returns None if every longitude is within radius at max_latitude.
+    """
+    if max_latitude >= 90 or radius >= math.pi * MIN_EARTH_RADIUS:
+        return None
+
+    sin_half = math.sin(radius / MIN_EARTH_RADIUS / 2) / math.cos(
+        math.radians(max_latitude)
+    )
+
+    if sin_half >= 1:
+        return None
+
+    return math.degrees(2 * math.asin(sin_half))
+
+
+def _cells_within(
+    latitude: float, longitude: float, radius: float, max_cells: int
+) -> Optional[List[Cell]]:
+    """Return the cells that may contain points within radius meters.
+
+    Returns None if more than max_cells cells would be needed.
+    """
+    if not (math.isfinite(latitude) and math.isfinite(longitude)):
+        return None
+
+    lat_degrees = math.degrees(radius / MIN_EARTH_RADIUS)
+    lon_degrees = _lon_degrees(radius, abs(latitude) + lat_degrees)
+
+    if lon_degrees is None:
+        return None
+
+    lat_min, lon_min = _cell(latitude - lat_degrees, longitude - lon_degrees)
+    lat_max = math.floor((latitude + lat_degrees) / CELL_DEGREES)
+    lon_count = (
+        math.floor((longitude + lon_degrees) / CELL_DEGREES)
+        - math.floor((longitude - lon_degrees) / CELL_DEGREES)
+        + 1
+    )
+
+    if (lat_max - lat_min + 1) * lon_count > max_cells:
+        return None
+
+    return [
+        (lat_idx, (lon_min + lon_idx) % LON_CELLS)
+        for lat_idx in range(lat_min, lat_max + 1)
+        for lon_idx in range(min(lon_count, LON_CELLS))
+    ]
+
+
+def _ring(center: Cell, size: int) -> Iterable[Cell]:
+    """Return the cells at a Chebyshev distance of size from center."""
+    lat_idx, lon_idx = center
+
+    if size == 0:
+        yield center
+        return
+
+    for lon_offset in range(-size, size + 1):
+        yield (lat_idx - size, (lon_idx + lon_offset) % LON_CELLS)
+        yield (lat_idx + size, (lon_idx + lon_offset) % LON_CELLS)
+
+    for lat_offset in range(-size + 1, size):
+        yield (lat_idx + lat_offset, (lon_idx - size) % LON_CELLS)
+        yield (lat_idx + lat_offset, (lon_idx + size) % LON_CELLS)
+
+
+def _min_distance_outside(latitude: float, size: int) -> float:
+    """Return a lower bound of the distance to points outside size rings.
+
+    Points outside the rings differ at least size cells in latitude or in
+    longitude from the point.
+    """
+    degrees = size * CELL_DEGREES
+    lat_distance = math.radians(degrees) * MIN_EARTH_RADIUS
+    max_latitude = abs(latitude) + degrees + CELL_DEGREES
+
+    if degrees >= 180 or max_latitude >= 90:
+        return 0 if degrees < 180 else math.inf
+
+    lon_distance = (
+        2
+        * MIN_EARTH_RADIUS
+        * math.asin(
+            math.cos(math.radians(max_latitude)) * math.sin(math.radians(degrees) / 2)
+        )
+    )
+    return min(lat_distance, lon_distance)
+
+
+class _Grid:
+    """Entities with a location, bucketed by grid cell."""
+
+    __slots__ = ("states", "cells", "unbounded")
+
+    def __init__(self) -> None:
+        """Initialize the grid."""
+        self.states: Dict[str, State] = {}
+        self.cells: Dict[Cell, Dict[str, State]] = {}
+        self.unbounded: Dict[str, State] = {}
+
+    def add(self, state: State, cells: Optional[List[Cell]]) -> None:
+        """Add a state to the given cells, or to all if cells is None."""
+        entity_id = state.entity_id
+        self.states[entity_id] = state
+
+        if cells is None:
+            self.unbounded[entity_id] = state
+            return
+
+        for cell in cells:
+            self.cells.setdefault(cell, {})[entity_id] = state
+
+    def remove(self, entity_id: str, cells: Optional[List[Cell]]) -> None:
+        """Remove a state from the given cells."""
+        del self.states[entity_id]
+
+        if cells is None:
+            del self.unbounded[entity_id]
+            return
+
+        for cell in cells:
+            cell_states = self.cells[cell]
+            del cell_states[entity_id]
+            if not cell_states:
+                del self.cells[cell]
+
+
+class LocationIndex:
+    """Grid index of all states with a location.
+
+    Each state is stored in the grid cells of CELL_DEGREES that its location
+    falls into, or that its radius attribute covers, like the area of a
+    zone. The state machine updates the index before it fires the state
+    changed event, so listeners of that event never see a stale index. It
+    holds one grid per domain and one for all states. Distances themselves
+    are still computed with util.location.distance.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._grids: Dict[Optional[str], _Grid] = {None: _Grid()}
+        self._entity_cells: Dict[str, Optional[List[Cell]]] = {}
+
+        for state in hass.states.async_all():
+            self._async_add(state)
+
+        hass.states.async_add_observer(self._async_state_changed)
+
+    @callback
+    def async_candidates(
+        self, domain: Optional[str], latitude: float, longitude: float, radius: float
+    ) -> List[State]:
+        """Return the states that may be within radius meters of a point.
+
+        The radius attribute of a state is added to the radius. Returns a
+        superset of the matching states of domain, or of all states if
+        domain is None, sorted by entity_id.
+        """
+        grid = self._grids.get(domain)
+
+        if grid is None:
+            return []
+
+        cells = _cells_within(latitude, longitude, radius, MAX_QUERY_CELLS)
+
+        if cells is None:
+            found = grid.states
+        else:
+            found = dict(grid.unbounded)
+            for cell in cells:
+                cell_states = grid.cells.get(cell)
+                if cell_states:
+                    found.update(cell_states)
+
+        return [found[entity_id] for entity_id in sorted(found)]
+
+    @callback
+    def async_closest(
+        self, domain: Optional[str], latitude: float, longitude: float
+    ) -> Optional[State]:
+        """Return the state of domain closest to a point.
+
+        Ties are broken by entity_id. If domain is None, all states with a
+        location are searched.
+        """
+        grid = self._grids.get(domain)
+
+        if grid is None:
+            return None
+
+        if len(grid.states) <= MIN_CLOSEST_STATES or not (
+            math.isfinite(latitude) and math.isfinite(longitude)
+        ):
+            return self._closest_of(grid, latitude, longitude, grid.states.values())
+
+        best: Optional[Tuple[float, str]] = None
+        seen: Set[str] = set()
+        center = _cell(latitude, longitude)
+
+        for size in range(MAX_CLOSEST_RINGS + 1):
+            if size:
+                cells: Iterable[Dict[str, State]] = (
+                    grid.cells.get(cell, {}) for cell in _ring(center, size)
+                )
+            else:
+                cells = (grid.unbounded, grid.cells.get(center, {}))
+
+            candidates = []
+            for cell_states in cells:
+                for entity_id, state in cell_states.items():
+                    if entity_id not in seen:
+                        seen.add(entity_id)
+                        candidates.append(state)
+
+            key = _closest_key(latitude, longitude, candidates)
+            if key is not None and (best is None or key < best):
+                best = key
+
+            if len(seen) == len(grid.states):
+                break
+
+            if best is not None and _min_distance_outside(latitude, size) > best[0]:
+                break
+        else:
+            return self._closest_of(grid, latitude, longitude, grid.states.values())
+
+        return None if best is None else grid.states[best[1]]
+
+    @callback
+    def async_has_domain(self, domain: str) -> bool:
+        """Return if any state of domain has a location."""
+        return domain in self._grids
+
+    @staticmethod
+    def _closest_of(
+        grid: _Grid, latitude: float, longitude: float, states: Iterable[State]
+    ) -> Optional[State]:
+        """Return the closest of states, comparing every one."""
+        key = _closest_key(latitude, longitude, list(states))
+        return None if key is None else grid.states[key[1]]
+
+    @callback
+    def _async_state_changed(self, entity_id: str, new_state: Optional[State]) -> None:
+        """Move a changed state to its new cells."""
+        if entity_id in self._entity_cells:
+            self._async_remove(entity_id)
+
+        if new_state is not None:
+            self._async_add(new_state)
+
+    @callback
+    def _async_add(self, state: State) -> None:
+        """Add a state if it has a location."""
+        if not has_location(state):
+            return
+
+        radius = state.attributes.get(ATTR_RADIUS)
+
+        if not isinstance(radius, (int, float)) or not radius > 0:
+            radius = 0
+
+        cells = _cells_within(
+            state.attributes[ATTR_LATITUDE],
+            state.attributes[ATTR_LONGITUDE],
+            radius,
+            MAX_ENTITY_CELLS,
+        )
+        self._entity_cells[state.entity_id] = cells
+        self._grids[None].add(state, cells)
+
+        domain = split_entity_id(state.entity_id)[0]
+        grid = self._grids.get(domain)
+
+        if grid is None:
+            grid = self._grids[domain] = _Grid()
+
+        grid.add(state, cells)
+
+    @callback
+    def _async_remove(self, entity_id: str) -> None:
+        """Remove a state from the index."""
+        cells = self._entity_cells.pop(entity_id)
+        self._grids[None].remove(entity_id, cells)
+
+        domain = split_entity_id(entity_id)[0]
+        grid = self._grids[domain]
+        grid.remove(entity_id, cells)
+
+        if not grid.states:
+            del self._grids[domain]
+
+
+@callback
+@bind_hass
+def async_get_location_index(hass: HomeAssistantType) -> LocationIndex:
+    """Return the location index, creating it if necessary."""
+    index: Optional[LocationIndex] = hass.data.get(DATA_LOCATION_INDEX)
+
+    if index is None:
+        index = hass.data[DATA_LOCATION_INDEX] = LocationIndex(hass)
+
+    return index
@@ -2,22 +2,27 @@
 import asyncio
 import logging
 from datetime import timedelta, datetime
-from typing import Any, Dict, List, Set, Optional
+from typing import Any, Dict, Set, Optional, cast
 
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     callback,
     State,
     CoreState,
     valid_entity_id,
 )
-from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
 import homeassistant.util.dt as dt_util
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import LogStore
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -28,11 +33,14 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between writing all states instead of the changed states
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -60,6 +68,14 @@ class StoredState:
         return cls(State.from_dict(json_dict["state"]), last_seen)
 
 
+class RestoreStateStore(LogStore):
+    """Store the last states keyed by entity_id."""
+
+    async def _async_migrate_func(self, old_version, old_data):
+        """Migrate the list of stored states."""
+        return {item["state"]["entity_id"]: item for item in old_data}
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -82,14 +98,14 @@ class RestoreStateData:
 
                 if stored_states is None:
                     _LOGGER.debug("Not creating cache - no saved states found")
-                    data.last_states = {}
                 else:
-                    data.last_states = {
-                        item["state"]["entity_id"]: StoredState.from_dict(item)
-                        for item in stored_states
-                        if valid_entity_id(item["state"]["entity_id"])
+                    # States are only decoded when an entity asks for them
+                    data.stored_data = {
+                        entity_id: item
+                        for entity_id, item in cast(Dict, stored_states).items()
+                        if valid_entity_id(entity_id)
                     }
-                    _LOGGER.debug("Created cache with %s", list(data.last_states))
+                    _LOGGER.debug("Created cache with %s", list(data.stored_data))
 
                 if hass.state == CoreState.running:
                     data.async_setup_dump()
@@ -109,14 +125,30 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store: Store = Store(
+        self.store: RestoreStateStore = RestoreStateStore(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: Dict[str, StoredState] = {}
+        self.stored_data: Dict[str, Dict] = {}
         self.entity_ids: Set[str] = set()
+        self.changed_entity_ids: Set[str] = set()
+        self.last_compacted: Optional[datetime] = None
+
+    @callback
+    def async_get_last_stored_state(self, entity_id: str) -> Optional[StoredState]:
+        """Return the stored state of an entity from the previous run."""
+        stored_state = self.last_states.get(entity_id)
+
+        if stored_state is None and entity_id in self.stored_data:
+            stored_state = self.last_states[entity_id] = StoredState.from_dict(
+                self.stored_data.pop(entity_id)
+            )
 
-    def async_get_stored_states(self) -> List[StoredState]:
-        """Get the set of states which should be stored.
+        return stored_state
+
+    @callback
+    def async_get_stored_states(self) -> Dict[str, Dict]:
+        """Get the states which should be stored, keyed by entity_id.
 
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
@@ -125,15 +157,17 @@ class RestoreStateData:
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         current_entity_ids = set(state.entity_id for state in all_states)
+        expiration_time = now - STATE_EXPIRATION
+        stored_states = {}
+
+        for entity_id, item in self.stored_data.items():
+            if entity_id in current_entity_ids:
+                continue
 
-        # Start with the currently registered states
-        stored_states = [
-            StoredState(state, now)
-            for state in all_states
-            if state.entity_id in self.entity_ids
-        ]
+            last_seen = dt_util.parse_datetime(item["last_seen"])
 
-        expiration_time = now - STATE_EXPIRATION
+            if last_seen is not None and last_seen >= expiration_time:
+                stored_states[entity_id] = item
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -144,20 +178,57 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            stored_states[entity_id] = stored_state.as_dict()
+
+        # Add the currently registered states
+        for state in all_states:
+            if state.entity_id in self.entity_ids:
+                stored_states[state.entity_id] = StoredState(state, now).as_dict()
 
         return stored_states
 
+    @callback
+    def async_get_changed_states(self) -> Dict[str, Optional[Dict]]:
+        """Get the stored states of the entities changed since the last dump.
+
+        A value of None removes the stored state of an entity.
+        """
+        now = dt_util.utcnow()
+        changed_states: Dict[str, Optional[Dict]] = {}
+
+        for entity_id in self.changed_entity_ids:
+            state = self.hass.states.get(entity_id)
+
+            if entity_id in self.entity_ids and state is not None:
+                changed_states[entity_id] = StoredState(state, now).as_dict()
+            elif entity_id in self.last_states:
+                changed_states[entity_id] = self.last_states[entity_id].as_dict()
+            else:
+                changed_states[entity_id] = self.stored_data.get(entity_id)
+
+        self.changed_entity_ids = set()
+        return changed_states
+
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the states changed since the last dump to storage.
+
+        All states are written when the log of changes is compacted.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            if (
+                self.last_compacted is None
+                or now - self.last_compacted >= STATE_COMPACT_INTERVAL
+            ):
+                self.last_compacted = now
+                self.changed_entity_ids = set()
+                await self.store.async_save(self.async_get_stored_states())
+            else:
+                await self.store.async_append(
+                    self.async_get_changed_states(), self.async_get_stored_states
+                )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -179,6 +250,17 @@ class RestoreStateData:
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
 
+        # Track which restore entities changed since the last dump
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Mark the state of a restore entity as changed."""
+        entity_id = event.data["entity_id"]
+
+        if entity_id in self.entity_ids:
+            self.changed_entity_ids.add(entity_id)
+
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
         """Store this entity's state when hass is shutdown."""
@@ -197,8 +279,10 @@ class RestoreStateData:
             state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
+            self.stored_data.pop(entity_id, None)
 
         self.entity_ids.remove(entity_id)
+        self.changed_entity_ids.add(entity_id)
 
 
 def _encode(value):
@@ -252,6 +336,7 @@ class RestoreEntity(Entity):
             _LOGGER.warning("Cannot get last state. Entity not added to hass")
             return None
         data = await RestoreStateData.async_get_instance(self.hass)
-        if self.entity_id not in data.last_states:
+        stored_state = data.async_get_last_stored_state(self.entity_id)
+        if stored_state is None:
             return None
-        return data.last_states[self.entity_id].state
+        return stored_state.state
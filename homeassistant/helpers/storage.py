@@ -1,11 +1,16 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
+from timeit import default_timer as timer
 from typing import Dict, List, Optional, Callable, Union, Any, Type
 
+import attr
+
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
@@ -16,9 +21,38 @@ from homeassistant.helpers.event import async_call_later
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+DATA_WRITE_STATS = "storage_write_stats"
+# Number of appended changes after which a log store is compacted
+DEFAULT_MAX_LOG_ENTRIES = 1000
 _LOGGER = logging.getLogger(__name__)
 
 
+@attr.s(slots=True)
+class WriteStats:
+    """Statistics of the writes of a store."""
+
+    writes = attr.ib(type=int, default=0)
+    bytes = attr.ib(type=int, default=0)
+    duration = attr.ib(type=float, default=0)
+    last_bytes = attr.ib(type=int, default=0)
+    last_duration = attr.ib(type=float, default=0)
+
+    def record(self, size: int, duration: float) -> None:
+        """Record a write of size bytes."""
+        self.writes += 1
+        self.bytes += size
+        self.duration += duration
+        self.last_bytes = size
+        self.last_duration = duration
+
+
+@callback
+@bind_hass
+def async_get_write_stats(hass: HomeAssistant) -> Dict[str, WriteStats]:
+    """Return the write statistics of all stores by key."""
+    return hass.data.setdefault(DATA_WRITE_STATS, {})
+
+
 @bind_hass
 async def async_migrator(
     hass,
@@ -65,12 +99,17 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
     ):
         """Initialize storage class."""
         self.version = version
         self.key = key
         self.hass = hass
+        self.write_stats: WriteStats = async_get_write_stats(hass).setdefault(
+            key, WriteStats()
+        )
         self._private = private
+        self._compact = compact
         self._data: Optional[Dict[str, Any]] = None
         self._unsub_delay_listener: Optional[CALLBACK_TYPE] = None
         self._unsub_stop_listener: Optional[CALLBACK_TYPE] = None
@@ -108,9 +147,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -200,14 +237,139 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self, path: str) -> Dict:
+        """Load the stored data."""
+        return json_util.load_json(path)  # type: ignore
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        start = timer()
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
+        self.write_stats.record(os.path.getsize(path), timer() - start)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
+
+
+@bind_hass
+class LogStore(Store):
+    """Class to help storing a dictionary that changes often.
+
+    Changed items are appended to the store file instead of writing all
+    data. All data is written once the log grows beyond max_log_entries
+    and at the first write after loading.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        private: bool = False,
+        *,
+        encoder: Optional[Type[JSONEncoder]] = None,
+        max_log_entries: int = DEFAULT_MAX_LOG_ENTRIES,
+    ):
+        """Initialize log store class."""
+        super().__init__(hass, version, key, private, encoder=encoder, compact=True)
+        self._max_log_entries = max_log_entries
+        self._log_entries: Optional[int] = None
+
+    async def async_append(
+        self, changes: Dict[str, Any], data_func: Callable[[], Dict]
+    ) -> None:
+        """Append changed items, a value of None removes an item.
+
+        data_func returns all data and is called when the log is compacted.
+        """
+        if (
+            self._log_entries is None
+            or self._log_entries + len(changes) > self._max_log_entries
+        ):
+            await self.async_save(data_func())
+            return
+
+        if not changes:
+            return
+
+        self._log_entries += len(changes)
+
+        async with self._write_lock:
+            try:
+                await self.hass.async_add_executor_job(
+                    self._append_data, self.path, changes
+                )
+            except (json_util.SerializationError, json_util.WriteError) as err:
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    async def async_save(self, data: Union[Dict, List]) -> None:
+        """Save all data, compacting the log."""
+        self._log_entries = 0
+        await super().async_save(data)
+
+    def _load_data(self, path: str) -> Dict:
+        """Load the stored data and apply the appended changes."""
+        try:
+            with open(path, encoding="utf-8") as fdesc:
+                content = fdesc.read()
+        except FileNotFoundError:
+            return {}
+        except OSError as error:
+            _LOGGER.exception("Reading %s failed", path)
+            raise HomeAssistantError(error)
+
+        try:
+            data, end = json.JSONDecoder().raw_decode(content)
+        except ValueError as error:
+            _LOGGER.exception("Could not parse JSON content: %s", path)
+            raise HomeAssistantError(error)
+
+        stored = data["data"]
+
+        for line in content[end:].splitlines():
+            if not line:
+                continue
+
+            try:
+                item, value = json.loads(line)
+            except ValueError:
+                # The last change is incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring invalid change in %s: %s", path, line)
+                continue
+
+            if value is None:
+                stored.pop(item, None)
+            else:
+                stored[item] = value
+
+        return data
+
+    def _append_data(self, path: str, changes: Dict[str, Any]) -> None:
+        """Append changes to the store file."""
+        start = timer()
+
+        try:
+            content = "".join(
+                "\n"
+                + json.dumps([item, value], separators=(",", ":"), cls=self._encoder)
+                for item, value in changes.items()
+            ).encode("utf-8")
+        except TypeError as error:
+            _LOGGER.exception("Failed to serialize to JSON: %s", path)
+            raise json_util.SerializationError(error)
+
+        try:
+            with open(path, "ab") as fdesc:
+                fdesc.write(content)
+        except OSError as error:
+            _LOGGER.exception("Appending to %s failed", path)
+            raise json_util.WriteError(error)
+
+        self.write_stats.record(len(content), timer() - start)
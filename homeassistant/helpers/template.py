@@ -7,8 +7,9 @@ import random
 import re
 from datetime import datetime
 from functools import wraps
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
+import attr
 import jinja2
 from jinja2 import contextfilter, contextfunction
 from jinja2.sandbox import ImmutableSandboxedEnvironment
@@ -39,6 +40,7 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_RENDER_CACHE_STATS = "template.render_cache_stats"
 _ENVIRONMENT = "template.environment"
 
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
@@ -113,6 +115,78 @@ def _true(arg: Any) -> bool:
     return True
 
 
+@attr.s(slots=True)
+class RenderCacheStats:
+    """Statistics of the template render cache."""
+
+    hits = attr.ib(type=int, default=0)
+    misses = attr.ib(type=int, default=0)
+
+
+@callback
+@bind_hass
+def async_get_render_cache_stats(hass: HomeAssistantType) -> RenderCacheStats:
+    """Return the statistics of the template render cache."""
+    stats = hass.data.get(_RENDER_CACHE_STATS)
+
+    if stats is None:
+        stats = hass.data[_RENDER_CACHE_STATS] = RenderCacheStats()
+
+    return stats
+
+
+@attr.s(slots=True)
+class _RenderCache:
+    """The result of a render and the inputs it was computed from."""
+
+    variables = attr.ib(type=Dict[str, Any])
+    states = attr.ib(type=Tuple[Tuple[str, Optional[State]], ...])
+    lookups = attr.ib(type=Tuple[str, ...])
+    domains = attr.ib(type=Tuple[Tuple[str, List[str]], ...])
+    location = attr.ib(type=Tuple[float, float])
+    result = attr.ib(type=Optional[str], default=None)
+    exception = attr.ib(type=Optional[TemplateError], default=None)
+
+    @classmethod
+    def from_render_info(
+        cls, hass: HomeAssistantType, variables: Dict[str, Any], info: "RenderInfo"
+    ) -> "_RenderCache":
+        """Record the inputs of a render."""
+        # pylint: disable=protected-access
+        return cls(
+            variables,
+            tuple(
+                (entity_id, hass.states.get(entity_id)) for entity_id in info.entities
+            ),
+            tuple(info._lookups),
+            tuple(
+                (domain, hass.states.async_entity_ids(domain))
+                for domain in info.domains
+            ),
+            (hass.config.latitude, hass.config.longitude),
+            info._result,
+            info._exception,
+        )
+
+    def is_valid(self, hass: HomeAssistantType, variables: Dict[str, Any]) -> bool:
+        """Return if the inputs of the render are unchanged."""
+        try:
+            if variables != self.variables:
+                return False
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+        get_state = hass.states.get
+        entity_ids = hass.states.async_entity_ids
+
+        return (
+            self.location == (hass.config.latitude, hass.config.longitude)
+            and all(get_state(entity_id) is state for entity_id, state in self.states)
+            and all(get_state(entity_id) is not None for entity_id in self.lookups)
+            and all(entity_ids(domain) == ids for domain, ids in self.domains)
+        )
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -124,8 +198,11 @@ class RenderInfo:
         self._result = None
         self._exception = None
         self._all_states = False
+        self._volatile = False
         self._domains = []
         self._entities = []
+        # Entities that were looked up but whose state was not accessed
+        self._lookups = []
 
     def filter(self, entity_id: str) -> bool:
         """Template should re-render if the state changes."""
@@ -138,6 +215,21 @@ class RenderInfo:
             or entity_id in self._entities
         )
 
+    @property
+    def all_states(self) -> bool:
+        """Return if the template iterated over all states."""
+        return self._all_states
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """Return the domains the template iterated over."""
+        return self._domains
+
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Return the entities whose state the template accessed."""
+        return self._entities
+
     @property
     def result(self) -> str:
         """Results of the template computation."""
@@ -149,9 +241,9 @@ class RenderInfo:
         self._entities = frozenset(self._entities)
         if self._all_states:
             # Leave lifecycle_filter as True
-            del self._domains
+            self._domains = frozenset()
         elif not self._domains:
-            del self._domains
+            self._domains = frozenset()
             self.filter_lifecycle = self.filter
         else:
             self._domains = frozenset(self._domains)
@@ -169,6 +261,7 @@ class Template:
         self.template: str = template
         self._compiled_code = None
         self._compiled = None
+        self._render_cache: Optional[_RenderCache] = None
         self.hass = hass
 
     @property
@@ -180,6 +273,11 @@ class Template:
             ret = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
         return ret
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template does not contain any template syntax."""
+        return _RE_JINJA_DELIMITERS.search(self.template) is None
+
     def ensure_valid(self):
         """Return if template is valid."""
         if self._compiled_code is not None:
@@ -238,6 +336,46 @@ class Template:
             render_info._freeze()
         return render_info
 
+    @callback
+    def async_render_cached(
+        self, variables: TemplateVarsType = None, **kwargs: Any
+    ) -> str:
+        """Render given template, reusing the last result if possible.
+
+        The last result is returned while the variables are equal and all
+        states accessed by the last render are still the same state objects.
+        Templates that iterate over all states or depend on the time or on
+        random values are rendered every time.
+
+        This method must be run in the event loop.
+        """
+        if self.hass is None or _RENDER_INFO in self.hass.data:
+            return self.async_render(variables, **kwargs)
+
+        if variables is not None:
+            kwargs.update(variables)
+
+        stats = async_get_render_cache_stats(self.hass)
+        cache = self._render_cache
+
+        if cache is not None and cache.is_valid(self.hass, kwargs):
+            stats.hits += 1
+
+            if cache.exception is not None:
+                raise cache.exception
+            # The result is only None if the render raised
+            return cache.result  # type: ignore
+
+        stats.misses += 1
+        info = self.async_render_to_info(kwargs)
+        # pylint: disable=protected-access
+        if info.all_states or info._volatile:
+            self._render_cache = None
+        else:
+            self._render_cache = _RenderCache.from_render_info(self.hass, kwargs, info)
+
+        return info.result
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -342,9 +480,7 @@ class AllStates:
         self._collect_all()
         return iter(
             _wrap_state(self._hass, state)
-            for state in sorted(
-                self._hass.states.async_all(), key=lambda state: state.entity_id
-            )
+            for state in self._hass.states.async_all_sorted()
         )
 
     def __len__(self):
@@ -387,14 +523,8 @@ class DomainStates:
         """Return the iteration over all the states."""
         self._collect_domain()
         return iter(
-            sorted(
-                (
-                    _wrap_state(self._hass, state)
-                    for state in self._hass.states.async_all()
-                    if state.domain == self._domain
-                ),
-                key=lambda state: state.entity_id,
-            )
+            _wrap_state(self._hass, state)
+            for state in self._hass.states.async_states_for_domain(self._domain)
         )
 
     def __len__(self):
@@ -472,6 +602,10 @@ def _get_state(hass, entity_id):
         # access to the state properties in the state wrapper.
         _collect_state(hass, entity_id)
         return None
+    render_info = hass.data.get(_RENDER_INFO)
+    if render_info is not None:
+        # pylint: disable=protected-access
+        render_info._lookups.append(entity_id)
     return _wrap_state(hass, state)
 
 
@@ -573,12 +707,45 @@ def closest(hass, *args):
 
         entities = args[2]
 
+    if isinstance(entities, (AllStates, DomainStates)):
+        closest_state = _closest_indexed(hass, latitude, longitude, entities)
+
+        if closest_state is not _SENTINEL:
+            return closest_state
+
     states = expand(hass, entities)
 
     # state will already be wrapped here
     return loc_helper.closest(latitude, longitude, states)
 
 
+def _closest_indexed(hass, latitude, longitude, entities):
+    """Find the closest state of all or one domain using the location index.
+
+    Returns _SENTINEL if groups would need to be expanded.
+    """
+    from homeassistant.components import group
+
+    index = loc_helper.async_get_location_index(hass)
+    # pylint: disable=protected-access
+    if isinstance(entities, DomainStates):
+        domain = entities._domain
+        if domain == group.DOMAIN:
+            return _SENTINEL
+        entities._collect_domain()
+    else:
+        domain = None
+        if index.async_has_domain(group.DOMAIN):
+            return _SENTINEL
+        entities._collect_all()
+
+    # Every state would have been accessed to check its location
+    for entity_id in hass.states.async_entity_ids(domain):
+        _collect_state(hass, entity_id)
+
+    return _wrap_state(hass, index.async_closest(domain, latitude, longitude))
+
+
 def closest_filter(hass, *args):
     """Call closest as a filter. Need to reorder arguments."""
     new_args = list(args[1:])
@@ -916,6 +1083,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
+
+        def volatile(func):
+            """Wrap function whose result changes without a state change."""
+            # Render info is tracked in hass.data and only templates with
+            # hass are cached, so without hass there is nothing to mark.
+            if hass is None:
+                return func
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                render_info = hass.data.get(_RENDER_INFO)
+                if render_info is not None:
+                    # pylint: disable=protected-access
+                    render_info._volatile = True
+                return func(*args, **kwargs)
+
+            return wrapper
+
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -936,7 +1121,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["is_defined"] = fail_when_undefined
         self.filters["max"] = max
         self.filters["min"] = min
-        self.filters["random"] = random_every_time
+        self.filters["random"] = volatile(random_every_time)
         self.filters["base64_encode"] = base64_encode
         self.filters["base64_decode"] = base64_decode
         self.filters["ordinal"] = ordinal
@@ -960,10 +1145,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["atan"] = arc_tangent
         self.globals["atan2"] = arc_tangent2
         self.globals["float"] = forgiving_float
-        self.globals["now"] = dt_util.now
-        self.globals["utcnow"] = dt_util.utcnow
+        self.globals["now"] = volatile(dt_util.now)
+        self.globals["utcnow"] = volatile(dt_util.utcnow)
         self.globals["as_timestamp"] = forgiving_as_timestamp
-        self.globals["relative_time"] = dt_util.get_age
+        self.globals["relative_time"] = volatile(dt_util.get_age)
         self.globals["strptime"] = strptime
         if hass is None:
             return
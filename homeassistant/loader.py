@@ -6,11 +6,16 @@ documentation as possible to keep it understandable.
 """
 import asyncio
 import functools as ft
+import heapq
 import importlib
+import importlib.util
 import json
 import logging
+from operator import itemgetter
 import pathlib
 import sys
+import threading
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     Optional,
@@ -21,6 +26,7 @@ from typing import (
     TypeVar,
     List,
     Dict,
+    Tuple,
     Union,
     cast,
 )
@@ -39,6 +45,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMINGS = "import_timings"
+CUSTOM_COMPONENTS_STORAGE_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_STORAGE_VERSION = 1
+CUSTOM_COMPONENTS_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 LOOKUP_PATHS = [PACKAGE_CUSTOM_COMPONENTS, PACKAGE_BUILTIN]
@@ -50,6 +60,9 @@ CUSTOM_WARNING = (
 )
 _UNDEF = object()
 
+# Number of modules reported by slowest_imports
+SLOW_IMPORTS_REPORTED = 10
+
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     """Generate a manifest from a legacy module."""
@@ -66,39 +79,67 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, "Integration"]:
-    """Return list of custom integrations."""
+    """Return list of custom integrations.
+
+    The parsed manifests are stored together with their mtime, so only
+    manifests that changed since the last start are read again.
+    """
     try:
         import custom_components
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List) -> List:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    store = hass.helpers.storage.Store(
+        CUSTOM_COMPONENTS_STORAGE_VERSION, CUSTOM_COMPONENTS_STORAGE_KEY
+    )
+    index = await store.async_load() or {}
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    integrations, new_index = await hass.async_add_executor_job(
+        _scan_custom_components, hass, custom_components, index
     )
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+    if new_index != index:
+        store.async_delay_save(lambda: new_index, CUSTOM_COMPONENTS_SAVE_DELAY)
+
+    return integrations
+
+
+def _scan_custom_components(
+    hass: "HomeAssistant", root_module: ModuleType, index: Dict[str, Dict]
+) -> Tuple[Dict[str, "Integration"], Dict[str, Dict]]:
+    """Return the custom integrations and an updated manifest index."""
+    integrations: Dict[str, Integration] = {}
+    new_index: Dict[str, Dict] = {}
+
+    for base in root_module.__path__:  # type: ignore
+        for entry in pathlib.Path(base).iterdir():
+            manifest_path = entry / "manifest.json"
+
+            try:
+                mtime = manifest_path.stat().st_mtime
+            except OSError:
+                continue
+
+            cached = index.get(str(manifest_path))
+
+            if cached is not None and cached["mtime"] == mtime:
+                manifest = cached["manifest"]
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+            new_index[str(manifest_path)] = {"mtime": mtime, "manifest": manifest}
+            integration = Integration(
+                hass, f"{root_module.__name__}.{entry.name}", entry, manifest
             )
-            for comp in dirs
-        )
-    )
+            integrations.setdefault(integration.domain, integration)
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return integrations, new_index
 
 
 async def async_get_custom_components(
@@ -170,6 +211,29 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index."""
+        from homeassistant import components
+        from homeassistant.generated.config_flows import FLOWS
+        from homeassistant.generated.manifests import MANIFESTS
+
+        indexed = MANIFESTS.get(domain)
+
+        if indexed is None:
+            return None
+
+        manifest = {"domain": domain, "config_flow": domain in FLOWS, **indexed}
+
+        return cls(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(components.__file__).parent / domain,
+            manifest,
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -209,6 +273,7 @@ class Integration:
         )
         self.requirements: List[str] = manifest["requirements"]
         self.config_flow: bool = manifest.get("config_flow", False)
+        self.lazy_imports: List[str] = manifest.get("lazy_imports", [])
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @property
@@ -220,7 +285,8 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            self._lazy_import()
+            cache[self.domain] = _import_module(self.hass, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -228,11 +294,21 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
+            self._lazy_import()
+            cache[full_name] = _import_module(
+                self.hass, f"{self.pkg_path}.{platform_name}"
             )
         return cache[full_name]  # type: ignore
 
+    def _lazy_import(self) -> None:
+        """Make the lazy imports lazy before the integration imports them."""
+        for name in self.lazy_imports:
+            try:
+                lazy_import(name)
+            except ImportError:
+                # Raised again when the integration imports it
+                pass
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -272,11 +348,16 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
         event.set()
         return integration
 
-    from homeassistant import components
+    # Built-in integrations are resolved from the generated manifest index,
+    # the file system is only searched for integrations missing from it.
+    integration = Integration.resolve_from_index(hass, domain)
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    if integration is None:
+        from homeassistant import components
+
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -343,7 +424,7 @@ def _load_file(
 
     for path in (f"{base}.{comp_or_platform}" for base in base_paths):
         try:
-            module = importlib.import_module(path)
+            module = _import_module(hass, path)
 
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
@@ -386,6 +467,84 @@ def _load_file(
     return None
 
 
+def _import_module(hass: "HomeAssistant", name: str) -> ModuleType:
+    """Import a module and record how long the import took.
+
+    The time includes importing the modules it imports for the first time.
+    """
+    start = timer()
+    module = importlib.import_module(name)
+    hass.data.setdefault(DATA_IMPORT_TIMINGS, {})[name] = timer() - start
+    return module
+
+
+def slowest_imports(
+    hass: "HomeAssistant", count: int = SLOW_IMPORTS_REPORTED
+) -> List[Tuple[str, float]]:
+    """Return the modules that took the longest to import, slowest first."""
+    timings = hass.data.get(DATA_IMPORT_TIMINGS, {})
+    return heapq.nlargest(count, timings.items(), key=itemgetter(1))
+
+
+class _LazyModule(ModuleType):
+    """A module that is executed when an attribute is first accessed.
+
+    importlib.util.LazyLoader is not thread safe before Python 3.8, a thread
+    could see the module while another thread is still executing it. Here
+    the module is executed under its own lock and only becomes a plain
+    module once it is fully executed. Platforms are imported in executor
+    threads, so several threads can access a lazy module first.
+    """
+
+    def __getattribute__(self, attr: str) -> Any:
+        """Execute the module if needed and return the attribute."""
+        spec = ModuleType.__getattribute__(self, "__spec__")
+
+        # Importing the module again (import module) reads its spec
+        if attr == "__spec__":
+            return spec
+
+        state = spec.loader_state
+
+        with state["lock"]:
+            # Access from the executing module itself passes through
+            if type(self) is _LazyModule and not state["executing"]:
+                state["executing"] = True
+                try:
+                    spec.loader.exec_module(self)
+                    self.__class__ = ModuleType  # type: ignore
+                finally:
+                    state["executing"] = False
+
+        return ModuleType.__getattribute__(self, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is only executed once an attribute is accessed.
+
+    The module is added to sys.modules, so later imports of it return the
+    lazy module as well. Integrations list the heavy modules they import in
+    lazy_imports in their manifest, so that they are not imported before
+    the integration actually uses them. Importing names from the module
+    (from module import name) accesses it and imports it right away.
+    """
+    module = sys.modules.get(name)
+
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader_state = {"lock": threading.RLock(), "executing": False}
+    module.__class__ = _LazyModule
+    sys.modules[name] = module
+    return module
+
+
 class ModuleWrapper:
     """Class to wrap a Python module and auto fill in hass argument."""
 
@@ -2,8 +2,10 @@
 import argparse
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
 from typing import Callable, Dict
 
@@ -106,6 +108,40 @@ async def async_million_time_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def async_time_changed_with_pending_timers(hass):
+    """Fire 10k time changed events while 1000 delays are pending."""
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 4:
+            event.set()
+
+    def action(_):
+        """Never called, the delays do not expire."""
+
+    for idx in range(1000):
+        hass.helpers.event.async_call_later(3600 + idx, action)
+
+    hass.bus.async_listen(EVENT_TIME_CHANGED, listener)
+    event_data = {ATTR_NOW: dt_util.utcnow()}
+
+    for _ in range(10 ** 4):
+        hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+
+    start = timer()
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def async_million_state_changed_helper(hass):
     """Run a million events through state changed helper."""
@@ -186,3 +222,299 @@ def _logbook_filtering(hass, last_changed, last_updated):
     list(logbook.humanify(None, yield_events(event)))
 
     return timer() - start
+
+
+@benchmark
+async def logbook_busy_day(hass):
+    """Query a day of 100k recorded state changes from the logbook."""
+    from homeassistant.components import logbook, recorder
+    from homeassistant.components.recorder.models import Events, States
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.setup import async_setup_component
+
+    state_changes = 10 ** 5
+    entities = 200
+    end = dt_util.utcnow()
+    start = end - timedelta(days=1)
+    step = timedelta(days=1) / state_changes
+
+    def fill_database():
+        """Record a day of switch, sensor and attribute changes."""
+        states = {}
+        with session_scope(hass=hass) as session:
+            for idx in range(state_changes):
+                entity_idx = idx % entities
+                now = start + step * idx
+                if entity_idx % 3 == 0:
+                    entity_id = f"switch.benchmark_{entity_idx}"
+                    value = "on" if idx // entities % 2 else "off"
+                    attributes = {"friendly_name": f"Switch {entity_idx}"}
+                elif entity_idx % 3 == 1:
+                    entity_id = f"sensor.benchmark_{entity_idx}"
+                    value = str(idx)
+                    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+                else:
+                    entity_id = f"light.benchmark_{entity_idx}"
+                    value = "on"
+                    attributes = {"brightness": idx % 255}
+
+                old_state = states.get(entity_id)
+                last_changed = (
+                    old_state.last_changed
+                    if old_state is not None and old_state.state == value
+                    else now
+                )
+                new_state = states[entity_id] = core.State(
+                    entity_id, value, attributes, last_changed, now
+                )
+                event = core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                    time_fired=now,
+                )
+                dbevent = Events.from_event(event)
+                dbevent.event_id = idx + 1
+                dbstate = States.from_event(event)
+                dbstate.event_id = dbevent.event_id
+                session.add_all((dbevent, dbstate))
+
+    def query_logbook():
+        """Return the logbook entries and how long it took to get them."""
+        config = logbook.CONFIG_SCHEMA({logbook.DOMAIN: {}})[logbook.DOMAIN]
+        query_start = timer()
+        # pylint: disable=protected-access
+        entries = list(logbook._get_events(hass, config, start, end))
+        return entries, timer() - query_start
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        db_url = f"sqlite:///{os.path.join(config_dir, 'benchmark.db')}"
+        assert await async_setup_component(
+            hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url}}
+        )
+        await hass.async_add_executor_job(fill_database)
+        entries, runtime = await hass.async_add_executor_job(query_logbook)
+
+    print(f"Queried {len(entries)} entries of {state_changes} state changes")
+    return runtime
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Dispatch messages against 10k MQTT subscriptions."""
+    from homeassistant.components.mqtt.matcher import TopicMatcher
+
+    matcher = TopicMatcher()
+
+    for idx in range(10 ** 4):
+        if idx % 10 == 0:
+            matcher.add(f"zigbee2mqtt/device_{idx}/+", idx)
+        else:
+            matcher.add(f"zigbee2mqtt/device_{idx}", idx)
+    matcher.add("zigbee2mqtt/bridge/#", "bridge")
+    matcher.add("homeassistant/+/+/config", "discovery")
+
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(0, 10 ** 4, 7)]
+    topics.append("zigbee2mqtt/device_10/availability")
+    topics.append("zigbee2mqtt/bridge/state")
+
+    start = timer()
+
+    matched = 0
+    for _ in range(10 ** 5 // len(topics)):
+        for topic in topics:
+            matched += len(matcher.match(topic))
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_state_changed_fanout(hass):
+    """Forward 10k state changes to 1, 10, 30 and 100 websocket subscriptions."""
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+    from homeassistant.components.websocket_api.subscriptions import (
+        async_subscribe_events,
+    )
+
+    state_changes = 10 ** 4
+    total = 0
+
+    @core.callback
+    def send_message(_):
+        """Drop the message."""
+
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True)
+
+    for connections in (1, 10, 30, 100):
+        unsubs = [
+            async_subscribe_events(
+                hass,
+                ActiveConnection(
+                    logging.getLogger(__name__), hass, send_message, user, None
+                ),
+                idx + 1,
+                EVENT_STATE_CHANGED,
+            )
+            for idx in range(connections)
+        ]
+
+        start = timer()
+
+        for idx in range(state_changes):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx % 100}", idx, {"unit_of_measurement": "W"}
+            )
+
+        await hass.async_block_till_done()
+
+        runtime = timer() - start
+        total += runtime
+        print(f"{state_changes / runtime:.0f} events/s with {connections} connections")
+
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
+@benchmark
+async def yaml_split_config(hass):
+    """Load a configuration split over 400 files, without and with cache."""
+    from homeassistant.config import load_yaml_config_file
+
+    files = 400
+    automation = """
+- alias: Benchmark {idx}-{num}
+  trigger:
+    - platform: state
+      entity_id: binary_sensor.motion_{idx}
+      to: "on"
+  condition:
+    - condition: template
+      value_template: "{{{{ states('sun.sun') == 'below_horizon' }}}}"
+  action:
+    - service: light.turn_on
+      data:
+        entity_id: light.room_{idx}
+        brightness_pct: {num}
+"""
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_path = os.path.join(config_dir, "configuration.yaml")
+        cache_dir = os.path.join(config_dir, ".storage", "yaml_cache")
+        os.mkdir(os.path.join(config_dir, "automations"))
+
+        with open(config_path, "w") as fil:
+            fil.write("automation: !include_dir_merge_list automations\n")
+
+        for idx in range(files):
+            with open(
+                os.path.join(config_dir, "automations", f"{idx}.yaml"), "w"
+            ) as fil:
+                for num in range(10):
+                    fil.write(automation.format(idx=idx, num=num))
+
+        def load(cache_dir):
+            """Load the configuration and return how long it took."""
+            start = timer()
+            load_yaml_config_file(config_path, cache_dir)
+            return timer() - start
+
+        uncached = await hass.async_add_executor_job(load, None)
+        await hass.async_add_executor_job(load, cache_dir)
+        cached = await hass.async_add_executor_job(load, cache_dir)
+
+    print(f"Parsed {files} files in {uncached:.3f}s, cached in {cached:.3f}s")
+    return cached
+
+
+@benchmark
+async def template_sensor_render_cache(hass):
+    """Render the templates of 500 template sensors, without and with cache."""
+    from homeassistant.helpers.template import (
+        Template,
+        async_get_render_cache_stats,
+    )
+
+    sensors = 500
+    rounds = 100
+
+    for idx in range(sensors):
+        hass.states.async_set(f"sensor.power_{idx}", idx, {"voltage": 230})
+
+    templates = [
+        Template(
+            "{{ (states('sensor.power_%d') | float / "
+            "state_attr('sensor.power_%d', 'voltage')) | round(2) }}" % (idx, idx),
+            hass,
+        )
+        for idx in range(sensors)
+    ]
+
+    def render(cached):
+        """Render all templates while 5 sensors change per round."""
+        start = timer()
+
+        for num in range(rounds):
+            for idx in range(5):
+                hass.states.async_set(
+                    f"sensor.power_{(num * 5 + idx) % sensors}",
+                    num + rounds * cached,
+                    {"voltage": 230},
+                )
+            for tpl in templates:
+                if cached:
+                    tpl.async_render_cached()
+                else:
+                    tpl.async_render()
+
+        return timer() - start
+
+    uncached = render(False)
+    cached = render(True)
+    stats = async_get_render_cache_stats(hass)
+    await hass.async_block_till_done()
+
+    print(
+        f"Rendered {sensors} templates {rounds} times in {uncached:.3f}s, "
+        f"cached in {cached:.3f}s ({stats.hits} hits, {stats.misses} misses)"
+    )
+    return cached
+
+
+@benchmark
+# pylint: disable=unused-argument
+async def location_distances(hass):
+    """Compute 10000 distances from home, one by one and at once."""
+    import random
+
+    from homeassistant.util import location as location_util
+
+    points = 10 ** 4
+    rnd = random.Random(1)
+    latitudes = [rnd.uniform(-90, 90) for _ in range(points)]
+    longitudes = [rnd.uniform(-180, 180) for _ in range(points)]
+    home = (52.3731, 4.8922)
+
+    start = timer()
+    scalar = [
+        location_util.distance(*home, lat, lon)
+        for lat, lon in zip(latitudes, longitudes)
+    ]
+    one_by_one = timer() - start
+
+    start = timer()
+    batched = location_util.distances(*home, latitudes, longitudes)
+    at_once = timer() - start
+
+    print(
+        f"Computed {points} distances in {one_by_one:.3f}s one by one, "
+        f"in {at_once:.3f}s at once (numpy: {location_util.np is not None}, "
+        f"identical: {scalar == batched})"
+    )
+    return at_once
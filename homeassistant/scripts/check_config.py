@@ -162,8 +162,11 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable=possibly-unused-variable
-    def mock_load(filename):
-        """Mock hass.util.load_yaml to save config file names."""
+    def mock_load(filename, cache_dir=None):
+        """Mock hass.util.load_yaml to save config file names.
+
+        The YAML cache is not used, so checking the config writes nothing.
+        """
         res["yaml_files"][filename] = True
         return MOCKS["load"][1](filename)
 
@@ -1,10 +1,11 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from contextlib import contextmanager
 import logging.handlers
 from timeit import default_timer as timer
 
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Dict, List
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, Dict, List
 
 from homeassistant import requirements, core, loader, config as conf_util
 from homeassistant.config import async_notify_setup_error
@@ -18,9 +19,15 @@ ATTR_COMPONENT = "component"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMINGS = "setup_timings"
 
 SLOW_SETUP_WARNING = 10
 
+SETUP_TIMINGS_STORAGE_KEY = "core.setup_timings"
+SETUP_TIMINGS_STORAGE_VERSION = 1
+# Number of startups of which the setup timings are stored
+SETUP_TIMINGS_RUNS = 10
+
 
 def setup_component(hass: core.HomeAssistant, domain: str, config: Dict) -> bool:
     """Set up a component and all its dependencies."""
@@ -51,6 +58,130 @@ async def async_setup_component(
     return await task  # type: ignore
 
 
+@core.callback
+def async_get_setup_timings(hass: core.HomeAssistant) -> "SetupTimings":
+    """Return the setup timings of this run of Home Assistant."""
+    timings = hass.data.get(DATA_SETUP_TIMINGS)
+
+    if timings is None:
+        timings = hass.data[DATA_SETUP_TIMINGS] = SetupTimings(hass)
+
+    return timings
+
+
+class SetupTimings:
+    """Record how long the phases of setting up integrations take.
+
+    Times are in seconds since the timings were created, which bootstrap
+    does as the first thing it sets up.
+    """
+
+    def __init__(self, hass: core.HomeAssistant) -> None:
+        """Initialize the setup timings."""
+        self.hass = hass
+        self._start = timer()
+        # Maps integration or platform to phase to [start, end, duration]
+        self._phases: Dict[str, Dict[str, List[float]]] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+
+    @contextmanager
+    def measure(self, name: str, phase: str) -> Iterator[None]:
+        """Measure the time a phase of setting up name takes."""
+        start = timer()
+        try:
+            yield
+        finally:
+            self.async_record(name, phase, start, timer())
+
+    @core.callback
+    def async_record(self, name: str, phase: str, start: float, end: float) -> None:
+        """Record a phase of setting up name.
+
+        The durations of a phase that is recorded multiple times are added.
+        """
+        start -= self._start
+        end -= self._start
+        phases = self._phases.setdefault(name, {})
+        timing = phases.get(phase)
+
+        if timing is None:
+            phases[phase] = [start, end, end - start]
+        else:
+            timing[0] = min(timing[0], start)
+            timing[1] = max(timing[1], end)
+            timing[2] += end - start
+
+    @core.callback
+    def async_set_dependencies(self, name: str, dependencies: Iterable[str]) -> None:
+        """Set what name waits for before it is set up."""
+        self._dependencies[name] = list(dependencies)
+
+    @core.callback
+    def async_critical_path(self) -> List[str]:
+        """Return the chain of setups that determined the setup time.
+
+        Starts at the setup that finished last and follows the dependency
+        that finished last back to the first setup.
+        """
+        ends = {
+            name: max(timing[1] for timing in phases.values())
+            for name, phases in self._phases.items()
+        }
+        path: List[str] = []
+        name = max(ends, key=ends.__getitem__) if ends else None
+
+        while name is not None:
+            path.append(name)
+            waited_for = [
+                dep
+                for dep in self._dependencies.get(name, ())
+                if dep in ends and dep not in path
+            ]
+            name = max(waited_for, key=ends.__getitem__) if waited_for else None
+
+        path.reverse()
+        return path
+
+    @core.callback
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a report of the setup timings."""
+        setups = {}
+
+        for name, phases in self._phases.items():
+            setups[name] = {
+                "start": round(min(timing[0] for timing in phases.values()), 3),
+                "end": round(max(timing[1] for timing in phases.values()), 3),
+                "dependencies": self._dependencies.get(name, []),
+                "phases": {
+                    phase: {
+                        "start": round(timing[0], 3),
+                        "end": round(timing[1], 3),
+                        "duration": round(timing[2], 3),
+                    }
+                    for phase, timing in phases.items()
+                },
+            }
+
+        return {
+            "total": round(timer() - self._start, 3),
+            "critical_path": self.async_critical_path(),
+            "setups": setups,
+            "slowest_imports": [
+                {"module": module, "duration": round(duration, 3)}
+                for module, duration in loader.slowest_imports(self.hass)
+            ],
+        }
+
+    async def async_save(self) -> None:
+        """Store the report together with the reports of previous runs."""
+        store = self.hass.helpers.storage.Store(
+            SETUP_TIMINGS_STORAGE_VERSION, SETUP_TIMINGS_STORAGE_KEY
+        )
+        data = await store.async_load() or {}
+        runs = [self.as_dict(), *data.get("runs", [])][:SETUP_TIMINGS_RUNS]
+        await store.async_save({"runs": runs})
+
+
 async def _async_process_dependencies(
     hass: core.HomeAssistant, config: Dict, name: str, dependencies: List[str]
 ) -> bool:
@@ -99,12 +230,18 @@ async def _async_setup_component(
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
+    timings = async_get_setup_timings(hass)
+
     try:
         integration = await loader.async_get_integration(hass, domain)
     except loader.IntegrationNotFound:
         log_error("Integration not found.", False)
         return False
 
+    timings.async_set_dependencies(
+        domain, [*integration.dependencies, *(integration.after_dependencies or [])]
+    )
+
     # Validate all dependencies exist and there are no circular dependencies
     try:
         await loader.async_component_dependencies(hass, domain)
@@ -135,7 +272,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with timings.measure(domain, "import"):
+            component = integration.get_component()
     except ImportError:
         log_error("Unable to import component", False)
         return False
@@ -143,9 +281,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with timings.measure(domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -184,6 +323,7 @@ async def _async_setup_component(
         return False
     finally:
         end = timer()
+        timings.async_record(domain, "setup", start, end)
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds.", domain, end - start)
@@ -200,7 +340,8 @@ async def _async_setup_component(
 
     if hass.config_entries:
         for entry in hass.config_entries.async_entries(domain):
-            await entry.async_setup(hass, integration=integration)
+            with timings.measure(domain, "setup_entry"):
+                await entry.async_setup(hass, integration=integration)
 
     hass.config.components.add(domain)
 
@@ -282,15 +423,22 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if integration.dependencies and not await _async_process_dependencies(
-        hass, config, integration.domain, integration.dependencies
-    ):
-        raise HomeAssistantError("Could not set up all dependencies.")
+    timings = async_get_setup_timings(hass)
+
+    if integration.dependencies:
+        with timings.measure(integration.domain, "dependencies"):
+            dependencies_set_up = await _async_process_dependencies(
+                hass, config, integration.domain, integration.dependencies
+            )
+
+        if not dependencies_set_up:
+            raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        await requirements.async_process_requirements(
-            hass, integration.domain, integration.requirements
-        )
+        with timings.measure(integration.domain, "requirements"):
+            await requirements.async_process_requirements(
+                hass, integration.domain, integration.requirements
+            )
 
     processed.add(integration.domain)
 
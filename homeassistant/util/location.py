@@ -6,10 +6,15 @@ detect_location_info and elevation are mocked by default during tests.
 import asyncio
 import collections
 import math
-from typing import Any, Optional, Tuple, Dict
+from typing import Any, List, Optional, Sequence, Tuple, Dict
 
 import aiohttp
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 ELEVATION_URL = "https://api.open-elevation.com/api/v1/lookup"
 IP_API = "http://ip-api.com/json"
 IPAPI = "https://ipapi.co/json/"
@@ -26,6 +31,8 @@ AXIS_B = 6356752.314245
 MILES_PER_KILOMETER = 0.621371
 MAX_ITERATIONS = 200
 CONVERGENCE_THRESHOLD = 1e-12
+# Fewer points are computed one at a time, even if NumPy is available
+MIN_NUMPY_POINTS = 32
 
 LocationInfo = collections.namedtuple(
     "LocationInfo",
@@ -77,6 +84,185 @@ def distance(
     return result * 1000
 
 
+def distances(
+    lat1: Optional[float],
+    lon1: Optional[float],
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+) -> List[Optional[float]]:
+    """Calculate the distances in meters from one point to many points.
+
+    Returns the same values as calling distance for each point. Uses NumPy
+    if it is installed.
+
+    Async friendly.
+    """
+    if lat1 is None or lon1 is None:
+        return [None] * len(latitudes)
+
+    if np is None or len(latitudes) < MIN_NUMPY_POINTS:
+        results = [
+            vincenty((lat1, lon1), (lat2, lon2))
+            for lat2, lon2 in zip(latitudes, longitudes)
+        ]
+    else:
+        results = _round_results(
+            _vincenty_numpy(
+                (lat1, lon1),
+                np.asarray(latitudes, dtype=float),
+                np.asarray(longitudes, dtype=float),
+            )
+        )
+
+    return [None if result is None else result * 1000 for result in results]
+
+
+def vincenty_many(
+    point1: Tuple[float, float],
+    points: Sequence[Tuple[float, float]],
+    miles: bool = False,
+) -> List[Optional[float]]:
+    """Vincenty formula from one point to many points.
+
+    Returns the same values as calling vincenty for each point. Uses NumPy
+    if it is installed.
+
+    Async friendly.
+    """
+    if np is None or len(points) < MIN_NUMPY_POINTS:
+        return [vincenty(point1, point2, miles) for point2 in points]
+
+    points_array = np.array(points, dtype=float).reshape(-1, 2)
+    distances_km = _vincenty_numpy(point1, points_array[:, 0], points_array[:, 1])
+
+    if miles:
+        distances_km *= MILES_PER_KILOMETER
+
+    return _round_results(distances_km)
+
+
+def _round_results(distances_km: "np.ndarray") -> List[Optional[float]]:
+    """Round results like vincenty does, NaN becomes None.
+
+    np.round is not correctly rounded, so Python's round is used.
+    """
+    return [
+        None if math.isnan(dist) else round(dist, 6) for dist in distances_km.tolist()
+    ]
+
+
+# pylint: disable=invalid-name
+def _vincenty_numpy(
+    point1: Tuple[float, float], lat2: "np.ndarray", lon2: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized vincenty in kilometers, NaN where it fails to converge.
+
+    Each point stops iterating when it converges, like vincenty does.
+    """
+    result = np.full(len(lat2), np.nan)
+
+    U1 = math.atan((1 - FLATTENING) * math.tan(math.radians(point1[0])))
+    sinU1 = math.sin(U1)
+    cosU1 = math.cos(U1)
+
+    coincident = (lat2 == point1[0]) & (lon2 == point1[1])
+    result[coincident] = 0.0
+    active = np.flatnonzero(~coincident)
+
+    U2 = np.arctan((1 - FLATTENING) * np.tan(np.radians(lat2[active])))
+    sinU2 = np.sin(U2)
+    cosU2 = np.cos(U2)
+    L = np.radians(lon2[active] - point1[1])
+    Lambda = L
+
+    # Values of the last iteration of each converged point
+    sinSigmas = []
+    cosSigmas = []
+    sigmas = []
+    cosSqAlphas = []
+    cos2SigmaMs = []
+    converged = []
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(MAX_ITERATIONS):
+            if not active.size:
+                break
+
+            sinLambda = np.sin(Lambda)
+            cosLambda = np.cos(Lambda)
+            sinSigma = np.sqrt(
+                (cosU2 * sinLambda) ** 2
+                + (cosU1 * sinU2 - sinU1 * cosU2 * cosLambda) ** 2
+            )
+            cosSigma = sinU1 * sinU2 + cosU1 * cosU2 * cosLambda
+            sigma = np.arctan2(sinSigma, cosSigma)
+            sinAlpha = cosU1 * cosU2 * sinLambda / sinSigma
+            cosSqAlpha = 1 - sinAlpha ** 2
+            cos2SigmaM = np.where(
+                cosSqAlpha == 0, 0.0, cosSigma - 2 * sinU1 * sinU2 / cosSqAlpha
+            )
+            C = FLATTENING / 16 * cosSqAlpha * (4 + FLATTENING * (4 - 3 * cosSqAlpha))
+            LambdaPrev = Lambda
+            Lambda = L + (1 - C) * FLATTENING * sinAlpha * (
+                sigma
+                + C
+                * sinSigma
+                * (cos2SigmaM + C * cosSigma * (-1 + 2 * cos2SigmaM ** 2))
+            )
+
+            # Coincident points
+            zero = sinSigma == 0.0
+            result[active[zero]] = 0.0
+            done = ~zero & (np.abs(Lambda - LambdaPrev) < CONVERGENCE_THRESHOLD)
+
+            converged.append(active[done])
+            sinSigmas.append(sinSigma[done])
+            cosSigmas.append(cosSigma[done])
+            sigmas.append(sigma[done])
+            cosSqAlphas.append(cosSqAlpha[done])
+            cos2SigmaMs.append(cos2SigmaM[done])
+
+            keep = ~(zero | done)
+            active = active[keep]
+            sinU2 = sinU2[keep]
+            cosU2 = cosU2[keep]
+            L = L[keep]
+            Lambda = Lambda[keep]
+
+    if not converged:
+        return result
+
+    sinSigma = np.concatenate(sinSigmas)
+    cosSigma = np.concatenate(cosSigmas)
+    sigma = np.concatenate(sigmas)
+    cosSqAlpha = np.concatenate(cosSqAlphas)
+    cos2SigmaM = np.concatenate(cos2SigmaMs)
+
+    uSq = cosSqAlpha * (AXIS_A ** 2 - AXIS_B ** 2) / (AXIS_B ** 2)
+    A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+    B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+    deltaSigma = (
+        B
+        * sinSigma
+        * (
+            cos2SigmaM
+            + B
+            / 4
+            * (
+                cosSigma * (-1 + 2 * cos2SigmaM ** 2)
+                - B
+                / 6
+                * cos2SigmaM
+                * (-3 + 4 * sinSigma ** 2)
+                * (-3 + 4 * cos2SigmaM ** 2)
+            )
+        )
+    )
+    result[np.concatenate(converged)] = AXIS_B * A * (sigma - deltaSigma) / 1000
+
+    return result
+
+
 # Author: https://github.com/maurycyp
 # Source: https://github.com/maurycyp/vincenty
 # License: https://github.com/maurycyp/vincenty/blob/master/LICENSE
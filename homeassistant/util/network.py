@@ -1,6 +1,15 @@
 """Network utilities."""
-from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
-from typing import Union
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
+from typing import Dict, Iterable, Set, Tuple, Union
+
+AddressOrNetwork = Union[str, IPv4Address, IPv6Address, IPv4Network, IPv6Network]
 
 # IP addresses of loopback interfaces
 LOCAL_IPS = (ip_address("127.0.0.1"), ip_address("::1"))
@@ -16,3 +25,44 @@ LOCAL_NETWORKS = (
 def is_local(address: Union[IPv4Address, IPv6Address]) -> bool:
     """Check if an address is local."""
     return address in LOCAL_IPS or any(address in network for network in LOCAL_NETWORKS)
+
+
+class NetworkSet:
+    """Set of IP addresses and networks.
+
+    Networks are stored as integers grouped by IP version and prefix length,
+    so looking up an address takes one set lookup per prefix length in use,
+    no matter how many networks the set holds.
+    """
+
+    def __init__(self, networks: Iterable[AddressOrNetwork] = ()) -> None:
+        """Initialize the set."""
+        # Maps (version, netmask) to the network addresses using that mask
+        self._networks: Dict[Tuple[int, int], Set[int]] = {}
+
+        for network in networks:
+            self.add(network)
+
+    def add(self, network: AddressOrNetwork) -> None:
+        """Add an address or network to the set."""
+        net = ip_network(network)
+        key = (net.version, int(net.netmask))
+        self._networks.setdefault(key, set()).add(int(net.network_address))
+
+    def __contains__(self, address: object) -> bool:
+        """Return if an address is in one of the networks of the set."""
+        if not isinstance(address, (IPv4Address, IPv6Address)):
+            return False
+
+        value = int(address)
+        version = address.version
+
+        return any(
+            value & netmask in networks
+            for (net_version, netmask), networks in self._networks.items()
+            if net_version == version
+        )
+
+    def __len__(self) -> int:
+        """Return the number of networks in the set."""
+        return sum(len(networks) for networks in self._networks.values())
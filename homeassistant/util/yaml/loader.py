@@ -1,13 +1,38 @@
 """Custom loader."""
+import base64
+from datetime import date, datetime
+import hashlib
+import json
 import logging
 import os
 import sys
 import fnmatch
+import tempfile
 from collections import OrderedDict
-from typing import Union, List, Dict, Iterator, overload, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader
+
+    HAS_CSAFE_LOADER = True
+except ImportError:
+    HAS_CSAFE_LOADER = False
+
 try:
     import keyring
 except ImportError:
@@ -19,6 +44,7 @@ except ImportError:
     credstash = None
 
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.util.dt as dt_util
 
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .objects import NodeListClass, NodeStrClass
@@ -32,6 +58,9 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+# Bump when the format of the cached node graphs changes
+CACHE_VERSION = 2
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -45,6 +74,11 @@ def clear_secret_cache() -> None:
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
+    # Directory to cache the parsed files included by the loaded file in
+    cache_dir: Optional[str] = None
+    # Cleared if the constructed data should not be cached
+    cacheable = True
+
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:
         """Annotate a node with the first line it was seen."""
         last_line: int = self.line
@@ -53,13 +87,33 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+class _DeferringLoader(SafeLineLoader):
+    """Loader class that leaves nodes with a local tag unconstructed."""
+
+    def construct_object(self, node: yaml.nodes.Node, deep: bool = False) -> Any:
+        """Construct an object unless the node has a local tag."""
+        if isinstance(node, yaml.ScalarNode) and node.tag.startswith("!"):
+            return node
+        return super().construct_object(node, deep)
+
+
+def load_yaml(fname: str, cache_dir: Optional[str] = None) -> JSON_TYPE:
+    """Load a YAML file.
+
+    If cache_dir is given, the parsed file and the files it includes are
+    cached in it and only parsed again once they change.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            if cache_dir is None or os.path.basename(fname) == SECRET_YAML:
+                data = _construct(
+                    _constructor(SafeLineLoader, fname, cache_dir), _compose(conf_file)
+                )
+            else:
+                data = _load_cached(fname, conf_file, cache_dir)
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return data or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -68,6 +122,242 @@ def load_yaml(fname: str) -> JSON_TYPE:
         raise HomeAssistantError(exc)
 
 
+def _constructor(
+    loader_class: Type[SafeLineLoader], fname: str, cache_dir: Optional[str]
+) -> SafeLineLoader:
+    """Return a loader to construct the node graph of a file with."""
+    loader = loader_class("")
+    loader.name = fname
+    loader.cache_dir = cache_dir
+    return loader
+
+
+def _compose(conf_file: TextIO) -> Optional[yaml.nodes.Node]:
+    """Parse a YAML stream into a node graph, with libyaml if available."""
+    if not HAS_CSAFE_LOADER:
+        return SafeLineLoader(conf_file).get_single_node()
+
+    parser = CSafeLoader(conf_file)
+    try:
+        return parser.get_single_node()  # type: ignore
+    finally:
+        parser.dispose()  # type: ignore
+
+
+def _construct(loader: SafeLineLoader, node: Optional[yaml.nodes.Node]) -> Any:
+    """Construct the data of a node graph."""
+    if node is None:
+        return None
+    return loader.construct_document(node)
+
+
+def _load_cached(fname: str, conf_file: TextIO, cache_dir: str) -> Any:
+    """Load the data of a YAML file from the cache or cache it.
+
+    The cache is keyed on path, modification time and size of the file.
+    Values with a local tag (includes, secrets and environment variables)
+    are stored as nodes and constructed again on every load, so a cached
+    file never contains secrets and picks up changes to included files.
+    The cache is stored as JSON, so loading it never runs code.
+    """
+    loader = _constructor(SafeLineLoader, fname, cache_dir)
+
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        return _construct(loader, _compose(conf_file))
+
+    path = os.path.abspath(fname)
+    key = [CACHE_VERSION, path, stat.st_mtime_ns, stat.st_size]
+    cache_path = os.path.join(cache_dir, hashlib.sha1(path.encode()).hexdigest())
+
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        if cached["key"] == key:
+            return _construct_deferred(
+                loader,
+                _decode(cached["data"]),
+                [tuple(_decode(path)) for path in cached["deferred"]],
+            )
+    except FileNotFoundError:
+        pass
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Ignoring invalid YAML cache file %s", cache_path)
+
+    node = _compose(conf_file)
+    deferring_loader = _constructor(_DeferringLoader, fname, cache_dir)
+    data = _construct(deferring_loader, node)
+    deferred = _find_deferred(data)
+
+    if deferred is None:
+        # A local tag was used as a mapping key
+        return _construct(loader, node)
+
+    if deferring_loader.cacheable:
+        try:
+            cached = {
+                "key": key,
+                "data": _encode(data),
+                "deferred": [_encode(path) for path in deferred],
+            }
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_dir, delete=False
+            ) as tmp_file:
+                json.dump(cached, tmp_file)
+            os.replace(tmp_file.name, cache_path)
+        except TypeError as err:
+            _LOGGER.debug("Not caching %s: %s", fname, err)
+        except OSError as err:
+            _LOGGER.warning("Unable to cache %s: %s", fname, err)
+
+    return _construct_deferred(loader, data, deferred)
+
+
+def _find_deferred(data: Any) -> Optional[List[Tuple]]:
+    """Return the paths to the nodes in data that are not yet constructed.
+
+    Strips the document buffer from the marks of these nodes, so they can
+    be cached. Returns None if a node is used as a mapping key.
+    """
+    paths = []
+    seen: Set[int] = set()
+    todo: List[Tuple[Tuple, Any]] = [((), data)]
+
+    while todo:
+        path, value = todo.pop()
+
+        if isinstance(value, yaml.ScalarNode):
+            mark = value.start_mark
+            value.start_mark = value.end_mark = yaml.Mark(
+                mark.name, mark.index, mark.line, mark.column, None, None
+            )
+            paths.append(path)
+            continue
+
+        if not isinstance(value, (dict, list)) or id(value) in seen:
+            continue
+
+        seen.add(id(value))
+
+        if isinstance(value, dict):
+            if any(isinstance(key, yaml.Node) for key in value):
+                return None
+            todo.extend((path + (key,), child) for key, child in value.items())
+        else:
+            todo.extend((path + (idx,), child) for idx, child in enumerate(value))
+
+    paths.reverse()
+    return paths
+
+
+def _encode(value: Any) -> Any:
+    """Encode constructed YAML data and nodes as JSON compatible data.
+
+    Strings, numbers, booleans and None are stored as they are, everything
+    else as a JSON object with a single type key. Raises TypeError for
+    values that can not be encoded.
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+
+    reference: Dict[str, Any] = {}
+
+    if hasattr(value, "__config_file__"):
+        reference = {"file": value.__config_file__, "line": value.__line__}
+
+    if isinstance(value, str):
+        return {"str": str(value), **reference}
+
+    if isinstance(value, dict):
+        return {
+            "dict": [[_encode(key), _encode(item)] for key, item in value.items()],
+            **reference,
+        }
+
+    if isinstance(value, list):
+        return {"list": [_encode(item) for item in value], **reference}
+
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(item) for item in value]}
+
+    if isinstance(value, (set, frozenset)):
+        return {"set": [_encode(item) for item in value]}
+
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+
+    if isinstance(value, bytes):
+        return {"bytes": base64.b64encode(value).decode()}
+
+    if isinstance(value, yaml.ScalarNode):
+        mark = value.start_mark
+        return {
+            "node": [
+                value.tag,
+                value.value,
+                value.style,
+                [mark.name, mark.index, mark.line, mark.column],
+            ]
+        }
+
+    raise TypeError(f"Unable to cache value of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Decode data encoded with _encode."""
+    if not isinstance(value, dict):
+        return value
+
+    obj: Any
+
+    if "str" in value:
+        obj = NodeStrClass(value["str"])
+    elif "dict" in value:
+        obj = OrderedDict((_decode(key), _decode(item)) for key, item in value["dict"])
+    elif "list" in value:
+        obj = NodeListClass(_decode(item) for item in value["list"])
+    elif "tuple" in value:
+        return tuple(_decode(item) for item in value["tuple"])
+    elif "set" in value:
+        return {_decode(item) for item in value["set"]}
+    elif "datetime" in value:
+        return dt_util.parse_datetime(value["datetime"])
+    elif "date" in value:
+        return dt_util.parse_date(value["date"])
+    elif "bytes" in value:
+        return base64.b64decode(value["bytes"])
+    else:
+        tag, node_value, style, (name, index, line, column) = value["node"]
+        mark = yaml.Mark(name, index, line, column, None, None)
+        return yaml.ScalarNode(tag, node_value, mark, mark, style)
+
+    if "file" in value:
+        obj.__config_file__ = value["file"]
+        obj.__line__ = value["line"]
+
+    return obj
+
+
+def _construct_deferred(loader: SafeLineLoader, data: Any, paths: List[Tuple]) -> Any:
+    """Construct the nodes in data at the given paths."""
+    for path in paths:
+        if not path:
+            return loader.construct_document(data)
+
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+
+        parent[path[-1]] = loader.construct_document(parent[path[-1]])
+
+    return data
+
+
 # pylint: disable=pointless-statement
 @overload
 def _add_reference(
@@ -115,7 +405,9 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname), loader, node)
+        return _add_reference(
+            load_yaml(fname, getattr(loader, "cache_dir", None)), loader, node
+        )
     except FileNotFoundError:
         raise HomeAssistantError(f"{node.start_mark}: Unable to read file {fname}.")
 
@@ -141,11 +433,12 @@ def _include_dir_named_yaml(
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    cache_dir = getattr(loader, "cache_dir", None)
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname)
+        mapping[filename] = load_yaml(fname, cache_dir)
     return _add_reference(mapping, loader, node)
 
 
@@ -155,10 +448,11 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    cache_dir = getattr(loader, "cache_dir", None)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname)
+        loaded_yaml = load_yaml(fname, cache_dir)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
@@ -169,8 +463,9 @@ def _include_dir_list_yaml(
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
+    cache_dir = getattr(loader, "cache_dir", None)
     return [
-        load_yaml(f)
+        load_yaml(f, cache_dir)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
@@ -182,10 +477,11 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
+    cache_dir = getattr(loader, "cache_dir", None)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname)
+        loaded_yaml = load_yaml(fname, cache_dir)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -203,14 +499,16 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
         try:
             hash(key)
         except TypeError:
-            fname = getattr(loader.stream, "name", "")
+            fname = getattr(loader, "name", "")
             raise yaml.MarkedYAMLError(
                 context=f'invalid key: "{key}"',
                 context_mark=yaml.Mark(fname, 0, line, -1, None, None),
             )
 
         if key in seen:
-            fname = getattr(loader.stream, "name", "")
+            # Log the error on every load
+            loader.cacheable = False
+            fname = getattr(loader, "name", "")
             _LOGGER.error(
                 'YAML file %s contains duplicate key "%s". ' "Check lines %d and %d.",
                 fname,
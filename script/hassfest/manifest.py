@@ -21,6 +21,7 @@ MANIFEST_SCHEMA = vol.Schema(
         vol.Required("requirements"): [str],
         vol.Required("dependencies"): [str],
         vol.Optional("after_dependencies"): [str],
+        vol.Optional("lazy_imports"): [str],
         vol.Required("codeowners"): [str],
     }
 )
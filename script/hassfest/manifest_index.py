@@ -0,0 +1,69 @@
+"""Generate manifest index file."""
+from collections import OrderedDict
+import json
+from typing import Dict
+
+from .model import Integration, Config
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+# Manifest keys the loader needs to resolve an integration. Config flows are
+# looked up in the generated config flows file.
+INDEX_KEYS = [
+    "name",
+    "dependencies",
+    "after_dependencies",
+    "requirements",
+    "lazy_imports",
+]
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    data = OrderedDict()
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        data[domain] = OrderedDict(
+            (key, integration.manifest[key])
+            for key in INDEX_KEYS
+            if key in integration.manifest
+        )
+
+    return BASE.format(json.dumps(data, indent=4))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    with open(str(index_path), "r") as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(index_path), "w") as fp:
+        fp.write(config.cache["manifest_index"] + "\n")
@@ -473,6 +473,71 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validate_access_token_cached(mock_hass):
+    """Test verified access tokens are cached until revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert not mock_decode.called
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validate_access_token_cache_deactivated_user(mock_hass):
+    """Test cached access tokens are rejected for deactivated users."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validate_access_token_cache_expired(mock_hass):
+    """Test cached access tokens expire."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    expired = dt_util.utcnow() + refresh_token.access_token_expiration * 2
+    with patch("homeassistant.auth.time.time", return_value=expired.timestamp()), patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+    assert mock_decode.called
+
+
+async def test_get_refresh_token_by_token(mock_hass):
+    """Test getting refresh tokens by id and token."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+
+    assert await manager.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await manager.async_get_refresh_token_by_token(refresh_token.token)
+        is refresh_token
+    )
+    assert await manager.async_get_refresh_token_by_token("invalid") is None
+
+    await manager.async_remove_user(user)
+    assert await manager.async_get_refresh_token(refresh_token.id) is None
+    assert await manager.async_get_refresh_token_by_token(refresh_token.token) is None
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -117,6 +117,10 @@ def get_test_home_assistant():
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
 
+    # Keep stores from writing to the test config directory
+    storage_mock = mock_storage()
+    storage_mock.__enter__()
+
     stop_event = threading.Event()
 
     def run_loop():
@@ -137,6 +141,7 @@ def get_test_home_assistant():
         orig_stop()
         stop_event.wait()
         loop.close()
+        storage_mock.__exit__(None, None, None)
 
     hass.start = start_hass
     hass.stop = stop_hass
@@ -357,7 +362,7 @@ def mock_component(hass, component):
 def mock_registry(hass, mock_entries=None):
     """Mock the Entity Registry."""
     registry = entity_registry.EntityRegistry(hass)
-    registry.entities = mock_entries or OrderedDict()
+    registry.entities = entity_registry.EntityRegistryItems(mock_entries)
 
     hass.data[entity_registry.DATA_REGISTRY] = registry
     return registry
@@ -375,7 +380,7 @@ def mock_area_registry(hass, mock_entries=None):
 def mock_device_registry(hass, mock_entries=None):
     """Mock the Device Registry."""
     registry = device_registry.DeviceRegistry(hass)
-    registry.devices = mock_entries or OrderedDict()
+    registry.devices = device_registry.DeviceRegistryItems(mock_entries)
 
     hass.data[device_registry.DATA_REGISTRY] = registry
     return registry
@@ -800,6 +805,7 @@ def init_recorder_component(hass, add_config=None):
     """Initialize the recorder."""
     config = dict(add_config) if add_config else {}
     config[recorder.CONF_DB_URL] = "sqlite://"  # In memory DB
+    config[recorder.CONF_COMMIT_INTERVAL] = 0
 
     with patch("homeassistant.components.recorder.migration.migrate_schema"):
         assert setup_component(hass, recorder.DOMAIN, {recorder.DOMAIN: config})
@@ -967,14 +973,23 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_append_data(store, path, changes):
+        """Mock version of append data."""
+        _LOGGER.info("Appending data to %s: %s", store.key, changes)
+        stored = data[store.key]["data"]
+        for item, value in json.loads(json.dumps(changes, cls=store._encoder)).items():
+            if value is None:
+                stored.pop(item, None)
+            else:
+                stored[item] = value
+
+    # Plain functions instead of autospecced mocks, so mocks can be nested
     with patch(
-        "homeassistant.helpers.storage.Store._async_load",
-        side_effect=mock_async_load,
-        autospec=True,
+        "homeassistant.helpers.storage.Store._async_load", new=mock_async_load
+    ), patch(
+        "homeassistant.helpers.storage.Store._write_data", new=mock_write_data
     ), patch(
-        "homeassistant.helpers.storage.Store._write_data",
-        side_effect=mock_write_data,
-        autospec=True,
+        "homeassistant.helpers.storage.LogStore._append_data", new=mock_append_data
     ):
         yield data
 
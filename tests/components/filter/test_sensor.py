@@ -3,7 +3,14 @@ from datetime import timedelta
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
+from homeassistant.components.filter import MAX_BACKFILL_PERIOD, MAX_BACKFILL_STATES
 from homeassistant.components.filter.sensor import (
+    EVENT_FILTER_BACKFILL,
+    create_filters,
+    filter_arrays,
     LowPassFilter,
     OutlierFilter,
     ThrottleFilter,
@@ -11,6 +18,7 @@ from homeassistant.components.filter.sensor import (
     RangeFilter,
     TimeThrottleFilter,
 )
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.setup import setup_component
 import homeassistant.core as ha
@@ -177,6 +185,194 @@ class TestFilterSensor(unittest.TestCase):
                 state = self.hass.states.get("sensor.test")
                 assert "18.0" == state.state
 
+    def test_backfill(self):
+        """Test filtering the states of a past period again."""
+        self.init_recorder()
+        config = {
+            "history": {},
+            "sensor": {
+                "platform": "filter",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "filters": [{"filter": "lowpass", "time_constant": 10}],
+            },
+        }
+        events = []
+        self.hass.bus.listen(EVENT_FILTER_BACKFILL, events.append)
+
+        with assert_setup_component(1, "sensor"):
+            assert setup_component(self.hass, "sensor", config)
+
+        self.hass.states.set("sensor.test_monitored", 10)
+        self.hass.block_till_done()
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value={"sensor.test_monitored": self.values},
+        ):
+            self.hass.services.call(
+                "filter",
+                "backfill",
+                {"start_time": self.values[0].last_updated},
+                blocking=True,
+            )
+            self.hass.block_till_done()
+
+        assert len(events) == 1
+        assert events[0].data["entity_id"] == "sensor.test"
+        states = events[0].data["states"]
+        assert [state["last_updated"] for state in states] == [
+            state.last_updated for state in self.values
+        ]
+        assert states[-1]["state"] == 18.05
+
+        # The live filters are not touched
+        assert "10.0" == self.hass.states.get("sensor.test").state
+
+    def test_backfill_non_numeric(self):
+        """Test states that are not numbers are left out of a backfill."""
+        self.init_recorder()
+        config = {
+            "history": {},
+            "sensor": {
+                "platform": "filter",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "filters": [{"filter": "lowpass", "time_constant": 10}],
+            },
+        }
+        events = []
+        self.hass.bus.listen(EVENT_FILTER_BACKFILL, events.append)
+
+        with assert_setup_component(1, "sensor"):
+            assert setup_component(self.hass, "sensor", config)
+
+        values = list(self.values)
+        values.insert(2, ha.State("sensor.test_monitored", "unknown"))
+        values.insert(4, ha.State("sensor.test_monitored", "not a number"))
+
+        for numpy in (np, None):
+            with patch(
+                "homeassistant.components.history.state_changes_during_period",
+                return_value={"sensor.test_monitored": values},
+            ), patch("homeassistant.components.filter.sensor.np", numpy):
+                self.hass.services.call(
+                    "filter",
+                    "backfill",
+                    {"start_time": self.values[0].last_updated},
+                    blocking=True,
+                )
+                self.hass.block_till_done()
+
+        assert len(events) == 2
+        assert events[0].data["states"] == events[1].data["states"]
+        states = events[0].data["states"]
+        assert [state["last_updated"] for state in states] == [
+            state.last_updated for state in self.values
+        ]
+        assert states[-1]["state"] == 18.05
+
+    def test_backfill_limits(self):
+        """Test backfills of long periods or many states are refused."""
+        self.init_recorder()
+        config = {
+            "history": {},
+            "sensor": {
+                "platform": "filter",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "filters": [{"filter": "lowpass", "time_constant": 10}],
+            },
+        }
+        events = []
+        self.hass.bus.listen(EVENT_FILTER_BACKFILL, events.append)
+
+        with assert_setup_component(1, "sensor"):
+            assert setup_component(self.hass, "sensor", config)
+
+        start_time = self.values[0].last_updated
+        with pytest.raises(HomeAssistantError):
+            self.hass.services.call(
+                "filter",
+                "backfill",
+                {
+                    "start_time": start_time,
+                    "end_time": start_time + MAX_BACKFILL_PERIOD + timedelta(seconds=1),
+                },
+                blocking=True,
+            )
+
+        many_values = [
+            ha.State(
+                "sensor.test_monitored",
+                idx,
+                last_updated=start_time + timedelta(seconds=idx),
+            )
+            for idx in range(MAX_BACKFILL_STATES + 1)
+        ]
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value={"sensor.test_monitored": many_values},
+        ):
+            self.hass.services.call(
+                "filter", "backfill", {"start_time": start_time}, blocking=True
+            )
+            self.hass.block_till_done()
+
+        assert events == []
+
+    def test_filter_arrays(self):
+        """Test filtering arrays gives the same results as single values."""
+        filter_configs = [
+            {"filter": "outlier", "window_size": 3, "radius": 4.0, "precision": 2},
+            {"filter": "lowpass", "window_size": 1, "time_constant": 4, "precision": 2},
+            {
+                "filter": "time_simple_moving_average",
+                "window_size": timedelta(minutes=2),
+                "type": "last",
+                "precision": 2,
+            },
+            {"filter": "throttle", "window_size": 2, "precision": 2},
+        ]
+        values = [float(state.state) for state in self.values]
+        timestamps = [
+            (state.last_updated - self.values[0].last_updated)
+            // timedelta(microseconds=1)
+            for state in self.values
+        ]
+
+        def filter_values(filters, values, timestamps):
+            """Filter values one by one."""
+            result = []
+            for value, timestamp in zip(values, timestamps):
+                for filt in filters:
+                    filtered = filt.filter_value(value, timestamp)
+                    if filt.skip_processing:
+                        break
+                    value = filtered
+                else:
+                    result.append(value)
+            return result
+
+        expected = filter_values(
+            create_filters(None, filter_configs), values, timestamps
+        )
+        assert len(expected) == 3
+
+        # Mix filtering arrays and single values
+        filters = create_filters(None, filter_configs)
+        result, _ = filter_arrays(
+            filters, np.array(values[:3]), np.array(timestamps[:3])
+        )
+        result = result.tolist()
+        result += filter_values(filters, values[3:4], timestamps[3:4])
+        filtered, _ = filter_arrays(
+            filters, np.array(values[4:]), np.array(timestamps[4:])
+        )
+        result += filtered.tolist()
+
+        assert result == expected
+
     def test_outlier(self):
         """Test if outlier filter works."""
         filt = OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0)
@@ -196,6 +196,52 @@ class TestComponentHistory(unittest.TestCase):
         )
         assert states == hist
 
+    def test_stream_significant_states(self):
+        """Test streaming yields the significant states per entity."""
+        zero, four, states = self.record_states()
+        one_and_half = zero + timedelta(seconds=1.5)
+
+        hist = history.get_significant_states(
+            self.hass, one_and_half, four, filters=history.Filters()
+        )
+        streamed = list(
+            history.stream_significant_states(
+                self.hass, one_and_half, four, filters=history.Filters()
+            )
+        )
+
+        # Entities with changes come first, then those with only a start state
+        entity_ids = [entity_states[0].entity_id for entity_states in streamed]
+        assert entity_ids[:3] == [
+            "media_player.test",
+            "script.can_cancel_this_one",
+            "thermostat.test",
+        ]
+        assert set(entity_ids[3:]) == {"media_player.test2", "thermostat.test2"}
+        assert {
+            entity_states[0].entity_id: entity_states for entity_states in streamed
+        } == hist
+
+    def test_states_to_columns(self):
+        """Test the columnar format leaves out repeated attributes."""
+        zero, four, states = self.record_states()
+
+        columns = history.states_to_columns(states["thermostat.test"])
+
+        assert columns["entity_id"] == "thermostat.test"
+        assert columns["states"] == ["20", "21", "21"]
+        assert columns["timestamps"] == [
+            state.last_updated.timestamp() for state in states["thermostat.test"]
+        ]
+        assert columns["attributes"] == [
+            {"current_temperature": 19.5},
+            {"current_temperature": 19.8},
+            {"current_temperature": 20},
+        ]
+
+        columns = history.states_to_columns(states["media_player.test2"] * 2)
+        assert columns["attributes"] == [{"media_title": str(sentinel.mt2)}, None]
+
     def test_get_significant_states_with_initial(self):
         """Test that only significant states are returned.
 
@@ -650,3 +696,39 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_stream_columnar(hass, hass_client):
+    """Test the fetch period view streams the columnar format."""
+    await hass.async_add_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off", {"brightness": 100})
+    hass.states.async_set("light.living_room", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    response = await client.get(
+        "/api/history/period/{}".format(start.isoformat()),
+        params={"stream": "", "format": "columnar", "skip_initial_state": ""},
+    )
+    assert response.status == 200
+    result = await response.json()
+
+    assert [item["entity_id"] for item in result] == [
+        "light.kitchen",
+        "light.living_room",
+    ]
+    assert result[0]["states"] == ["on", "off"]
+    assert result[0]["attributes"] == [{"brightness": 100}, None]
+    assert len(result[0]["timestamps"]) == 2
+
+    response = await client.get(
+        "/api/history/period/{}".format(dt_util.utcnow().isoformat()),
+        params={"stream": "", "skip_initial_state": ""},
+    )
+    assert response.status == 200
+    assert await response.json() == []
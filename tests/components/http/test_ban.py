@@ -14,6 +14,7 @@ import homeassistant.components.http as http
 from homeassistant.components.http.ban import (
     IpBan,
     IP_BANS_FILE,
+    async_load_ip_bans_config,
     setup_bans,
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
@@ -45,6 +46,47 @@ async def test_access_from_banned_ip(hass, aiohttp_client):
         assert resp.status == 403
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from a banned network."""
+    app = web.Application()
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=mock_coro([IpBan("198.51.100.0/24"), IpBan("2001:db8::/32")]),
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ("198.51.100.7", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 403
+
+    for remote_addr in ("198.51.101.7", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 404
+
+
+async def test_load_ip_bans_with_host_bits(hass):
+    """Test networks with host bits set are loaded and invalid entries skipped."""
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "10.0.0.1/24": {"banned_at": "2019-01-01T00:00:00"},
+            "not an ip": {"banned_at": "2019-01-01T00:00:00"},
+            "100.64.0.2": {"banned_at": "2019-01-01T00:00:00"},
+        },
+    ):
+        ip_bans = await async_load_ip_bans_config(hass, "ip_bans.yaml")
+
+    assert [str(ip_ban.ip_address) for ip_ban in ip_bans] == [
+        "10.0.0.0/24",
+        "100.64.0.2",
+    ]
+
+
 async def test_ban_middleware_not_loaded_by_config(hass):
     """Test accessing to server from banned IP when feature is off."""
     with patch("homeassistant.components.http.setup_bans") as mock_setup:
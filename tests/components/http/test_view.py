@@ -1,5 +1,8 @@
 """Tests for Home Assistant View."""
-from unittest.mock import Mock
+import asyncio
+import json
+import threading
+from unittest.mock import Mock, patch
 
 from aiohttp.web_exceptions import (
     HTTPInternalServerError,
@@ -10,6 +13,8 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.components.http.view import (
+    STREAM_CHUNK_SIZE,
+    STREAM_QUEUE_SIZE,
     HomeAssistantView,
     request_handler_factory,
 )
@@ -57,3 +62,103 @@ async def test_handling_service_not_found(mock_request):
             Mock(requires_auth=False),
             mock_coro_func(exception=ServiceNotFound("test", "test")),
         )(mock_request)
+
+
+class MockStreamResponse:
+    """Mock a stream response that writes when the client reads."""
+
+    def __init__(self, headers=None):
+        """Initialize the response."""
+        self.headers = headers
+        self.written = []
+        self.reading = asyncio.Event()
+        self.reading.set()
+        self.eof = False
+
+    def enable_compression(self):
+        """Enable compression."""
+
+    async def prepare(self, request):
+        """Send the headers."""
+
+    async def write(self, data):
+        """Write data once the client reads."""
+        await self.reading.wait()
+        self.written.append(data)
+
+    async def write_eof(self):
+        """End the response."""
+        self.eof = True
+
+
+@pytest.fixture
+def stream_response():
+    """Patch the stream response of views."""
+    response = MockStreamResponse()
+    with patch(
+        "homeassistant.components.http.view.web.StreamResponse", return_value=response,
+    ):
+        yield response
+
+
+async def test_json_stream(hass, stream_response):
+    """Test streaming items as a JSON array."""
+    request = Mock(app={"hass": hass})
+
+    await HomeAssistantView().json_stream(request, lambda: iter(range(3)))
+
+    assert json.loads(b"".join(stream_response.written)) == [0, 1, 2]
+    assert stream_response.eof
+
+
+async def test_json_stream_slow_reader(hass, stream_response):
+    """Test items are produced no faster than a slow client reads them."""
+    request = Mock(app={"hass": hass})
+    item = "x" * (STREAM_CHUNK_SIZE - 2)
+    produced = []
+    closed = threading.Event()
+
+    def items():
+        """Yield items until the stream is stopped."""
+        try:
+            for _ in range(1000):
+                produced.append(item)
+                yield item
+        finally:
+            closed.set()
+
+    stream_response.reading.clear()
+    task = hass.async_create_task(HomeAssistantView().json_stream(request, items))
+    await asyncio.sleep(0.2)
+
+    # The chunk being written, the queued chunks and the one waiting to be put
+    assert len(produced) <= STREAM_QUEUE_SIZE + 2
+
+    # The client goes away
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert await hass.async_add_executor_job(closed.wait, 5)
+    assert len(produced) <= STREAM_QUEUE_SIZE + 3
+    assert stream_response.written == []
+
+
+async def test_json_stream_error(hass, stream_response, caplog):
+    """Test an error while streaming closes the connection."""
+    request = Mock(app={"hass": hass}, path="/api/test")
+
+    item = "x" * STREAM_CHUNK_SIZE
+
+    def items():
+        """Yield a chunk and fail."""
+        yield item
+        yield 1
+        raise ValueError("Boom")
+
+    await HomeAssistantView().json_stream(request, items)
+
+    assert stream_response.written == [f'["{item}"'.encode()]
+    assert not stream_response.eof
+    assert request.protocol.force_close.called
+    assert "Error streaming response to /api/test" in caplog.text
@@ -123,6 +123,85 @@ class TestComponentLogbook(unittest.TestCase):
 
         assert 0 == len(calls)
 
+    def test_get_events_filters_in_database(self):
+        """Test state changes are filtered by the database query."""
+        config = logbook.CONFIG_SCHEMA(
+            {
+                ha.DOMAIN: {},
+                logbook.DOMAIN: {
+                    logbook.CONF_EXCLUDE: {logbook.CONF_ENTITIES: ["switch.excluded"]}
+                },
+            }
+        )
+        self.hass.states.set("switch.test", STATE_OFF)
+        self.hass.states.set("switch.excluded", STATE_OFF)
+        self.hass.states.set("sensor.temperature", "10")
+        self.hass.block_till_done()
+
+        self.hass.states.set("switch.test", STATE_ON)
+        self.hass.states.set("switch.test", STATE_ON, {"changed": True})
+        self.hass.states.set("switch.excluded", STATE_ON)
+        self.hass.states.set("sensor.temperature", "20", {"unit_of_measurement": "C"})
+        self.hass.states.set("switch.hidden", STATE_OFF, {ATTR_HIDDEN: True})
+        self.hass.states.set("switch.hidden", STATE_ON, {ATTR_HIDDEN: True})
+        self.hass.states.remove("switch.test")
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+
+        entries = list(
+            logbook._get_events(
+                self.hass,
+                config[logbook.DOMAIN],
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+            )
+        )
+        entries = [entry for entry in entries if entry.get("entity_id")]
+        assert [entry["entity_id"] for entry in entries] == ["switch.test"]
+        assert entries[0]["message"] == "turned on"
+
+        entries = list(
+            logbook._get_events(
+                self.hass,
+                config[logbook.DOMAIN],
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+                "switch.excluded",
+            )
+        )
+        assert [entry for entry in entries if entry.get("entity_id")] == []
+
+    def test_get_events_filters_sensor_units(self):
+        """Test only continuous sensors with a top level unit are filtered."""
+        config = logbook.CONFIG_SCHEMA({ha.DOMAIN: {}, logbook.DOMAIN: {}})
+        self.hass.states.set("sensor.nested", "1")
+        self.hass.states.set("sensor.text", "1")
+        self.hass.states.set("sensor.power", "1", {"unit_of_measurement": "W"})
+        self.hass.states.set("switch.attributes", STATE_OFF)
+        self.hass.block_till_done()
+
+        self.hass.states.set(
+            "sensor.nested", "2", {"details": {"unit_of_measurement": "W"}}
+        )
+        self.hass.states.set("sensor.text", "2", {"note": '"unit_of_measurement": "W"'})
+        self.hass.states.set("sensor.power", "2", {"unit_of_measurement": "W"})
+        self.hass.states.set("switch.attributes", STATE_OFF, {"changed": True})
+        self.hass.states.set("switch.attributes", STATE_OFF, {"changed": False})
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+
+        entries = list(
+            logbook._get_events(
+                self.hass,
+                config[logbook.DOMAIN],
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+            )
+        )
+        assert sorted(
+            entry["entity_id"] for entry in entries if entry.get("entity_id")
+        ) == ["sensor.nested", "sensor.text"]
+
     def test_humanify_filter_sensor(self):
         """Test humanify filter too frequent sensor values."""
         entity_id = "sensor.bla"
@@ -0,0 +1,71 @@
+"""The tests for the MQTT topic matcher."""
+import pytest
+
+from homeassistant.components.mqtt.matcher import TopicMatcher
+
+
+def test_match_exact_and_wildcards():
+    """Test matching exact, single level and multi level filters."""
+    matcher = TopicMatcher()
+    matcher.add("home/kitchen/temperature", "exact")
+    matcher.add("home/+/temperature", "single")
+    matcher.add("home/#", "multi")
+    matcher.add("#", "all")
+    matcher.add("office/+", "other")
+
+    assert matcher.match("home/kitchen/temperature") == [
+        "exact",
+        "single",
+        "multi",
+        "all",
+    ]
+    assert matcher.match("home/kitchen/humidity") == ["multi", "all"]
+    assert matcher.match("home") == ["multi", "all"]
+    assert matcher.match("office/desk") == ["all", "other"]
+    assert matcher.match("office/desk/lamp") == ["all"]
+    assert len(matcher) == 5
+
+
+def test_match_sys_topics():
+    """Test wildcards at the first level do not match $ topics."""
+    matcher = TopicMatcher()
+    matcher.add("#", "all")
+    matcher.add("+/broker/load", "single")
+    matcher.add("$SYS/#", "sys")
+
+    assert matcher.match("$SYS/broker/load") == ["sys"]
+    assert matcher.match("home/broker/load") == ["all", "single"]
+
+
+def test_match_keeps_registration_order():
+    """Test matches are returned in the order they were added."""
+    matcher = TopicMatcher()
+    matcher.add("a/#", 1)
+    matcher.add("a/b", 2)
+    matcher.add("+/b", 3)
+    matcher.add("a/b", 4)
+
+    assert matcher.match("a/b") == [1, 2, 3, 4]
+
+
+def test_remove():
+    """Test removing values and pruning the trie."""
+    matcher = TopicMatcher()
+    first = object()
+    second = object()
+    matcher.add("a/b/c", first)
+    matcher.add("a/b/c", second)
+
+    matcher.remove("a/b/c", first)
+    assert matcher.has_filter("a/b/c")
+    assert matcher.match("a/b/c") == [second]
+
+    matcher.remove("a/b/c", second)
+    assert not matcher.has_filter("a/b/c")
+    assert matcher.match("a/b/c") == []
+    assert len(matcher) == 0
+
+    with pytest.raises(KeyError):
+        matcher.remove("a/b/c", second)
+    with pytest.raises(KeyError):
+        matcher.remove("x/y", first)
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import exc
 
 from homeassistant.core import callback
 from homeassistant.const import MATCH_ALL
@@ -48,6 +49,64 @@ class TestRecorder(unittest.TestCase):
 
         assert state == self.hass.states.get(entity_id)
 
+    def test_saving_batch(self):
+        """Test events queued together are saved in one batch."""
+        instance = self.hass.data[DATA_INSTANCE]
+        self.hass.block_till_done()
+        instance.block_till_done()
+
+        with patch.object(instance, "commit_interval", 60):
+            for idx in range(5):
+                self.hass.states.set("test.recorder", idx)
+            self.hass.block_till_done()
+            # A queued purge ends the batch before the commit interval passes
+            instance.do_adhoc_purge()
+            instance.block_till_done()
+
+        assert instance.last_batch_size == 5
+
+        with session_scope(hass=self.hass) as session:
+            db_states = list(session.query(States))
+            assert len(db_states) == 5
+            assert all(db_state.event_id > 0 for db_state in db_states)
+
+    def test_saving_batch_with_bad_event(self):
+        """Test a failing event only drops itself from a batch."""
+        instance = self.hass.data[DATA_INSTANCE]
+        self.hass.block_till_done()
+        instance.block_till_done()
+        add_batch = Recorder._add_batch
+
+        def mock_add_batch(session, batch):
+            """Fail for the batches containing the bad state."""
+            add_batch(session, batch)
+            if any(event.data.get("entity_id") == "test.bad" for event in batch):
+                raise exc.IntegrityError("INSERT", {}, Exception("bad"))
+
+        with patch.object(instance, "commit_interval", 60), patch.object(
+            Recorder, "_add_batch", staticmethod(mock_add_batch)
+        ), patch("homeassistant.components.recorder._LOGGER") as mock_logger:
+            for idx in range(5):
+                self.hass.states.set("test.recorder", idx)
+                if idx == 2:
+                    self.hass.states.set("test.bad", idx)
+            self.hass.block_till_done()
+            instance.do_adhoc_purge()
+            instance.block_till_done()
+
+        assert instance.last_batch_size == 6
+        assert mock_logger.exception.call_count == 1
+        assert mock_logger.exception.call_args[0][1].data["entity_id"] == "test.bad"
+
+        with session_scope(hass=self.hass) as session:
+            assert [db_state.state for db_state in session.query(States)] == [
+                "0",
+                "1",
+                "2",
+                "3",
+                "4",
+            ]
+
     def test_saving_event(self):
         """Test saving and restoring an event."""
         event_type = "EVENT_TEST"
@@ -198,7 +257,14 @@ def test_recorder_setup_failure():
     ):
         setup.side_effect = ImportError("driver not found")
         rec = Recorder(
-            hass, keep_days=7, purge_interval=2, uri="sqlite://", include={}, exclude={}
+            hass,
+            keep_days=7,
+            purge_interval=2,
+            commit_interval=1,
+            retention={"domains": {}, "entities": {}},
+            uri="sqlite://",
+            include={},
+            exclude={},
         )
         rec.start()
         rec.join()
@@ -222,3 +288,5 @@ async def test_defaults_set(hass):
     assert recorder_config is not None
     assert recorder_config["purge_keep_days"] == 10
     assert recorder_config["purge_interval"] == 1
+    assert recorder_config["commit_interval"] == 1
+    assert recorder_config["retention"] == {"domains": {}, "entities": {}}
@@ -120,6 +120,63 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 events left
             assert events.count() == 2
 
+    def test_purge_old_data_in_batches(self):
+        """Test purging stops after a batch and resumes on the next call."""
+        self._add_test_states()
+        self._add_test_events()
+        instance = self.hass.data[DATA_INSTANCE]
+
+        with session_scope(hass=self.hass) as session, patch(
+            "homeassistant.components.recorder.purge.PURGE_BATCH_SIZE", 1
+        ):
+            states = session.query(States)
+            events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+
+            assert not purge_old_data(instance, 4, repack=False)
+            assert states.count() == 5
+            assert events.count() == 6
+
+            unfinished = 1
+            while not purge_old_data(instance, 4, repack=False):
+                unfinished += 1
+
+            # 4 states and 4 events are purged one per call
+            assert unfinished == 8
+            assert states.count() == 2
+            assert events.count() == 2
+
+    def test_purge_retention(self):
+        """Test purging states of entities with a shorter retention."""
+        self._add_test_states()
+        instance = self.hass.data[DATA_INSTANCE]
+
+        with session_scope(hass=self.hass) as session:
+            session.add(
+                States(
+                    entity_id="sensor.keep",
+                    domain="sensor",
+                    state="keepme",
+                    attributes="{}",
+                    last_changed=datetime.now() - timedelta(days=5),
+                    last_updated=datetime.now() - timedelta(days=5),
+                    created=datetime.now() - timedelta(days=5),
+                )
+            )
+
+        with session_scope(hass=self.hass) as session, patch.object(
+            instance,
+            "retention",
+            {"domains": {"sensor": 1}, "entities": {"sensor.keep": 6}},
+        ):
+            states = session.query(States)
+            assert states.count() == 7
+
+            assert purge_old_data(instance, 10, repack=False)
+
+            # recorder2 is kept for one day, sensor.keep for six days
+            assert states.filter(States.domain == "sensor").count() == 3
+            assert states.filter(States.entity_id == "sensor.keep").count() == 1
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
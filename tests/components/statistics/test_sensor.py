@@ -5,7 +5,10 @@ import statistics
 import pytest
 
 from homeassistant.setup import setup_component
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, TEMP_CELSIUS, STATE_UNKNOWN
 from homeassistant.util import dt as dt_util
 from tests.common import get_test_home_assistant
@@ -363,3 +366,24 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_rolling_statistics():
+    """Test the rolling statistics match the statistics module."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 0.1, 0.2, 0.3, 1e10, 6]
+    stats = RollingStatistics()
+    window = []
+
+    for value in values:
+        stats.add(value)
+        window.append(value)
+
+        if len(window) > 5:
+            stats.remove(window.pop(0))
+
+        assert stats.mean == statistics.mean(window)
+        assert stats.median == statistics.median(window)
+        assert stats.sorted_values == sorted(window)
+
+        if len(window) > 1:
+            assert stats.variance == pytest.approx(statistics.variance(window))
@@ -1,4 +1,7 @@
 """Tests for WebSocket API commands."""
+import json
+from unittest.mock import Mock
+
 from async_timeout import timeout
 
 from homeassistant.core import callback
@@ -8,11 +11,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, subscriptions
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
 
-from tests.common import async_mock_service
+from tests.common import MockUser, async_mock_service
 
 
 async def test_call_service(hass, websocket_client):
@@ -237,6 +240,18 @@ async def test_get_config(hass, websocket_client):
     assert msg["result"] == hass.config.as_dict()
 
 
+async def test_get_setup_timings(hass, websocket_client):
+    """Test get_setup_timings command."""
+    await websocket_client.send_json({"id": 5, "type": "get_setup_timings"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert "setup" in msg["result"]["setups"]["websocket_api"]["phases"]
+    assert msg["result"]["setups"]["websocket_api"]["dependencies"] == ["http"]
+
+
 async def test_ping(websocket_client):
     """Test get_panels command."""
     await websocket_client.send_json({"id": 5, "type": "ping"})
@@ -387,6 +402,88 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_events_state_changed_shared(hass, websocket_client):
+    """Test state_changed subscriptions share one listener and encoded states."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for iden in (5, 6):
+        await websocket_client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "state_changed"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "off")
+
+    received = []
+    for _ in range(4):
+        with timeout(3):
+            msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+        received.append((msg["id"], msg["event"]))
+
+    assert [iden for iden, _ in received] == [5, 6, 5, 6]
+    assert received[0][1] == received[1][1]
+    assert received[2][1] == received[3][1]
+
+    first, second = received[0][1], received[2][1]
+    assert first["event_type"] == "state_changed"
+    assert first["data"]["entity_id"] == "light.kitchen"
+    assert first["data"]["old_state"] is None
+    assert first["data"]["new_state"]["attributes"] == {"brightness": 100}
+    assert second["data"]["old_state"] == first["data"]["new_state"]
+    assert second["data"]["new_state"]["state"] == "off"
+
+    for iden, subscription in ((7, 5), (8, 6)):
+        await websocket_client.send_json(
+            {"id": iden, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_subscribe_events_state_changed_json(hass):
+    """Test encoded state_changed events match the event as a dict."""
+    connection = Mock(user=MockUser(is_owner=True))
+    remove = subscriptions.async_subscribe_events(hass, connection, 5, "state_changed")
+
+    hass.states.async_set("light.kitchen", "on", {"data": None})
+    hass.states.async_set("light.kitchen", "off", {"data": None})
+    await hass.async_block_till_done()
+    remove()
+
+    assert connection.send_message.call_count == 2
+    for call in connection.send_message.call_args_list:
+        msg = json.loads(call[0][0])
+        event = msg["event"]
+        assert event["data"]["new_state"]["attributes"] == {"data": None}
+        assert set(event) == {"event_type", "data", "origin", "time_fired", "context"}
+
+
+async def test_subscribe_events_remove_twice(hass):
+    """Test removing a subscription twice keeps a newer forwarder."""
+    init_count = sum(hass.bus.async_listeners().values())
+    connection = Mock(user=MockUser(is_owner=True))
+
+    remove = subscriptions.async_subscribe_events(hass, connection, 5, "test_event")
+    remove()
+    subscriptions.async_subscribe_events(hass, connection, 6, "test_event")
+    forwarder = hass.data[const.DATA_EVENT_FORWARDERS]["test_event"]
+    remove()
+
+    assert hass.data[const.DATA_EVENT_FORWARDERS]["test_event"] is forwarder
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert connection.send_message.call_count == 1
+
+
 async def test_render_template_renders_template(
     hass, websocket_client, hass_admin_user
 ):
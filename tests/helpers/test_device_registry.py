@@ -170,6 +170,26 @@ async def test_loading_from_storage(hass, hass_storage):
     assert isinstance(entry.config_entries, set)
 
 
+async def test_shared_identifier(registry):
+    """Test devices sharing an identifier are found after one is removed."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123", identifiers={("bridgeid", "0123")}
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123", identifiers={("bridgeid", "4567")}
+    )
+    registry.async_update_device(
+        entry2.id, new_identifiers={("bridgeid", "4567"), ("bridgeid", "0123")}
+    )
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()).id == entry.id
+    assert registry.async_get_device({("bridgeid", "4567")}, set()).id == entry2.id
+
+    registry.async_remove_device(entry.id)
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()).id == entry2.id
+
+
 async def test_removing_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
     entry = registry.async_get_or_create(
@@ -408,6 +428,15 @@ async def test_update(registry):
     assert updated_entry.identifiers == new_identifiers
     assert updated_entry.via_device_id == "98765B"
 
+    assert registry.async_get_device({("hue", "456")}, set()) is None
+    assert registry.async_get_device({("hue", "654")}, set()) == updated_entry
+    assert (
+        registry.async_get_device(
+            set(), {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")}
+        )
+        == updated_entry
+    )
+
 
 async def test_update_remove_config_entries(hass, registry, update_events):
     """Make sure we do not get duplicate entries."""
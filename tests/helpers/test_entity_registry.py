@@ -349,6 +349,8 @@ async def test_update_entity_unique_id(registry):
     assert updated_entry != entry
     assert updated_entry.unique_id == new_unique_id
     assert mock_schedule_save.call_count == 1
+    assert registry.async_get_entity_id("light", "hue", "5678") is None
+    assert registry.async_get_entity_id("light", "hue", "1234") == entry.entity_id
 
 
 async def test_update_entity_unique_id_conflict(registry):
@@ -418,3 +420,25 @@ async def test_disabled_by_system_options(registry):
         "light", "hue", "BBBB", config_entry=mock_config, disabled_by="user"
     )
     assert entry2.disabled_by == "user"
+
+
+async def test_indexes_follow_updates(registry):
+    """Test lookups stay consistent when entries change."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-1"
+    )
+    registry.async_get_or_create("light", "hue", "1234", device_id="device-2")
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry]
+
+    updated = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed"
+    )
+    assert registry.async_get_entity_id("light", "hue", "5678") == "light.renamed"
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [updated]
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert registry.async_get_entity_id("light", "hue", "5678") is None
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert len(entity_registry.async_entries_for_device(registry, "device-2")) == 1
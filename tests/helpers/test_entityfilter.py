@@ -1,5 +1,10 @@
 """The tests for the EntityFilter component."""
-from homeassistant.helpers.entityfilter import generate_filter, FILTER_SCHEMA
+from homeassistant.helpers.entityfilter import (
+    FILTER_SCHEMA,
+    SHARED_FILTERS,
+    _get_filter,
+    generate_filter,
+)
 
 
 def test_no_filters_case_1():
@@ -105,3 +110,71 @@ def test_filter_schema():
     }
     filt = FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_schema_with_globs():
+    """Test filter schema with entity globs."""
+    conf = {
+        "include_domains": ["light"],
+        "include_entity_globs": ["sensor.kitchen_*"],
+        "exclude_entities": ["light.kitchen"],
+        "exclude_entity_globs": ["light.*_nightlight"],
+    }
+    filt = FILTER_SCHEMA(conf)
+
+    assert filt("light.hallway")
+    assert filt("light.kitchen") is False
+    assert filt("light.bedroom_nightlight") is False
+    assert filt("sensor.kitchen_temperature")
+    assert filt("sensor.hallway_temperature") is False
+
+
+def test_include_globs_only():
+    """Test only entities matching an include glob pass."""
+    testfilter = generate_filter([], [], [], [], ["*.kitchen_*", "switch.?ed"])
+
+    assert testfilter("light.kitchen_ceiling")
+    assert testfilter("switch.bed")
+    assert testfilter("switch.bedroom") is False
+    assert testfilter("light.hallway") is False
+
+
+def test_exclude_globs_with_included_entity():
+    """Test included entities pass an excluded glob (case 4b)."""
+    testfilter = generate_filter(
+        [], ["sensor.weather_temperature"], [], [], None, ["sensor.weather_*"]
+    )
+
+    assert testfilter("sensor.weather_temperature")
+    assert testfilter("sensor.weather_humidity") is False
+    assert testfilter("sensor.temperature")
+
+
+def test_filters_are_shared():
+    """Test filters with the same rules are shared."""
+    testfilter = generate_filter(["light"], ["switch.kitchen"], [], [])
+
+    assert testfilter is generate_filter({"light"}, ("switch.kitchen",), (), ())
+    assert testfilter is not generate_filter(["light"], [], [], [])
+
+
+def test_filter_schema_configs_are_not_shared():
+    """Test filters from equal configs each keep their own config."""
+    first = FILTER_SCHEMA({"include_domains": ["light"]})
+    second = FILTER_SCHEMA({"include_domains": ["light", "light"]})
+    empty = FILTER_SCHEMA({})
+
+    assert first("light.kitchen") and second("light.kitchen")
+    assert first.config["include_domains"] == ["light"]
+    assert second.config["include_domains"] == ["light", "light"]
+    assert not first.empty_filter
+    assert empty.empty_filter
+    assert empty("light.kitchen")
+
+
+def test_shared_filters_are_bounded():
+    """Test only a bounded number of distinct filters is kept."""
+    for idx in range(SHARED_FILTERS + 10):
+        generate_filter([f"domain_{idx}"], [], [], [])
+
+    assert _get_filter.cache_info().currsize == SHARED_FILTERS
@@ -10,9 +10,11 @@ import pytest
 from homeassistant.core import callback
 from homeassistant.setup import async_setup_component
 import homeassistant.core as ha
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
 from homeassistant.helpers.event import (
     async_call_later,
+    async_get_state_change_dispatcher,
+    async_get_time_scheduler,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -20,10 +22,12 @@ from homeassistant.helpers.event import (
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
+    async_track_template_result,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
 )
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.template import Template
 from homeassistant.components import sun
 import homeassistant.util.dt as dt_util
@@ -233,6 +237,132 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_result(hass):
+    """Test tracking the entities a template render accessed."""
+    runs = []
+    template = Template(
+        "{% if is_state('input_boolean.use_b', 'on') %}"
+        "{{ states('sensor.b') }}{% else %}{{ states('sensor.a') }}{% endif %}",
+        hass,
+    )
+
+    @callback
+    def result_callback(event, last_result, result):
+        runs.append((event.data["entity_id"], last_result, result))
+
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("sensor.b", "2")
+    unsub = async_track_template_result(hass, template, result_callback)
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("sensor.b", "3")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("sensor.a", "4")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.a", "1", "4")]
+
+    hass.states.async_set("input_boolean.use_b", "on")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("input_boolean.use_b", "4", "3")
+
+    # The first branch is no longer rendered
+    hass.states.async_set("sensor.a", "5")
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    hass.states.async_set("sensor.b", "6")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("sensor.b", "3", "6")
+
+    unsub()
+    assert len(async_get_state_change_dispatcher(hass)) == 0
+
+    hass.states.async_set("sensor.b", "7")
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+
+async def test_track_template_result_domain(hass):
+    """Test domains only re-render when entities are added or removed."""
+    runs = []
+    template = Template("{{ states.light | count }}", hass)
+
+    @callback
+    def result_callback(event, last_result, result):
+        runs.append(result)
+
+    hass.states.async_set("light.one", "on")
+    async_track_template_result(hass, template, result_callback)
+
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("switch.one", "off")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert runs == ["2"]
+
+    hass.states.async_remove("light.one")
+    await hass.async_block_till_done()
+    assert runs == ["2", "1"]
+
+
+async def test_track_template_result_all_states_rate_limit(hass):
+    """Test templates iterating over all states are rate limited."""
+    runs = []
+    template = Template("{{ states | count }}", hass)
+
+    @callback
+    def result_callback(event, last_result, result):
+        runs.append((event.data["entity_id"], result))
+
+    async_track_template_result(
+        hass, template, result_callback, rate_limit=timedelta(seconds=10)
+    )
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.one", "1")]
+
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("sensor.three", "3")
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert runs == [("sensor.one", "1"), ("sensor.three", "3")]
+
+
+async def test_track_template_result_error(hass):
+    """Test tracking a template that fails to render."""
+    runs = []
+    template = Template(
+        "{% if is_state('sensor.test', 'on') %}"
+        "{{ states.sensor.test.attributes.missing.value }}{% else %}ok{% endif %}",
+        hass,
+    )
+
+    @callback
+    def result_callback(event, last_result, result):
+        runs.append(result)
+
+    hass.states.async_set("sensor.test", "off")
+    async_track_template_result(hass, template, result_callback)
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+    assert isinstance(runs[-1], TemplateError)
+
+    hass.states.async_set("sensor.test", "off")
+    await hass.async_block_till_done()
+    assert runs[-1] == "ok"
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -835,3 +965,131 @@ async def test_async_call_later(hass):
     assert p_action is action
     assert p_point == now + timedelta(seconds=3)
     assert remove is mock()
+
+
+async def test_time_scheduler_single_listener(hass):
+    """Test scheduled jobs share one time listener and only due jobs run."""
+    runs = []
+    start = dt_util.utcnow() + timedelta(hours=1)
+
+    unsubs = [
+        async_track_point_in_utc_time(
+            hass, lambda now, idx=idx: runs.append(idx), start + timedelta(seconds=idx)
+        )
+        for idx in range(100)
+    ]
+
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == 1
+    assert len(async_get_time_scheduler(hass)) == 100
+
+    unsubs[3]()
+
+    _send_time_changed(hass, start + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 4]
+    assert len(async_get_time_scheduler(hass)) == 95
+
+    for unsub in unsubs:
+        unsub()
+
+    assert len(async_get_time_scheduler(hass)) == 0
+
+    _send_time_changed(hass, start + timedelta(seconds=200))
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 4]
+
+
+async def test_time_scheduler_runs_without_tick(hass):
+    """Test jobs in the near future run without waiting for a timer tick."""
+    runs = []
+
+    async_call_later(hass, 0.01, runs.append)
+
+    await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+
+async def test_time_scheduler_job_raises(hass, caplog):
+    """Test a raising job does not stop other jobs or the scheduler."""
+    runs = []
+    start = dt_util.utcnow() + timedelta(hours=1)
+
+    @callback
+    def raise_error(now):
+        raise ValueError("boom")
+
+    async_track_point_in_utc_time(hass, raise_error, start)
+    async_track_point_in_utc_time(hass, runs.append, start)
+    async_track_point_in_utc_time(hass, runs.append, start + timedelta(seconds=1))
+
+    _send_time_changed(hass, start)
+    await hass.async_block_till_done()
+    assert runs == [start]
+    assert "Error running job scheduled for" in caplog.text
+    assert "boom" in caplog.text
+
+    _send_time_changed(hass, start + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [start, start + timedelta(seconds=1)]
+
+    async_call_later(hass, 0.01, raise_error)
+    async_call_later(hass, 0.02, runs.append)
+    await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+
+async def test_time_scheduler_runs_overdue(hass):
+    """Test jobs that are already overdue run without waiting for a tick."""
+    runs = []
+    now = dt_util.utcnow()
+    async_get_time_scheduler(hass)
+
+    _send_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    async_track_point_in_utc_time(hass, runs.append, now - timedelta(seconds=5))
+
+    await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+
+async def test_track_state_change_dispatch_by_entity(hass):
+    """Test state change trackers only run for their entities."""
+    runs = []
+
+    @callback
+    def listener(entity_id, old_state, new_state):
+        runs.append(entity_id)
+
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    unsubs = [
+        async_track_state_change(hass, "light.Bowl", listener),
+        async_track_state_change(hass, ["light.bowl", "switch.kitchen"], listener),
+        async_track_state_change(hass, "light.ceiling", listener),
+    ]
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+    assert len(async_get_state_change_dispatcher(hass)) == 3
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    await hass.async_block_till_done()
+    assert runs == ["light.bowl", "light.bowl", "switch.kitchen"]
+
+    unsubs[1]()
+    unsubs[1]()
+    assert len(async_get_state_change_dispatcher(hass)) == 2
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("switch.kitchen", "off")
+    await hass.async_block_till_done()
+    assert runs == ["light.bowl", "light.bowl", "switch.kitchen", "light.bowl"]
+
+    unsubs[0]()
+    unsubs[2]()
+    assert len(async_get_state_change_dispatcher(hass)) == 0
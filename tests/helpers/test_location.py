@@ -1,7 +1,14 @@
 """Tests Home Assistant location helpers."""
+import random
+
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import State
+from homeassistant.core import State, callback
 from homeassistant.helpers import location
+from homeassistant.helpers.event import (
+    async_get_state_change_dispatcher,
+    async_track_template_result,
+)
+from homeassistant.helpers.template import Template
 
 
 def test_has_location_with_invalid_states():
@@ -43,3 +50,108 @@ def test_closest_returns_closest():
     state2 = State("light.test", "on", {ATTR_LATITUDE: 125.45, ATTR_LONGITUDE: 125.45})
 
     assert state == location.closest(123.45, 123.45, [state, state2])
+
+
+async def test_location_index_closest(hass):
+    """Test the location index finds the same state as comparing all."""
+    rnd = random.Random(42)
+
+    for idx in range(300):
+        hass.states.async_set(
+            f"device_tracker.test_{idx:03}",
+            "home",
+            {
+                ATTR_LATITUDE: rnd.uniform(-89, 89),
+                ATTR_LONGITUDE: rnd.uniform(-180, 180),
+            },
+        )
+    hass.states.async_set("light.test", "on")
+
+    index = location.async_get_location_index(hass)
+    states = hass.states.async_all()
+
+    for latitude, longitude in [(0.0, 179.99), (89.9, 10.0), (-52.3, 4.8)] + [
+        (rnd.uniform(-90, 90), rnd.uniform(-180, 180)) for _ in range(50)
+    ]:
+        assert index.async_closest(None, latitude, longitude) == location.closest(
+            latitude, longitude, states
+        )
+
+    assert index.async_closest("light", 0.0, 0.0) is None
+
+
+async def test_location_index_candidates(hass):
+    """Test the location index follows state changes."""
+    hass.states.async_set(
+        "zone.big", "zoning", {ATTR_LATITUDE: 52.0, ATTR_LONGITUDE: 4.0, "radius": 5000}
+    )
+    hass.states.async_set(
+        "zone.small", "zoning", {ATTR_LATITUDE: 52.0, ATTR_LONGITUDE: 5.0, "radius": 10}
+    )
+    for idx in range(10):
+        hass.states.async_set(
+            f"zone.far_{idx}",
+            "zoning",
+            {ATTR_LATITUDE: -30.0, ATTR_LONGITUDE: float(idx), "radius": 100},
+        )
+    index = location.async_get_location_index(hass)
+
+    def candidates(latitude, longitude, radius=0):
+        return [
+            state.entity_id
+            for state in index.async_candidates("zone", latitude, longitude, radius)
+        ]
+
+    assert candidates(52.04, 4.0) == ["zone.big"]
+    assert candidates(52.0, 4.8) == []
+    assert candidates(52.0, 4.8, 60000) == ["zone.big", "zone.small"]
+
+    hass.states.async_set(
+        "zone.small", "zoning", {ATTR_LATITUDE: 52.04, ATTR_LONGITUDE: 4.0}
+    )
+    assert candidates(52.04, 4.0) == ["zone.big", "zone.small"]
+
+    hass.states.async_remove("zone.big")
+    assert candidates(52.04, 4.0) == ["zone.small"]
+    assert not index.async_has_domain("light")
+
+
+async def test_location_index_tracked_template(hass):
+    """Test a tracked closest template sees the index of the changed state."""
+    # State changed listeners registered before the index is created
+    async_get_state_change_dispatcher(hass)
+
+    for idx in range(20):
+        hass.states.async_set(
+            f"device_tracker.t{idx:02}",
+            "not_home",
+            {
+                ATTR_LATITUDE: hass.config.latitude + 0.1 + idx * 0.1,
+                ATTR_LONGITUDE: hass.config.longitude,
+            },
+        )
+    hass.states.async_set(
+        "device_tracker.mover",
+        "not_home",
+        {ATTR_LATITUDE: -hass.config.latitude, ATTR_LONGITUDE: 0.0},
+    )
+    await hass.async_block_till_done()
+    template = Template("{{ closest(states.device_tracker).entity_id }}", hass)
+    results = []
+
+    @callback
+    def result_callback(event, last_result, result):
+        results.append(result)
+
+    async_track_template_result(hass, template, result_callback)
+    assert template.async_render_cached() == "device_tracker.t00"
+
+    hass.states.async_set(
+        "device_tracker.mover",
+        "home",
+        {ATTR_LATITUDE: hass.config.latitude, ATTR_LONGITUDE: hass.config.longitude},
+    )
+    await hass.async_block_till_done()
+
+    assert results == ["device_tracker.mover"]
+    assert template.async_render_cached() == "device_tracker.mover"
@@ -12,6 +12,7 @@ from homeassistant.helpers.restore_state import (
     RestoreEntity,
     StoredState,
     DATA_RESTORE_STATE_TASK,
+    STATE_COMPACT_INTERVAL,
     STORAGE_KEY,
 )
 from homeassistant.util import dt as dt_util
@@ -30,7 +31,9 @@ async def test_caching_data(hass):
     ]
 
     data = await RestoreStateData.async_get_instance(hass)
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {state.state.entity_id: state.as_dict() for state in stored_states}
+    )
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -41,7 +44,7 @@ async def test_caching_data(hass):
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
 
@@ -64,7 +67,9 @@ async def test_hass_starting(hass):
     ]
 
     data = await RestoreStateData.async_get_instance(hass)
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {state.state.entity_id: state.as_dict() for state in stored_states}
+    )
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -76,7 +81,7 @@ async def test_hass_starting(hass):
     # Mock that only b1 is present this run
     states = [State("input_boolean.b1", "on")]
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         state = await entity.async_get_last_state()
 
@@ -89,7 +94,7 @@ async def test_hass_starting(hass):
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -128,9 +133,10 @@ async def test_dump_data(hass):
             datetime(1985, 10, 26, 1, 22, tzinfo=dt_util.UTC),
         ),
     }
+    data.last_compacted = None
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
@@ -144,16 +150,15 @@ async def test_dump_data(hass):
     # b3 should be written, since it is still not expired
     # b4 should not be written, since it is now expired
     assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b1"
-    assert written_states[0]["state"]["state"] == "on"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[1]["state"]["state"] == "off"
+    assert written_states["input_boolean.b1"]["state"]["state"] == "on"
+    assert written_states["input_boolean.b3"]["state"]["state"] == "off"
 
     # Test that removed entities are not persisted
     await entity.async_remove()
+    data.last_compacted = None
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
@@ -161,8 +166,57 @@ async def test_dump_data(hass):
     args = mock_write_data.mock_calls[0][1]
     written_states = args[0]
     assert len(written_states) == 1
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
+    assert written_states["input_boolean.b3"]["state"]["state"] == "off"
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test that only changed states are written between compactions."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert set(stored) == {"input_boolean.b0", "input_boolean.b1"}
+
+    hass.states.async_set("input_boolean.b1", "off")
+    hass.states.async_set("input_boolean.c0", "off")
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreStateStore._append_data"
+    ) as mock_append_data, patch(
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    assert not mock_write_data.called
+    changes = mock_append_data.mock_calls[0][1][1]
+    assert list(changes) == ["input_boolean.b1"]
+    assert changes["input_boolean.b1"]["state"]["state"] == "off"
+
+    # Nothing changed since the last dump
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreStateStore._append_data"
+    ) as mock_append_data:
+        await data.async_dump_states()
+
+    assert not mock_append_data.called
+
+    # States are all written again after the compaction interval
+    data.last_compacted -= STATE_COMPACT_INTERVAL
+    hass.states.async_set("input_boolean.b0", "off")
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert stored["input_boolean.b0"]["state"]["state"] == "off"
+    assert stored["input_boolean.b1"]["state"]["state"] == "off"
 
 
 async def test_dump_error(hass):
@@ -184,9 +238,10 @@ async def test_dump_error(hass):
     await entity.async_internal_added_to_hass()
 
     data = await RestoreStateData.async_get_instance(hass)
+    data.last_compacted = None
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save",
         return_value=mock_coro(exception=HomeAssistantError),
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
@@ -264,3 +319,27 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_restoring_stored_state_lazily(hass, hass_storage):
+    """Test that stored states are decoded when they are requested."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "on"), now).as_dict(),
+            StoredState(State("input_boolean.b1", "off"), now).as_dict(),
+        ],
+    }
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+
+    state = await entity.async_get_last_state()
+    assert state.state == "off"
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert list(data.last_states) == ["input_boolean.b1"]
+    assert list(data.stored_data) == ["input_boolean.b0"]
@@ -188,3 +188,57 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_log_store_compaction(hass, hass_storage):
+    """Test changes are appended until the log is compacted."""
+    store = storage.LogStore(hass, MOCK_VERSION, MOCK_KEY, max_log_entries=2)
+    data = {}
+    data_func = Mock(side_effect=lambda: dict(data))
+
+    async def change(changes):
+        """Change the data and append the changes to the store."""
+        for item, value in changes.items():
+            if value is None:
+                data.pop(item)
+            else:
+                data[item] = value
+        await store.async_append(changes, data_func)
+        assert hass_storage[MOCK_KEY]["data"] == data
+
+    # The first write after loading writes all data
+    await change({"a": 1})
+    assert data_func.call_count == 1
+
+    await change({"b": 2})
+    await change({"a": None})
+    assert data_func.call_count == 1
+
+    await change({"c": 3})
+    assert data_func.call_count == 2
+
+
+def test_log_store_file(loop, tmp_path):
+    """Test the log store file format."""
+    hass = Mock(data={})
+    store = storage.LogStore(hass, MOCK_VERSION, MOCK_KEY)
+    path = str(tmp_path / MOCK_KEY)
+
+    store._write_data(
+        path, {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"a": 1, "b": 2}}
+    )
+    store._append_data(path, {"b": None, "c": 3})
+    store._append_data(path, {"c": 4})
+
+    # Simulate an interrupted write
+    with open(path, "a") as fil:
+        fil.write('\n["d",')
+
+    assert store._load_data(path) == {
+        "version": MOCK_VERSION,
+        "key": MOCK_KEY,
+        "data": {"a": 1, "c": 4},
+    }
+    assert store.write_stats.writes == 3
+    assert store.write_stats.last_bytes == len('\n["c",4]')
+    assert storage.async_get_write_stats(hass)[MOCK_KEY] is store.write_stats
@@ -39,7 +39,7 @@ def extract_entities(hass, template_str, variables=None):
     """Extract entities from a template."""
     info = render_to_info(hass, template_str, variables)
     # pylint: disable=protected-access
-    assert not hasattr(info, "_domains")
+    assert info.domains == frozenset()
     return info._entities
 
 
@@ -59,7 +59,7 @@ def assert_result_info(info, result, entities=None, domains=None, all_states=Fal
         assert info._domains == frozenset(domains)
         assert all([info.filter_lifecycle(domain + ".entity") for domain in domains])
     else:
-        assert not hasattr(info, "_domains")
+        assert info.domains == frozenset()
 
 
 def test_template_equality():
@@ -1789,3 +1789,66 @@ def test_length_of_states(hass):
 
     tpl = template.Template("{{ states.sensor | length }}", hass)
     assert tpl.async_render() == "2"
+
+
+def test_render_cached(hass):
+    """Test results are reused while the states read are unchanged."""
+    stats = template.async_get_render_cache_stats(hass)
+    hass.states.async_set("sensor.test", "23")
+    hass.states.async_set("sensor.other", "on")
+
+    tpl = template.Template("{{ states('sensor.test') }} {{ value }}", hass)
+
+    assert tpl.async_render_cached({"value": 1}) == "23 1"
+    assert tpl.async_render_cached({"value": 1}) == "23 1"
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    hass.states.async_set("sensor.other", "off")
+    assert tpl.async_render_cached({"value": 1}) == "23 1"
+    assert (stats.hits, stats.misses) == (2, 1)
+
+    assert tpl.async_render_cached({"value": 2}) == "23 2"
+    hass.states.async_set("sensor.test", "24")
+    assert tpl.async_render_cached({"value": 2}) == "24 2"
+    assert (stats.hits, stats.misses) == (2, 3)
+
+
+def test_render_cached_lookups_and_domains(hass):
+    """Test the cache notices entities that are added or removed."""
+    hass.states.async_set("sensor.test", "23")
+
+    tpl = template.Template("{{ states.sensor.test is not none }}", hass)
+    assert tpl.async_render_cached() == "True"
+    hass.states.async_set("sensor.test", "24")
+    assert tpl.async_render_cached() == "True"
+    hass.states.async_remove("sensor.test")
+    assert tpl.async_render_cached() == "False"
+
+    tpl = template.Template("{{ states.light | count }}", hass)
+    assert tpl.async_render_cached() == "0"
+    hass.states.async_set("light.test", "on")
+    assert tpl.async_render_cached() == "1"
+
+
+def test_render_cached_volatile(hass):
+    """Test templates using time or all states are not cached."""
+    stats = template.async_get_render_cache_stats(hass)
+
+    for template_str in ("{{ now().year }}", "{{ states | count }}"):
+        tpl = template.Template(template_str, hass)
+        tpl.async_render_cached()
+        tpl.async_render_cached()
+
+    assert (stats.hits, stats.misses) == (0, 4)
+
+
+def test_render_cached_error(hass):
+    """Test render errors are cached as well."""
+    hass.states.async_set("sensor.test", "on")
+    tpl = template.Template("{{ states.sensor.test.attributes.missing.value }}", hass)
+
+    for _ in range(2):
+        with pytest.raises(TemplateError):
+            tpl.async_render_cached()
+
+    assert template.async_get_render_cache_stats(hass).hits == 1
@@ -53,6 +53,18 @@ def test_config_platform_valid(isfile_patch, loop):
         assert len(res["yaml_files"]) == 1
 
 
+@patch("os.path.isfile", return_value=True)
+def test_config_not_cached(isfile_patch, loop):
+    """Test checking the config does not write the YAML cache."""
+    files = {YAML_CONFIG_FILE: BASE_CONFIG + "light:\n  platform: demo"}
+    with patch_yaml_files(files), patch(
+        "homeassistant.util.yaml.loader._load_cached"
+    ) as mock_load_cached:
+        res = check_config.check(get_test_config_dir())
+        assert res["except"] == {}
+    assert not mock_load_cached.called
+
+
 @patch("os.path.isfile", return_value=True)
 def test_component_platform_not_found(isfile_patch, loop):
     """Test errors if component or platform not found."""
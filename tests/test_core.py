@@ -16,6 +16,7 @@ import pytest
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError, InvalidStateError
 import homeassistant.util.dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.const import (
     __version__,
@@ -585,6 +586,31 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         assert ["light.bowl", "switch.ac"] == states
 
+    def test_states_for_domain(self):
+        """Test listing the states of a domain in sorted order."""
+        self.states.set("light.Kitchen", "off")
+        self.states.set("light.a_lamp", "on")
+        self.states.set("light_extra.lamp", "on")
+        self.states.set("light.bowl", "off")
+
+        states = self.hass.states.async_states_for_domain("light")
+        assert ["light.a_lamp", "light.bowl", "light.kitchen"] == [
+            state.entity_id for state in states
+        ]
+        assert "off" == states[1].state
+        assert [] == self.hass.states.async_states_for_domain("sensor")
+
+        assert self.states.remove("light.bowl")
+        self.states.remove("switch.AC")
+        states = self.hass.states.async_all_sorted()
+        assert [state.entity_id for state in states] == [
+            "light.a_lamp",
+            "light.kitchen",
+            "light_extra.lamp",
+        ]
+        assert [] == self.states.entity_ids("switch")
+        assert [] == self.hass.states.async_states_for_domain("switch")
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -611,6 +637,31 @@ class TestStateMachine(unittest.TestCase):
         self.hass.block_till_done()
         assert 1 == len(events)
 
+    def test_observer(self):
+        """Test observers are called before the state changed event."""
+        calls = []
+
+        @ha.callback
+        def observer(entity_id, new_state):
+            calls.append((entity_id, new_state, self.states.get(entity_id)))
+
+        remove = run_callback_threadsafe(
+            self.hass.loop, self.states.async_add_observer, observer
+        ).result()
+
+        self.states.set("light.Bowl", "off")
+        self.states.set("light.bowl", "off")
+        self.states.remove("switch.ac")
+        assert [(call[0], call[1]) for call in calls] == [
+            ("light.bowl", self.states.get("light.bowl")),
+            ("switch.ac", None),
+        ]
+        assert calls[0][2] is calls[0][1]
+
+        run_callback_threadsafe(self.hass.loop, remove).result()
+        self.states.set("light.bowl", "on")
+        assert len(calls) == 2
+
     def test_case_insensitivty(self):
         """Test insensitivty."""
         runs = []
@@ -1,12 +1,23 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import sys
+import threading
+from types import ModuleType
+
 from asynctest.mock import ANY, patch
 import pytest
 
 import homeassistant.loader as loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass):
@@ -189,6 +200,128 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_stored_index(hass, hass_storage):
+    """Test that unchanged manifests are read from the stored index."""
+    # pylint: disable=protected-access
+    await loader._async_get_custom_components(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    index = hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"]
+    path = next(path for path in index if path.endswith("/test/manifest.json"))
+    assert index[path]["manifest"]["domain"] == "test"
+
+    index[path]["manifest"] = dict(index[path]["manifest"], name="Cached")
+    integrations = await loader._async_get_custom_components(hass)
+    assert integrations["test"].name == "Cached"
+
+    index[path]["mtime"] -= 1
+    integrations = await loader._async_get_custom_components(hass)
+    assert integrations["test"].name != "Cached"
+
+
+async def test_get_integration_from_index(hass):
+    """Test that built-in integrations are resolved from the manifest index."""
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path == loader.pathlib.Path(hue.__file__).parent
+    assert integration.config_flow is True
+    assert integration.requirements == ["aiohue==1.9.2"]
+
+
+def test_lazy_import(tmp_path):
+    """Test a lazy module is only executed once it is accessed."""
+    (tmp_path / "lazy_test_module.py").write_text("VALUE = 1\n")
+
+    with patch.object(sys, "path", [str(tmp_path), *sys.path]), patch.dict(sys.modules):
+        module = loader.lazy_import("lazy_test_module")
+        assert type(module) is not ModuleType
+        assert sys.modules["lazy_test_module"] is module
+
+        import lazy_test_module  # noqa pylint: disable=import-error
+
+        assert lazy_test_module is module
+        assert type(module) is not ModuleType
+
+        assert module.VALUE == 1
+        assert type(module) is ModuleType
+
+    with pytest.raises(ImportError):
+        loader.lazy_import("non_existing_lazy_module")
+
+
+def test_lazy_import_threads(tmp_path):
+    """Test threads accessing a lazy module wait until it is executed."""
+    (tmp_path / "lazy_test_module.py").write_text(
+        "import time\ntime.sleep(0.2)\nVALUE = 1\n"
+    )
+    results = []
+
+    def access():
+        """Access the module."""
+        try:
+            results.append(module.VALUE)
+        except AttributeError as err:
+            results.append(err)
+
+    with patch.object(sys, "path", [str(tmp_path), *sys.path]), patch.dict(sys.modules):
+        module = loader.lazy_import("lazy_test_module")
+        threads = [threading.Thread(target=access) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == [1, 1, 1]
+
+
+def test_get_platform_lazy_imports(hass, tmp_path):
+    """Test importing a platform makes the lazy imports lazy."""
+    (tmp_path / "lazy_test_module.py").write_text("VALUE = 1\n")
+    integration = loader.Integration(
+        hass,
+        "homeassistant.components.hue",
+        None,
+        {
+            "name": "hue",
+            "domain": "hue",
+            "dependencies": [],
+            "requirements": [],
+            "lazy_imports": ["lazy_test_module"],
+        },
+    )
+
+    with patch.object(sys, "path", [str(tmp_path), *sys.path]), patch.dict(sys.modules):
+        assert integration.get_platform("light") is hue_light
+        assert type(sys.modules["lazy_test_module"]) is not ModuleType
+
+
+def test_get_component_lazy_imports(hass, tmp_path):
+    """Test an integration makes its lazy imports lazy and records timings."""
+    (tmp_path / "lazy_test_module.py").write_text("VALUE = 1\n")
+    integration = loader.Integration(
+        hass,
+        "homeassistant.components.http",
+        None,
+        {
+            "name": "http",
+            "domain": "http",
+            "dependencies": [],
+            "requirements": [],
+            "lazy_imports": ["lazy_test_module", "non_existing_lazy_module"],
+        },
+    )
+
+    with patch.object(sys, "path", [str(tmp_path), *sys.path]), patch.dict(sys.modules):
+        assert integration.get_component() is http
+        assert type(sys.modules["lazy_test_module"]) is not ModuleType
+
+    assert "homeassistant.components.http" in hass.data[loader.DATA_IMPORT_TIMINGS]
+    assert loader.slowest_imports(hass)[0][0] == "homeassistant.components.http"
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
@@ -27,6 +27,7 @@ from tests.common import (
     get_test_config_dir,
     mock_integration,
     mock_entity_platform,
+    mock_coro,
 )
 
 ORIG_TIMEZONE = dt_util.DEFAULT_TIME_ZONE
@@ -535,3 +536,47 @@ async def test_setup_import_blows_up(hass):
         "homeassistant.loader.Integration.get_component", side_effect=ValueError
     ):
         assert not await setup.async_setup_component(hass, "sun", {})
+
+
+async def test_setup_timings(hass, hass_storage):
+    """Test setup timings are recorded and stored."""
+    mock_integration(hass, MockModule("dep_comp"))
+    mock_integration(
+        hass,
+        MockModule(
+            "slow_comp", dependencies=["dep_comp"], requirements=["slow-package==1.0"]
+        ),
+    )
+    mock_integration(hass, MockModule("other_comp"))
+
+    with mock.patch(
+        "homeassistant.requirements.async_process_requirements",
+        return_value=mock_coro(),
+    ):
+        hass.config.skip_pip = False
+        assert await setup.async_setup_component(hass, "slow_comp", {})
+    assert await setup.async_setup_component(hass, "other_comp", {})
+
+    timings = setup.async_get_setup_timings(hass)
+    report = timings.as_dict()
+
+    assert set(report["setups"]["slow_comp"]["phases"]) == {
+        "dependencies",
+        "requirements",
+        "import",
+        "config",
+        "setup",
+    }
+    assert report["setups"]["slow_comp"]["dependencies"] == ["dep_comp"]
+    assert report["slowest_imports"] == []
+
+    # other_comp finished last but did not wait for anything
+    assert report["critical_path"] == ["other_comp"]
+
+    timings.async_record("slow_comp", "setup", 0, 1e9)
+    assert timings.async_critical_path() == ["dep_comp", "slow_comp"]
+
+    await timings.async_save()
+    await timings.async_save()
+    runs = hass_storage[setup.SETUP_TIMINGS_STORAGE_KEY]["data"]["runs"]
+    assert len(runs) == 2
@@ -61,6 +61,16 @@ def test_save_and_load_private():
     assert stats.st_mode & 0o77 == 0
 
 
+def test_save_and_load_compact():
+    """Test saving compact JSON and loading back."""
+    fname = _path_for("test5")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname) as fil:
+        assert "\n" not in fil.read()
+    data = load_json(fname)
+    assert data == TEST_JSON_A
+
+
 def test_overwrite_and_reload():
     """Test that we can overwrite an existing file and read back."""
     fname = _path_for("test3")
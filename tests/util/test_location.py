@@ -1,4 +1,5 @@
 """Test Home Assistant location util methods."""
+import random
 from unittest.mock import patch, Mock
 
 import aiohttp
@@ -72,6 +73,52 @@ def test_get_miles():
     assert round(miles, 2) == DISTANCE_MILES
 
 
+def _random_points(count):
+    """Return random points, including coincident and antipodal ones."""
+    rnd = random.Random(1)
+    return [(rnd.uniform(-90, 90), rnd.uniform(-180, 180)) for _ in range(count)] + [
+        COORDINATES_PARIS,
+        (-COORDINATES_PARIS[0], COORDINATES_PARIS[1] - 180),
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_vincenty_many(use_numpy):
+    """Test computing many distances gives the same results as one by one."""
+    points = _random_points(500)
+
+    with patch.object(location_util, "np", location_util.np if use_numpy else None):
+        kilometers = location_util.vincenty_many(COORDINATES_PARIS, points)
+        miles = location_util.vincenty_many(COORDINATES_PARIS, points, miles=True)
+
+    assert kilometers == [
+        location_util.vincenty(COORDINATES_PARIS, point) for point in points
+    ]
+    assert miles == [
+        location_util.vincenty(COORDINATES_PARIS, point, miles=True) for point in points
+    ]
+    assert kilometers[-2] == 0
+    assert kilometers[-1] is None
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_distances(use_numpy):
+    """Test computing many distances in meters."""
+    points = _random_points(100)
+    latitudes = [point[0] for point in points]
+    longitudes = [point[1] for point in points]
+
+    with patch.object(location_util, "np", location_util.np if use_numpy else None):
+        meters = location_util.distances(*COORDINATES_NEW_YORK, latitudes, longitudes)
+
+    assert meters == [
+        location_util.distance(*COORDINATES_NEW_YORK, *point) for point in points
+    ]
+    assert location_util.distances(None, None, latitudes, longitudes) == [None] * len(
+        points
+    )
+
+
 async def test_detect_location_info_ipapi(aioclient_mock, session):
     """Test detect location info using ipapi.co."""
     aioclient_mock.get(location_util.IPAPI, text=load_fixture("ipapi.co.json"))
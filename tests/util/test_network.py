@@ -0,0 +1,25 @@
+"""Test Home Assistant network utility functions."""
+from ipaddress import ip_address, ip_network
+
+from homeassistant.util import network as network_util
+
+
+def test_network_set():
+    """Test looking up addresses in a set of networks."""
+    networks = network_util.NetworkSet(
+        ["192.168.1.0/24", ip_network("10.0.0.0/8"), ip_address("203.0.113.5"), "::1"]
+    )
+
+    assert len(networks) == 4
+    assert ip_address("192.168.1.20") in networks
+    assert ip_address("10.20.30.40") in networks
+    assert ip_address("203.0.113.5") in networks
+    assert ip_address("::1") in networks
+    assert ip_address("192.168.2.20") not in networks
+    assert ip_address("203.0.113.6") not in networks
+    assert ip_address("::2") not in networks
+    assert "192.168.1.20" not in networks
+
+    networks.add("192.168.2.0/24")
+    assert ip_address("192.168.2.20") in networks
+    assert len(networks) == 5
@@ -1,5 +1,6 @@
 """Test Home Assistant yaml loader."""
 import io
+import json
 import os
 import unittest
 import logging
@@ -273,6 +274,109 @@ def test_load_yaml_encoding_error(mock_open):
         yaml_loader.load_yaml("test")
 
 
+def test_load_yaml_cache(tmp_path):
+    """Test parsed files are cached and tags are resolved on every load."""
+    cache_dir = str(tmp_path / "cache")
+    config_path = tmp_path / "configuration.yaml"
+    include_path = tmp_path / "include.yaml"
+    secrets_path = tmp_path / "secrets.yaml"
+    config_path.write_text(
+        "key: value\n"
+        "included: !include include.yaml\n"
+        "password: !secret password\n"
+        "list:\n"
+        "  - one\n"
+        "  - !env_var CACHE_TEST_VAR default\n"
+    )
+    include_path.write_text("nested: one\n")
+    secrets_path.write_text("password: secret_one\n")
+
+    def load():
+        """Load the configuration through the cache."""
+        yaml_loader.clear_secret_cache()
+        return yaml.load_yaml(str(config_path), cache_dir)
+
+    first = load()
+    assert first == {
+        "key": "value",
+        "included": {"nested": "one"},
+        "password": "secret_one",
+        "list": ["one", "default"],
+    }
+    assert len(os.listdir(cache_dir)) == 2
+    for cache_file in (tmp_path / "cache").iterdir():
+        assert b"secret_one" not in cache_file.read_bytes()
+
+    with patch.object(
+        yaml_loader, "_compose", wraps=yaml_loader._compose
+    ) as mock_compose:
+        second = load()
+    # Only the secrets are parsed again
+    assert mock_compose.call_count == 1
+    assert second == first
+    assert second.__config_file__ == str(config_path)
+    assert second["list"].__line__ == first["list"].__line__ == 4
+    assert second["included"].__config_file__ == str(config_path)
+
+    include_path.write_text("nested: two\n")
+    secrets_path.write_text("password: secret_two\n")
+    with patch.dict(os.environ, {"CACHE_TEST_VAR": "env"}):
+        third = load()
+    assert third["included"] == {"nested": "two"}
+    assert third["password"] == "secret_two"
+    assert third["list"] == ["one", "env"]
+
+    config_path.write_text("key: changed\n")
+    assert load() == {"key": "changed"}
+
+
+def test_load_yaml_invalid_cache(tmp_path):
+    """Test an invalid cache file is replaced."""
+    cache_dir = tmp_path / "cache"
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text("key: value\n")
+
+    yaml.load_yaml(str(config_path), str(cache_dir))
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(b"invalid")
+
+    assert yaml.load_yaml(str(config_path), str(cache_dir)) == {"key": "value"}
+    assert cache_file.read_bytes() != b"invalid"
+
+
+def test_load_yaml_cache_types(tmp_path):
+    """Test all YAML types survive the JSON cache."""
+    cache_dir = tmp_path / "cache"
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text(
+        "anchor: &anchor\n"
+        "  - 1\n"
+        "  - 1.5\n"
+        "alias: *anchor\n"
+        "flags: [true, null, .inf]\n"
+        "when: 2019-11-01 12:00:00+01:00\n"
+        "day: 2019-11-01\n"
+        "data: !!binary aGVsbG8=\n"
+        "members: !!set {a, b}\n"
+        "pairs: !!omap [{a: 1}, {b: 2}]\n"
+        "3: int key\n"
+        "2019-11-02: date key\n"
+    )
+
+    first = yaml.load_yaml(str(config_path), str(cache_dir))
+    (cache_file,) = cache_dir.iterdir()
+    assert json.loads(cache_file.read_text())
+
+    with patch.object(yaml_loader, "_compose") as mock_compose:
+        second = yaml.load_yaml(str(config_path), str(cache_dir))
+    assert not mock_compose.called
+    assert second == first
+    assert list(second) == list(first)
+    assert second["members"] == {"a", "b"}
+    assert second["pairs"] == [("a", 1), ("b", 2)]
+    assert second["alias"].__line__ == first["alias"].__line__
+
+
 def test_dump():
     """The that the dump method returns empty None values."""
     assert yaml.dump({"a": None, "b": "b"}) == "a:\nb: b\n"